@@ -25,6 +25,8 @@ Matrices and Arrays
    :toctree: generated/
 
    AcousticsArray
+   AcousticBlockTMatrix
+   AcousticBlockTMatrixC
    AcousticSMatrix
    AcousticSMatrices
    AcousticTMatrix
@@ -37,6 +39,11 @@ Other
    :toctree: generated/
 
    AcousticMaterial
+   ClusterFMM
+   OperatorCache
+   operator_cache
+   fast_annotations
+   FieldProbe
 
 Functions
 =========
@@ -50,6 +57,8 @@ Operators
    pfield
    vfield
    pamplitudeff
+   field_map
+   field_tiles
    expand
    expandlattice
    permute
@@ -124,6 +133,10 @@ from treams._lattice import *   # noqa: F401
 
 from acoustotreams._materialacoustics import AcousticMaterial  # noqa: F401
 
+from acoustotreams._fmm import ClusterFMM  # noqa: F401
+
+from acoustotreams._operatorcache import OperatorCache, operator_cache  # noqa: F401
+
 from acoustotreams._smatrixacoustics import (  # noqa: F401
     AcousticSMatrices,
     AcousticSMatrix,
@@ -138,9 +151,12 @@ from acoustotreams._coreacoustics import (  # noqa: F401
     ScalarPlaneWaveBasisByComp,
     ScalarPlaneWaveBasisByUnitVector,
     ScalarSphericalWaveBasis,
+    fast_annotations,
 )
 
 from acoustotreams._tmatrixacoustics import (  # noqa: F401
+    AcousticBlockTMatrix,
+    AcousticBlockTMatrixC,
     AcousticTMatrix,
     AcousticTMatrixC,
     cylindrical_wave_scalar,
@@ -154,6 +170,7 @@ import acoustotreams.coeffs  # noqa: F401
 import acoustotreams.spw  # noqa: F401
 
 from acoustotreams._operatorsacoustics import (  # noqa: F401
+    FieldProbe,
     PField,
     VField,
     PAmplitudeFF,
@@ -165,6 +182,8 @@ from acoustotreams._operatorsacoustics import (  # noqa: F401
     vfield,
     pfield,
     pamplitudeff,
+    field_map,
+    field_tiles,
     expand,
     expandlattice,
     permute,
@@ -1,6 +1,9 @@
 """Scalar basis sets and core array functionalities."""
 
 import abc
+import contextlib
+import hashlib
+import threading
 from collections import namedtuple
 
 import numpy as np
@@ -12,6 +15,43 @@ from treams import util
 from treams._lattice import Lattice, WaveVector
 from acoustotreams._materialacoustics import AcousticMaterial
 
+def _unique_modes(modes):
+    """Remove duplicate modes while keeping the order of their first occurrence."""
+    if isinstance(modes, np.ndarray):
+        modes = modes.tolist()
+    return list(dict.fromkeys(map(tuple, modes)))
+
+
+def _positions_array(positions):
+    """Convert positions to an immutable (N, 3)-array."""
+    if positions is None:
+        positions = np.zeros((1, 3))
+    positions = np.array(positions, float)
+    if positions.ndim == 1:
+        positions = positions[None, :]
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError(f"invalid shape of positions {positions.shape}")
+    positions.flags.writeable = False
+    return positions
+
+
+def _is_unique_index(idx, size):
+    """Test if indexing with `idx` selects every element of `size` at most once.
+
+    Negative indices are counted as their positive counterparts.
+    """
+    if isinstance(idx, slice) or idx is Ellipsis:
+        return True
+    idx = np.asarray(idx)
+    if idx.dtype == bool:
+        return True
+    return (
+        idx.ndim == 1
+        and np.issubdtype(idx.dtype, np.integer)
+        and len(np.unique(idx % max(size, 1))) == len(idx)
+    )
+
+
 class ScalarBasisSet(util.OrderedSet, metaclass=abc.ABCMeta):
     """Parent class of scalar basis sets.
 
@@ -23,6 +63,9 @@ class ScalarBasisSet(util.OrderedSet, metaclass=abc.ABCMeta):
     _names = ()
     """Names of the relevant parameters"""
 
+    _content = ()
+    """Names of the attributes that define the basis set, see :attr:`digest`"""
+
     def __repr__(self):
         """String representation.
 
@@ -43,6 +86,106 @@ class ScalarBasisSet(util.OrderedSet, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def _modeindex(self):
+        """Dictionary that maps each mode to its index.
+
+        The dictionary is created on the first call and then stored, since basis sets
+        are immutable.
+        """
+        res = self.__dict__.get("_modeindex_cache")
+        if res is None:
+            modes = zip(*(i.tolist() for i in self[()]))
+            res = self.__dict__["_modeindex_cache"] = {
+                mode: i for i, mode in enumerate(modes)
+            }
+        return res
+
+    @property
+    def digest(self):
+        """Digest of the content of the basis set.
+
+        The digest is computed from the modes and, if defined, the positions on the first
+        access and then stored, since basis sets are immutable. Two basis sets of the same
+        type are equal, if and only if their digests are equal. The lattice and the wave
+        vector are not part of the digest, like in the comparison of basis sets.
+
+        Returns:
+            bytes
+        """
+        res = self.__dict__.get("_digest_cache")
+        if res is None:
+            hasher = hashlib.blake2b(type(self).__name__.encode(), digest_size=20)
+            for name in self._content:
+                val = getattr(self, name)
+                if val is None:
+                    hasher.update(f"{name}=None".encode())
+                    continue
+                # Adding zero replaces negative zeros, that compare equal to zeros
+                arr = np.ascontiguousarray(np.asarray(val, complex) + 0)
+                hasher.update(f"{name}{arr.shape}".encode())
+                hasher.update(arr.tobytes())
+            res = self.__dict__["_digest_cache"] = hasher.digest()
+        return res
+
+    def __hash__(self):
+        """Hash of the content, see :attr:`digest`."""
+        return hash(self.digest)
+
+    def __contains__(self, value):
+        """Test if a mode is contained in the basis set."""
+        try:
+            return tuple(value) in self._modeindex()
+        except TypeError:
+            return False
+
+    def index(self, value, start=0, stop=None):
+        """Index of a mode.
+
+        Args:
+            value (tuple): Mode.
+            start (int, optional): Start of the search range.
+            stop (int, optional): End of the search range.
+
+        Returns:
+            int
+        """
+        try:
+            res = self._modeindex()[tuple(value)]
+        except (KeyError, TypeError):
+            raise ValueError(f"mode {value} is not in basis") from None
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if not start <= res < stop:
+            raise ValueError(f"mode {value} is not in basis")
+        return res
+
+    def indices(self, modes):
+        """Indices of multiple modes.
+
+        The modes can be given as another basis set of the same type, for example, to
+        select or reorder the entries of an array in this basis.
+
+        Args:
+            modes (Iterable): Modes, e.g., a basis set.
+
+        Returns:
+            array of int
+        """
+        if isinstance(modes, ScalarBasisSet):
+            modes = zip(*(i.tolist() for i in modes[()]))
+        dct = self._modeindex()
+        res = []
+        missing = []
+        for mode in modes:
+            i = dct.get(tuple(mode))
+            if i is None:
+                missing.append(tuple(mode))
+            res.append(i)
+        if missing:
+            raise ValueError(
+                f"{len(missing)} mode(s) not in basis, e.g., {missing[0]}"
+            )
+        return np.array(res, int)
+
 
 class ScalarSphericalWaveBasis(ScalarBasisSet):
 
@@ -73,16 +216,11 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
     """
 
     _names = ("pidx", "l", "m")
+    _content = ("pidx", "l", "m", "positions")
 
     def __init__(self, modes, positions=None):
         """Initalization."""
-        tmp = []
-        if isinstance(modes, np.ndarray):
-            modes = modes.tolist()
-        for m in modes:
-            if m not in tmp:
-                tmp.append(m)
-        modes = tmp
+        modes = _unique_modes(modes)
         if len(modes) == 0:
             pidx = []
             l = []  # noqa: E741
@@ -95,13 +233,7 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
         else:
             raise ValueError("invalid shape of modes")
 
-        if positions is None:
-            positions = np.zeros((1, 3))
-        positions = np.array(positions, float)
-        if positions.ndim == 1:
-            positions = positions[None, :]
-        if positions.ndim != 2 or positions.shape[1] != 3:
-            raise ValueError(f"invalid shape of positions {positions.shape}")
+        positions = _positions_array(positions)
 
         self.pidx, self.l, self.m = [
             np.array(i, int) for i in (pidx, l, m)
@@ -118,9 +250,27 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
             raise ValueError("undefined position is indexed")
 
         self._positions = positions
-        self._positions.flags.writeable = False
         self.lattice = self.kpar = None 
 
+    @classmethod
+    def _from_arrays(cls, pidx, l, m, positions=None):  # noqa: E741
+        """Create a basis from arrays of unique and valid modes.
+
+        This constructor skips the removal of duplicate modes and most checks of the
+        parameters. It is intended for internal use, where the modes are known to be
+        unique, e.g., for default bases and subsets of existing bases.
+        """
+        obj = cls.__new__(cls)
+        obj.pidx, obj.l, obj.m = [np.array(i, int) for i in (pidx, l, m)]
+        for i in (obj.pidx, obj.l, obj.m):
+            i.flags.writeable = False
+        positions = _positions_array(positions)
+        if np.any(obj.pidx >= len(positions)):
+            raise ValueError("undefined position is indexed")
+        obj._positions = positions
+        obj.lattice = obj.kpar = None
+        return obj
+
     def __len__(self):
         """Number of modes."""
         return len(self.l)     
@@ -174,6 +324,8 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
             isinstance(idx, tuple) and len(idx) == 0
         ):
             return res
+        if _is_unique_index(idx, len(self)):
+            return self._from_arrays(*res, self.positions)
         return type(self)(zip(*res), self.positions)
 
     def __eq__(self, other):
@@ -182,6 +334,8 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
         Two basis sets are considered equal if they contain the same modes 
         in the same order and share identical expansion centers :attr:`positions`.
         """
+        if type(other) is type(self):
+            return self is other or self.digest == other.digest
         try:
             return self is other or (
                 np.array_equal(self.pidx, other.pidx)
@@ -192,6 +346,8 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
         except AttributeError:
             return False
 
+    __hash__ = ScalarBasisSet.__hash__
+
     @classmethod
     def default(cls, lmax, nmax=1, positions=None):
         """Default basis for a given maximum multipolar degree.
@@ -222,13 +378,16 @@ class ScalarSphericalWaveBasis(ScalarBasisSet):
             nmax (int, optional): Number of positions. Defaults to 1.
             positions (array_like of float, optional): Positions of the expansion centers (m). Defaults to [[0, 0, 0]].
         """
-        modes = [
-            [n, l, m]
-            for n in range(0, nmax)
-            for l in range(0, lmax + 1)  # noqa: E741
-            for m in range(-l, l + 1)
-        ]
-        return cls(modes, positions=positions)
+        l = np.arange(lmax + 1)  # noqa: E741
+        m = np.concatenate([np.arange(-i, i + 1) for i in l]) if lmax >= 0 else []
+        l = np.repeat(l, 2 * l + 1)  # noqa: E741
+        dim = len(l)
+        return cls._from_arrays(
+            np.repeat(np.arange(nmax), dim),
+            np.tile(l, nmax),
+            np.tile(m, nmax),
+            positions,
+        )
 
     @staticmethod
     def defaultlmax(dim, nmax=1):
@@ -309,16 +468,11 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
     """
 
     _names = ("pidx", "kz", "m")
+    _content = ("pidx", "kz", "m", "positions")
 
     def __init__(self, modes, positions=None):
         """Initalization."""
-        tmp = []
-        if isinstance(modes, np.ndarray):
-            modes = modes.tolist()
-        for m in modes:
-            if m not in tmp:
-                tmp.append(m)
-        modes = tmp
+        modes = _unique_modes(modes)
         if len(modes) == 0:
             pidx = []
             kz = []
@@ -331,13 +485,7 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
         else:
             raise ValueError("invalid shape of modes")
 
-        if positions is None:
-            positions = np.zeros((1, 3))
-        positions = np.array(positions, float)
-        if positions.ndim == 1:
-            positions = positions[None, :]
-        if positions.ndim != 2 or positions.shape[1] != 3:
-            raise ValueError(f"invalid shape of positions {positions.shape}")
+        positions = _positions_array(positions)
 
         self.pidx, self.m = [np.array(i, int) for i in (pidx, m)]
         self.kz = np.array(kz, float)
@@ -350,11 +498,32 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
             raise ValueError("undefined position is indexed")
 
         self._positions = positions
-        self._positions.flags.writeable = False
 
         self.lattice = self.kpar = None
         if len(self.kz) > 0 and np.all(self.kz == self.kz[0]):
             self.kpar = WaveVector(self.kz[0])
+
+    @classmethod
+    def _from_arrays(cls, pidx, kz, m, positions=None):
+        """Create a basis from arrays of unique and valid modes.
+
+        This constructor skips the removal of duplicate modes and most checks of the
+        parameters. It is intended for internal use, where the modes are known to be
+        unique, e.g., for default bases and subsets of existing bases.
+        """
+        obj = cls.__new__(cls)
+        obj.pidx, obj.m = [np.array(i, int) for i in (pidx, m)]
+        obj.kz = np.array(kz, float)
+        for i in (obj.pidx, obj.kz, obj.m):
+            i.flags.writeable = False
+        positions = _positions_array(positions)
+        if np.any(obj.pidx >= len(positions)):
+            raise ValueError("undefined position is indexed")
+        obj._positions = positions
+        obj.lattice = obj.kpar = None
+        if len(obj.kz) > 0 and np.all(obj.kz == obj.kz[0]):
+            obj.kpar = WaveVector(obj.kz[0])
+        return obj
     
     def __len__(self):
         """Number of modes."""
@@ -406,6 +575,8 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
         res = self.pidx[idx], self.kz[idx], self.m[idx]
         if isinstance(idx, (int, np.integer)) or (isinstance(idx, tuple) and idx == ()):
             return res
+        if _is_unique_index(idx, len(self)):
+            return self._from_arrays(*res, self.positions)
         return type(self)(zip(*res), self.positions)
 
     def __eq__(self, other):
@@ -414,6 +585,8 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
         Two basis sets are considered equal if they contain the same modes in the same 
         order and share identical expansion centers :attr:`positions`.
         """
+        if type(other) is type(self):
+            return self is other or self.digest == other.digest
         try:
             return self is other or (
                 np.array_equal(self.pidx, other.pidx)
@@ -424,6 +597,8 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
         except AttributeError:
             return False
 
+    __hash__ = ScalarBasisSet.__hash__
+
     @classmethod
     def default(cls, kzs, mmax, nmax=1, positions=None):
         """Default basis for given Z-components of the wave vector and a given maximum order.
@@ -458,13 +633,21 @@ class ScalarCylindricalWaveBasis(ScalarBasisSet):
         kzs = np.atleast_1d(kzs)
         if kzs.ndim > 1:
             raise ValueError(f"kzs has dimension larger than one: '{kzs.ndim}'")
-        modes = [
-            [n, kz, m]
-            for n in range(nmax)
-            for kz in kzs
-            for m in range(-mmax, mmax + 1)
-        ]
-        return cls(modes, positions=positions)
+        if len(np.unique(kzs)) != len(kzs):
+            modes = [
+                [n, kz, m]
+                for n in range(nmax)
+                for kz in kzs
+                for m in range(-mmax, mmax + 1)
+            ]
+            return cls(modes, positions=positions)
+        ms = np.arange(-mmax, mmax + 1)
+        return cls._from_arrays(
+            np.repeat(np.arange(nmax), len(kzs) * len(ms)),
+            np.tile(np.repeat(kzs, len(ms)), nmax),
+            np.tile(ms, len(kzs) * nmax),
+            positions,
+        )
 
     @classmethod
     def diffr_orders(cls, kz, mmax, lattice, bmax, nmax=1, positions=None):
@@ -586,16 +769,11 @@ class ScalarPlaneWaveBasisByUnitVector(ScalarPlaneWaveBasis):
 
     _names = ("qx", "qy", "qz")
     """A scalar plane-wave basis is always global."""
+    _content = ("qx", "qy", "qz")
 
     def __init__(self, modes):
         """Initialization."""
-        tmp = []
-        if isinstance(modes, np.ndarray):
-            modes = modes.tolist()
-        for m in modes:
-            if m not in tmp:
-                tmp.append(m)
-        modes = tmp
+        modes = _unique_modes(modes)
         if len(modes) == 0:
             qx = []
             qy = []
@@ -682,6 +860,8 @@ class ScalarPlaneWaveBasisByUnitVector(ScalarPlaneWaveBasis):
 
         Two basis sets are considered equal if they contain the same modes in the same order.
         """
+        if type(other) is type(self):
+            return self is other or self.digest == other.digest
         try:
             return self is other or (
                 np.array_equal(self.qx, other.qx)
@@ -691,6 +871,8 @@ class ScalarPlaneWaveBasisByUnitVector(ScalarPlaneWaveBasis):
         except AttributeError:
             return False
 
+    __hash__ = ScalarBasisSet.__hash__
+
     def bycomp(self, k0, alignment="xy", material=AcousticMaterial()):
         """Creates an instance of :class:`ScalarPlaneWaveBasisByComp`.
 
@@ -765,15 +947,11 @@ class ScalarPlaneWaveBasisByComp(ScalarPlaneWaveBasis):
         alignment (str): Alignment of the partial basis.
     """
 
+    _content = ("kx", "ky", "kz")
+
     def __init__(self, modes, alignment="xy"):
         """Initialization."""
-        if isinstance(modes, np.ndarray):
-            modes = modes.tolist()
-        tmp = []
-        for m in modes:
-            if m not in tmp:
-                tmp.append(m)
-        modes = tmp
+        modes = _unique_modes(modes)
         if len(modes) == 0:
             kx = []
             ky = []
@@ -945,6 +1123,8 @@ class ScalarPlaneWaveBasisByComp(ScalarPlaneWaveBasis):
 
         Two basis sets are considered equal if they contain the same modes in the same order
         """
+        if type(other) is type(self):
+            return self is other or self.digest == other.digest
         try:
             skx, sky, skz = self.kx, self.ky, self.kz
             okx, oky, okz = other.kx, other.ky, other.kz
@@ -956,6 +1136,8 @@ class ScalarPlaneWaveBasisByComp(ScalarPlaneWaveBasis):
         except AttributeError:
             return False
 
+    __hash__ = ScalarBasisSet.__hash__
+
     def byunitvector(self, k0, material=AcousticMaterial(), modetype="up"):
         """Creates an instance of complete basis :class:`ScalarPlaneWaveBasis`.
 
@@ -1079,6 +1261,96 @@ class ScalarPhysicsDict(util.AnnotationDict):
         super().__setitem__(key, val)
 
 
+_NOBASIS = namedtuple("_basis", "lattice kpar")(None, None)
+
+_fast = threading.local()
+
+
+@contextlib.contextmanager
+def fast_annotations():
+    """Skip the annotation checks of intermediate results.
+
+    Within this context, matrix multiplications and element-wise operations of
+    :class:`AcousticsArray` objects propagate the annotations without comparing them and
+    without validating the result. Incompatible annotations are, thus, not warned about,
+    and annotations of the second operand overwrite those of the first one. The
+    annotations are checked again once the results are passed to functions or
+    constructors outside of this context, e.g. when creating an
+    :class:`~acoustotreams.AcousticSMatrices` from them. The results are always of type
+    :class:`AcousticsArray`, also for subclasses like T-matrices and S-matrices as
+    operands. Operations involving other annotated arrays use the regular annotation
+    handling.
+
+    The context is local to the current thread and can be nested.
+
+    Example:
+        >>> with acoustotreams.fast_annotations():
+        ...     for smat in smats:
+        ...         res = res.add(smat)
+    """
+    _fast.depth = getattr(_fast, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _fast.depth -= 1
+
+
+def _fast_array(arr, ann):
+    """Create an acoustics array from validated annotations without checking them."""
+    res = AcousticsArray.__new__(AcousticsArray)
+    res._array = arr
+    seq = util.AnnotationSequence.__new__(util.AnnotationSequence)
+    dcts = []
+    for dct in ann:
+        dcts.append(ScalarPhysicsDict.__new__(ScalarPhysicsDict))
+        dcts[-1]._dct = dct
+    seq._ann = tuple(dcts)
+    res._ann = seq
+    return res
+
+
+def _fast_ufunc(ufunc, method, inputs, kwargs):
+    """Evaluate a ufunc on acoustics arrays and merge the annotations unchecked.
+
+    Returns `NotImplemented`, if the call is not covered by the fast path.
+    """
+    if method != "__call__" or kwargs or ufunc.nout != 1:
+        return NotImplemented
+    anns = []
+    for i in inputs:
+        if hasattr(i, "ann"):
+            if not isinstance(i, AcousticsArray):
+                return NotImplemented
+            anns.append([dct._dct for dct in i._ann._ann])
+        else:
+            anns.append([{}] * np.ndim(i))
+    if ufunc.signature is not None and (
+        ufunc is not np.matmul or any(len(a) > 2 for a in anns)
+    ):
+        return NotImplemented
+    res = ufunc(*(getattr(i, "_array", i) for i in inputs))
+    if isinstance(res, np.generic) or np.ndim(res) == 0:
+        return res[()]
+    ann = [{} for _ in range(res.ndim)]
+    if ufunc is np.matmul:
+        a, b = anns
+        if len(a) == 2:
+            ann[0].update(a[0])
+        if len(b) == 2:
+            ann[-1].update(b[1])
+        # The special properties are "transparent", see AcousticsArray.__array_ufunc__
+        for name in ScalarPhysicsDict.properties:
+            if name in a[-1] and all(name not in i for i in b):
+                ann[-1].setdefault(name, a[-1][name])
+            if name in b[0] and all(name not in i for i in a):
+                ann[0].setdefault(name, b[0][name])
+    else:
+        for src in anns:
+            for dest, dct in zip(reversed(ann), reversed(src)):
+                dest.update(dct)
+    return _fast_array(res, ann)
+
+
 class AcousticsArray(util.AnnotatedArray):
     """Acoustics-aware array.
 
@@ -1170,14 +1442,19 @@ class AcousticsArray(util.AnnotatedArray):
             k0 = a.get("k0")
             material = a.get("material")
             modetype = a.get("modetype")
-            basis = a.get("basis", namedtuple("_basis", "lattice kpar")(None, None))
+            basis = a.get("basis", _NOBASIS)
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         """Implements ufunc API.
 
         In addition to keeping track of the annotations, the special properties of an
-        AcousticsArray are also "transparent" in matrix multiplications.
+        AcousticsArray are also "transparent" in matrix multiplications. Within
+        :func:`fast_annotations` the annotations are merged without any checks.
         """
+        if getattr(_fast, "depth", 0):
+            res = _fast_ufunc(ufunc, method, inputs, kwargs)
+            if res is not NotImplemented:
+                return res
         res = super().__array_ufunc__(ufunc, method, *inputs, **kwargs)
         if (
             ufunc is np.matmul
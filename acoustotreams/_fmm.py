@@ -0,0 +1,348 @@
+"""Fast multipole method for clusters of scatterers."""
+
+import itertools
+
+import numpy as np
+import scipy.sparse as sps
+import treams.special as sc
+
+from acoustotreams._coreacoustics import ScalarSphericalWaveBasis as SSWB
+from acoustotreams._materialacoustics import AcousticMaterial
+import acoustotreams.ssw as ssw
+
+_CHUNKSIZE = 2 ** 20
+"""Maximal number of translation coefficients that are evaluated at once."""
+
+_NEIGHBORS = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+_FAR = np.array(
+    [i for i in itertools.product(range(-3, 4), repeat=3) if max(map(abs, i)) > 1]
+)
+_OCTANTS = np.array(list(itertools.product((0, 1), repeat=3)))
+
+
+def _modes(lmax):
+    """Degrees and orders of all modes up to `lmax` in the default order"""
+    l = np.repeat(np.arange(lmax + 1), 2 * np.arange(lmax + 1) + 1)  # noqa: E741
+    m = np.concatenate([np.arange(-i, i + 1) for i in range(lmax + 1)])
+    return l, m
+
+
+def _expand_blocks(astart, acount, bstart, bcount):
+    """Row and column indices of all entries in a list of blocks"""
+    sizes = acount * bcount
+    block = np.repeat(np.arange(sizes.size), sizes)
+    k = np.arange(block.size) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return block, astart[block] + k // bcount[block], bstart[block] + k % bcount[block]
+
+
+def _translation_values(to_lm, from_lm, vecs, vidx, ks, singular):
+    """Translation coefficients between modes for the referenced displacement vectors"""
+    res = np.empty(len(vidx), complex)
+    for i in range(0, len(vidx), _CHUNKSIZE):
+        s = slice(i, i + _CHUNKSIZE)
+        r = sc.car2sph(vecs[vidx[s]])
+        res[s] = ssw.translate(
+            to_lm[0][s],
+            to_lm[1][s],
+            from_lm[0][s],
+            from_lm[1][s],
+            ks * r[:, 0],
+            r[:, 1],
+            r[:, 2],
+            singular=singular,
+        )
+    return res
+
+
+def _translation_matrix(to_lmax, from_lmax, vec, ks, singular):
+    """Translation matrix between all modes up to the given degrees"""
+    to_l, to_m = _modes(to_lmax)
+    from_l, from_m = _modes(from_lmax)
+    r = sc.car2sph(vec)
+    return ssw.translate(
+        to_l[:, None],
+        to_m[:, None],
+        from_l,
+        from_m,
+        ks * r[0],
+        r[1],
+        r[2],
+        singular=singular,
+    )
+
+
+class _Level:
+    """Boxes of one level of the octree"""
+
+    def __init__(self, coords, size, origin, order):
+        self.keys, self.pidx = np.unique(
+            (coords[:, 0] * (1 << 20) + coords[:, 1]) * (1 << 20) + coords[:, 2],
+            return_inverse=True,
+        )
+        self.coords = np.empty((len(self.keys), 3), int)
+        self.coords[self.pidx] = coords
+        self.size = size
+        self.centers = origin + (self.coords + 0.5) * size
+        self.order = order
+
+    def find(self, coords):
+        """Indices of the boxes with the given coordinates or -1 if they are empty"""
+        keys = (coords[:, 0] * (1 << 20) + coords[:, 1]) * (1 << 20) + coords[:, 2]
+        idx = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        valid = (self.keys[idx] == keys) & np.all(coords >= 0, axis=-1)
+        return np.where(valid, idx, -1)
+
+
+class ClusterFMM:
+    r"""Fast multipole method for the translations within a cluster of scatterers.
+
+    The singular fields of the scatterers of a cluster are expanded in regular fields at
+    all other scatterers. This is the application of the translation matrix
+    :math:`C^{(3)}`, that is created by
+
+    .. code-block:: python
+
+        expand((basis, basis), ("regular", "singular"), k0=k0, material=material)
+
+    The fast multipole method applies this matrix without creating it. The positions of
+    the scatterers are sorted into an octree with uniform depth. The translations
+    between scatterers in the same or adjacent leaf boxes are stored in a sparse
+    matrix. All other translations are made between the boxes: the singular fields are
+    collected in multipole expansions at the box centers and passed up the tree, they are
+    translated into local expansions between well-separated boxes of the same size, and
+    passed down the tree. The multipole-to-local translations rotate the translation
+    axis onto the z-axis, translate along it, and rotate back.
+
+    If it is not specified, the expansion order of the boxes is chosen for each level
+    from the size of the boxes and the maximal degree of the scatterers. It typically
+    results in a relative error of the translations of about `1e-7`.
+
+    One application is slower than the product with a stored dense translation matrix,
+    but much faster than creating the dense matrix, which takes time and memory of order
+    :math:`N^2`. So, it pays off for iterative solutions without storing the translation
+    matrix and for clusters, whose translation matrix does not fit into memory. For
+    small spheres with `lmax = 1`, one application is faster than the recomputation of
+    the dense translations above about 100 scatterers, see `benchmarks/fmm.py`.
+
+    Args:
+        basis (ScalarSphericalWaveBasis): Basis of the cluster.
+        k0 (float): Angular wavenumber in the air.
+        material (AcousticMaterial, optional): Background material. Defaults to the air.
+        order (int, optional): Expansion order of the boxes for all levels.
+        leafsize (float, optional): Mean number of scatterers in a leaf box, that
+            determines the depth of the octree.
+    """
+
+    def __init__(self, basis, k0, material=AcousticMaterial(), order=None, leafsize=4):
+        """Initialization."""
+        if not isinstance(basis, SSWB):
+            raise ValueError("spherical wave basis required")
+        self.basis = basis
+        self.k0 = k0
+        self.material = AcousticMaterial(material)
+        ks = self.material.ks(k0)
+        l, m = basis.lm  # noqa: E741
+        pidx = basis.pidx
+        modeorder = np.argsort(pidx, kind="stable")
+        counts = np.bincount(pidx, minlength=len(basis.positions))
+        starts = np.cumsum(counts) - counts
+        used = np.flatnonzero(counts)
+        positions = basis.positions[used]
+        lmax = np.max(l)
+
+        lower, upper = np.min(positions, axis=0), np.max(positions, axis=0)
+        size = np.max(upper - lower)
+        size = 1.0 if size == 0 else size * (1 + 1e-12)
+        origin = 0.5 * (lower + upper - size)
+        nlevels = max(2, int(np.ceil(np.log(len(used) / leafsize) / np.log(8))))
+        coords = np.clip(
+            np.floor((positions - origin) * ((1 << nlevels) / size)).astype(int),
+            0,
+            (1 << nlevels) - 1,
+        )
+        self.levels = {}
+        for i in range(2, nlevels + 1):
+            boxsize = size / (1 << i)
+            if order is None:
+                kd = np.abs(ks) * np.sqrt(3) * boxsize
+                order_ = lmax + int(np.ceil(kd + 3 * np.cbrt(kd))) + 10
+            else:
+                order_ = order
+            self.levels[i] = _Level(coords >> (nlevels - i), boxsize, origin, order_)
+        leaf = self.levels[nlevels]
+        self.nlevels = nlevels
+
+        # Particle to multipole and local to particle translations
+        nleaf = leaf.order
+        leafl, leafm = _modes(nleaf)
+        dim = len(leafl)
+        boxes = leaf.pidx
+        block, rows, cols = _expand_blocks(
+            boxes * dim, np.full(boxes.shape, dim), starts[used], counts[used]
+        )
+        cols = modeorder[cols]
+        vecs = leaf.centers[boxes] - positions
+        self._p2m = sps.csr_matrix(
+            (
+                _translation_values(
+                    (leafl[rows % dim], leafm[rows % dim]),
+                    (l[cols], m[cols]),
+                    vecs,
+                    block,
+                    ks,
+                    False,
+                ),
+                (rows, cols),
+            ),
+            shape=(len(leaf.keys) * dim, len(basis)),
+        )
+        self._l2p = sps.csr_matrix(
+            (
+                _translation_values(
+                    (l[cols], m[cols]),
+                    (leafl[rows % dim], leafm[rows % dim]),
+                    -vecs,
+                    block,
+                    ks,
+                    False,
+                ),
+                (cols, rows),
+            ),
+            shape=(len(basis), len(leaf.keys) * dim),
+        )
+
+        # Translations between neighboring particles
+        pord = np.argsort(boxes, kind="stable")
+        pcount = np.bincount(boxes, minlength=len(leaf.keys))
+        pstart = np.cumsum(pcount) - pcount
+        source = leaf.find((leaf.coords[:, None, :] + _NEIGHBORS).reshape(-1, 3))
+        target = np.repeat(np.arange(len(leaf.keys)), len(_NEIGHBORS))
+        target, source = target[source >= 0], source[source >= 0]
+        _, ptarget, psource = _expand_blocks(
+            pstart[target], pcount[target], pstart[source], pcount[source]
+        )
+        ptarget, psource = pord[ptarget], pord[psource]
+        valid = ptarget != psource
+        ptarget, psource = ptarget[valid], psource[valid]
+        block, rows, cols = _expand_blocks(
+            starts[used[ptarget]],
+            counts[used[ptarget]],
+            starts[used[psource]],
+            counts[used[psource]],
+        )
+        rows, cols = modeorder[rows], modeorder[cols]
+        self._near = sps.csr_matrix(
+            (
+                _translation_values(
+                    (l[rows], m[rows]),
+                    (l[cols], m[cols]),
+                    positions[ptarget] - positions[psource],
+                    block,
+                    ks,
+                    True,
+                ),
+                (rows, cols),
+            ),
+            shape=(len(basis), len(basis)),
+        )
+
+        # Translations between the levels
+        self._m2m = {}
+        self._l2l = {}
+        for i in range(3, nlevels + 1):
+            child, parent = self.levels[i], self.levels[i - 1]
+            octants = child.coords & 1
+            parents = parent.find(child.coords >> 1)
+            self._m2m[i] = []
+            self._l2l[i] = []
+            for octant in _OCTANTS:
+                group = np.flatnonzero(np.all(octants == octant, axis=-1))
+                if group.size == 0:
+                    continue
+                vec = (0.5 - octant) * child.size
+                self._m2m[i].append(
+                    (
+                        group,
+                        parents[group],
+                        _translation_matrix(parent.order, child.order, vec, ks, False),
+                    )
+                )
+                self._l2l[i].append(
+                    (
+                        group,
+                        parents[group],
+                        _translation_matrix(child.order, parent.order, -vec, ks, False),
+                    )
+                )
+
+        # Multipole to local translations between well-separated boxes
+        maxorder = max(level.order for level in self.levels.values())
+        directions, didx = np.unique(
+            _FAR // np.gcd.reduce(_FAR, axis=-1)[:, None], axis=0, return_inverse=True
+        )
+        r = sc.car2sph(directions)
+        rotations = ssw._rotation_blocks(maxorder, r[:, 2], r[:, 1])
+        self._m2l = {}
+        for i, level in self.levels.items():
+            self._m2l[i] = []
+            order_ = level.order
+            pad = slice(maxorder - order_, maxorder + order_ + 1)
+            parents = level.coords >> 1
+            kr = ks * level.size * np.sqrt(np.sum(_FAR * _FAR, axis=-1))
+            krs, kidx = np.unique(kr, return_inverse=True)
+            axial = ssw._axial_blocks(order_, krs)
+            for j, offset in enumerate(_FAR):
+                source = level.find(level.coords - offset)
+                valid = source >= 0
+                valid[valid] = np.all(
+                    np.abs(parents[valid] - (level.coords[source[valid]] >> 1)) <= 1,
+                    axis=-1,
+                )
+                if not np.any(valid):
+                    continue
+                self._m2l[i].append(
+                    (
+                        np.flatnonzero(valid),
+                        source[valid],
+                        rotations[didx[j], : order_ + 1, pad, pad],
+                        axial[kidx[j]],
+                    )
+                )
+
+    @property
+    def shape(self):
+        """Shape of the translation matrix."""
+        return len(self.basis), len(self.basis)
+
+    def __matmul__(self, other):
+        """Apply the translation matrix to the coefficients of the singular fields."""
+        other = np.asarray(other)
+        if other.ndim == 0 or other.shape[0] != self.shape[1]:
+            raise ValueError(f"incompatible shapes: '{self.shape}' and '{other.shape}'")
+        x = other.reshape(self.shape[1], -1)
+        n = x.shape[1]
+        leaf = self.levels[self.nlevels]
+        multipoles = {self.nlevels: (self._p2m @ x).reshape(len(leaf.keys), -1, n)}
+        for i in range(self.nlevels, 2, -1):
+            parent = self.levels[i - 1]
+            res = np.zeros((len(parent.keys), (parent.order + 1) ** 2, n), complex)
+            for group, parents, trans in self._m2m[i]:
+                res[parents] += trans @ multipoles[i][group]
+            multipoles[i - 1] = res
+        local = None
+        for i in range(2, self.nlevels + 1):
+            level = self.levels[i]
+            order_ = level.order
+            lm = _modes(order_)
+            lm = lm[0], lm[1] + order_
+            res = np.zeros((len(level.keys), (order_ + 1) ** 2, n), complex)
+            for group, parents, trans in self._l2l.get(i, ()):
+                res[group] += trans @ local[parents]
+            for targets, sources, rotation, axial in self._m2l[i]:
+                coeffs = np.zeros((len(sources), n, order_ + 1, 2 * order_ + 1), complex)
+                coeffs[..., lm[0], lm[1]] = multipoles[i][sources].transpose(0, 2, 1)
+                coeffs = ssw._translate_rtr(coeffs, rotation, axial)
+                res[targets] += coeffs[..., lm[0], lm[1]].transpose(0, 2, 1)
+            local = res
+        res = self._l2p @ local.reshape(-1, n) + self._near @ x
+        return res.reshape(other.shape)
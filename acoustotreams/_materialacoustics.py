@@ -1,5 +1,7 @@
-import numpy as np
 import cmath
+import hashlib
+
+import numpy as np
 
 from treams import misc
 
@@ -35,6 +37,13 @@ class AcousticMaterial:
         self._rho = rho
         self._c = c
         self._ct = ct
+        hasher = hashlib.blake2b(digest_size=20)
+        for param in (rho, c, ct):
+            # Adding zero replaces negative zeros, that compare equal to zeros
+            param = np.asarray(param, complex) + 0
+            hasher.update(str(param.shape).encode())
+            hasher.update(param.tobytes())
+        self._digest = hasher.digest()
 
     @property
     def rho(self):
@@ -150,11 +159,23 @@ class AcousticMaterial:
             return False
         if not isinstance(other, AcousticMaterial):
             other = AcousticMaterial(*other)
-        return (
-            self.rho == other.rho
-            and self.c == other.c
-            and self.ct == other.ct
-        )
+        return self._digest == other._digest
+
+    def __hash__(self):
+        """Hash of the material parameters, see :attr:`digest`."""
+        return hash(self._digest)
+
+    @property
+    def digest(self):
+        """Digest of the material parameters.
+
+        The digest is computed once at the initialization, since materials are
+        immutable. Two materials are equal, if and only if their digests are equal.
+
+        Returns:
+            bytes
+        """
+        return self._digest
     
     @property
     def isreal(self):
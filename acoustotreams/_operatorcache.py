@@ -0,0 +1,152 @@
+"""Cache of operator matrices."""
+
+import collections
+import functools
+import hashlib
+import threading
+
+import numpy as np
+from treams._lattice import Lattice, WaveVector
+
+import acoustotreams._coreacoustics as core
+from acoustotreams._materialacoustics import AcousticMaterial
+
+
+def _update(hasher, obj):
+    """Add the content of an argument to the hash"""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, np.generic)):
+        hasher.update(repr((type(obj).__name__, obj)).encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(repr(("ndarray", obj.dtype.str, obj.shape)).encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (tuple, list)):
+        hasher.update(repr(("sequence", len(obj))).encode())
+        for item in obj:
+            _update(hasher, item)
+    elif isinstance(obj, (AcousticMaterial, core.ScalarBasisSet)):
+        hasher.update(type(obj).__name__.encode())
+        hasher.update(obj.digest)
+        if isinstance(obj, core.ScalarBasisSet):
+            _update(hasher, [obj.lattice, obj.kpar, getattr(obj, "alignment", None)])
+    elif isinstance(obj, Lattice):
+        _update(hasher, ("Lattice", np.asarray(obj), obj.alignment))
+    elif isinstance(obj, WaveVector):
+        _update(hasher, ("WaveVector", np.asarray(obj)))
+    else:
+        raise TypeError(f"no content hash for type '{type(obj).__name__}'")
+
+
+def _digest(*args, **kwargs):
+    """Content hash of all arguments"""
+    hasher = hashlib.blake2b(digest_size=20)
+    _update(hasher, args)
+    _update(hasher, sorted(kwargs.items()))
+    return hasher.digest()
+
+
+def _copy(arr):
+    return type(arr)(np.asarray(arr).copy(), arr.ann)
+
+
+class OperatorCache:
+    """Cache of operator matrices.
+
+    The matrices created by :func:`expand`, :func:`expandlattice`, :func:`rotate`, and
+    :func:`translate`, and therefore also by the corresponding operators, are kept for
+    later calls with the same arguments. The arguments are identified by a hash of their
+    content, i.e., of the modes and positions of the basis sets, the wave number, the
+    material, the mode types, the lattice, the wave vector, and the translation vector.
+    Arguments without a content hash are never cached.
+
+    The cache is disabled as long as `maxbytes` is zero, which is the default. Otherwise,
+    the matrices are evicted in least recently used order, when their total size exceeds
+    `maxbytes`. Each call returns a copy of the cached matrix.
+
+    Args:
+        maxbytes (int, optional): Maximal total size of the matrices in bytes.
+    """
+
+    def __init__(self, maxbytes=0):
+        """Initialization."""
+        self.maxbytes = maxbytes
+        self.hits = self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+
+    @property
+    def nbytes(self):
+        """Total size of the cached matrices in bytes.
+
+        Returns:
+            int
+        """
+        return self._nbytes
+
+    def __len__(self):
+        """Number of cached matrices."""
+        return len(self._entries)
+
+    def info(self):
+        """Statistics of the cache.
+
+        Returns:
+            dict: The numbers of hits and misses, the number of cached matrices, and
+            their total size in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "nbytes": self._nbytes,
+            }
+
+    def clear(self):
+        """Remove all matrices and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+    def __call__(self, func):
+        """Decorate a function, whose results are cached."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self.maxbytes <= 0:
+                return func(*args, **kwargs)
+            try:
+                key = func.__qualname__, _digest(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+            with self._lock:
+                res = self._entries.get(key)
+                if res is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _copy(res)
+                self.misses += 1
+            res = func(*args, **kwargs)
+            self._insert(key, _copy(res))
+            return res
+
+        return wrapper
+
+    def _insert(self, key, arr):
+        nbytes = np.asarray(arr).nbytes
+        if nbytes > self.maxbytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= np.asarray(old).nbytes
+            self._entries[key] = arr
+            self._nbytes += nbytes
+            while self._nbytes > self.maxbytes:
+                _, old = self._entries.popitem(last=False)
+                self._nbytes -= np.asarray(old).nbytes
+
+
+operator_cache = OperatorCache()
+"""Process-wide instance of :class:`OperatorCache`, that is disabled by default."""
@@ -1,5 +1,7 @@
 """Operators for common transformations including different types of waves."""
 
+import time
+
 import numpy as np
 
 import treams.special as sc
@@ -7,12 +9,15 @@ from treams import util
 from treams._lattice import Lattice, WaveVector
 from acoustotreams._materialacoustics import AcousticMaterial
 import acoustotreams._coreacoustics as core
+from acoustotreams._operatorcache import operator_cache
 from treams._operators import Operator,FieldOperator
 import acoustotreams.special as ats
 import acoustotreams.ssw as ssw
 import acoustotreams.spw as spw
 import acoustotreams.scw as scw
 
+_CHUNKSIZE = 2 ** 20
+
 
 def _ssw_rotate(phi, theta, psi, basis, to_basis, where):
     """Rotate scalar spherical waves."""
@@ -63,6 +68,7 @@ def _spwp_rotate(phi, basis, where):
     return core.AcousticsArray(res, basis=(newbasis, basis))
 
 
+@operator_cache
 def rotate(phi, theta=0, psi=0, *, basis, where=True):
     """Rotation matrix.
 
@@ -119,7 +125,7 @@ class Rotate(Operator):
         return self.FUNC(*(-a for a in self._args[::-1]), **kwargs)
     
 
-def _ssw_translate(r, basis, to_basis, k0, material, where):
+def _ssw_translate(r, basis, to_basis, k0, material, where, method=None):
     """Translate scalar spherical waves."""
     where = np.logical_and(where, to_basis.pidx[:, None] == basis.pidx)
     ks = k0 * AcousticMaterial().c / material.c
@@ -132,6 +138,7 @@ def _ssw_translate(r, basis, to_basis, k0, material, where):
         r[..., None, None, 2],
         singular=False,
         where=where,
+        method=method,
     )
     res[..., np.logical_not(where)] = 0
     return core.AcousticsArray(
@@ -141,22 +148,35 @@ def _ssw_translate(r, basis, to_basis, k0, material, where):
         material=(material, material),
     )
 
+def _kz_blocks(to_basis, basis):
+    """Rows and columns of the blocks of cylindrical modes with equal kz."""
+    for kz in np.intersect1d(to_basis.kz, basis.kz):
+        yield np.flatnonzero(to_basis.kz == kz), np.flatnonzero(basis.kz == kz)
+
+
 def _scw_translate(r, basis, k0, to_basis, material, where):
-    """Translate scalar cylindrical waves."""
+    """Translate scalar cylindrical waves.
+
+    The translation does not couple different kz, so only the blocks of equal kz are
+    computed. This speeds up the construction only, the result is a dense matrix.
+    """
     where = np.logical_and(where, to_basis.pidx[:, None] == basis.pidx)
     ks = material.ks(k0)
     krhos = np.sqrt(ks * ks - basis.kz * basis.kz + 0j)
     krhos[krhos.imag < 0] = -krhos[krhos.imag < 0]
     r = sc.car2cyl(r)
-    res = scw.translate(
-        *(m[:, None] for m in to_basis.zm),
-        *basis.zm,
-        krhos * r[..., None, None, 0],
-        r[..., None, None, 1],
-        r[..., None, None, 2],
-        singular=False,
-        where=where,
-    )
+    res = np.zeros((*r.shape[:-1], len(to_basis), len(basis)), complex)
+    where = np.broadcast_to(where, res.shape)
+    for rows, cols in _kz_blocks(to_basis, basis):
+        res[..., rows[:, None], cols] = scw.translate(
+            *(m[rows, None] for m in to_basis.zm),
+            *(m[cols] for m in basis.zm),
+            krhos[cols] * r[..., None, None, 0],
+            r[..., None, None, 1],
+            r[..., None, None, 2],
+            singular=False,
+            where=where[..., rows[:, None], cols],
+        )
     res[..., np.logical_not(where)] = 0
     return core.AcousticsArray(
         res, k0=(k0, k0), basis=(to_basis, basis), material=(material, material)
@@ -188,8 +208,16 @@ def _spw_translate(r, basis, k0, to_basis, material, modetype, where):
         modetype=(modetype,) * 2,
     )
 
+@operator_cache
 def translate(
-    r, *, basis, k0=None, material=AcousticMaterial(), modetype=None, where=True
+    r,
+    *,
+    basis,
+    k0=None,
+    material=AcousticMaterial(),
+    modetype=None,
+    where=True,
+    method=None,
 ):
     """Translation matrix.
 
@@ -207,6 +235,9 @@ def translate(
             :class:`ScalarPlaneWaveBasisByComp`.
         where (array_like of bool, optional): Only evaluate specified parts of the translation
             matrix. The given array must have a shape that matches the output shape.
+        method (str, optional): Evaluation method of the translation coefficients for
+            :class:`ScalarSphericalWaveBasis`, see :func:`acoustotreams.ssw.translate`.
+            Defaults to an automatic choice.
     """
     if isinstance(basis, (tuple, list)):
         to_basis, basis = basis
@@ -222,7 +253,7 @@ def translate(
             modetype = "up" if modetype is None else modetype
         return _spw_translate(r, basis, k0, to_basis, material, modetype, where)
     if isinstance(basis, core.ScalarSphericalWaveBasis):
-        return _ssw_translate(r, basis, to_basis, k0, material, where)
+        return _ssw_translate(r, basis, to_basis, k0, material, where, method)
     if isinstance(basis, core.ScalarCylindricalWaveBasis):
         return _scw_translate(r, basis, k0, to_basis, material, where)
     raise TypeError("invalid basis")
@@ -246,7 +277,9 @@ class Translate(Operator):
         return self.FUNC(np.negative(self._args[0]), **kwargs)
 
 
-def _ssw_ssw_expand(basis, to_basis, to_modetype, k0, material, modetype, where):
+def _ssw_ssw_expand(
+    basis, to_basis, to_modetype, k0, material, modetype, where, method=None
+):
     """Expand scalar spherical waves in scalar spherical waves."""
     if not (
         modetype == "regular" == to_modetype
@@ -254,16 +287,20 @@ def _ssw_ssw_expand(basis, to_basis, to_modetype, k0, material, modetype, where)
         or (modetype == "singular" and to_modetype == "regular")
     ):
         raise ValueError(f"invalid expansion from {modetype} to {to_modetype}")
-    rs = sc.car2sph(to_basis.positions[:, None, :] - basis.positions)
+    # Only the positions referenced by the modes are needed
+    to_pidx, to_inv = np.unique(to_basis.pidx, return_inverse=True)
+    pidx, inv = np.unique(basis.pidx, return_inverse=True)
+    rs = sc.car2sph(to_basis.positions[to_pidx, None, :] - basis.positions[pidx])
     ks = k0 * AcousticMaterial().c / material.c
     res = ssw.translate(
         *(m[:, None] for m in to_basis.lm),
         *basis.lm,
-        ks * rs[to_basis.pidx[:, None], basis.pidx, 0],
-        rs[to_basis.pidx[:, None], basis.pidx, 1],
-        rs[to_basis.pidx[:, None], basis.pidx, 2],
+        ks * rs[to_inv[:, None], inv, 0],
+        rs[to_inv[:, None], inv, 1],
+        rs[to_inv[:, None], inv, 2],
         singular=modetype != to_modetype,
         where=where,
+        method=method,
     )
     res[..., np.logical_not(where)] = 0
     res = core.AcousticsArray(
@@ -320,15 +357,20 @@ def _scw_scw_expand(basis, to_basis, to_modetype, k0, material, modetype, where)
     """Expand scalar cylindrical waves in scalar cylindrical waves."""
     rs = sc.car2cyl(to_basis.positions[:, None, :] - basis.positions)
     krhos = material.krhos(k0, basis.kz)
-    res = scw.translate(
-        *(m[:, None] for m in to_basis.zm),
-        *basis.zm,
-        krhos * rs[to_basis.pidx[:, None], basis.pidx, 0],
-        rs[to_basis.pidx[:, None], basis.pidx, 1],
-        rs[to_basis.pidx[:, None], basis.pidx, 2],
-        singular=modetype != to_modetype,
-        where=where,
-    )
+    where = np.broadcast_to(where, (len(to_basis), len(basis)))
+    res = np.zeros(where.shape, complex)
+    # The expansion does not couple different kz, so only the blocks are computed
+    for rows, cols in _kz_blocks(to_basis, basis):
+        pidx = to_basis.pidx[rows, None], basis.pidx[cols]
+        res[rows[:, None], cols] = scw.translate(
+            *(m[rows, None] for m in to_basis.zm),
+            *(m[cols] for m in basis.zm),
+            krhos[cols] * rs[(*pidx, 0)],
+            rs[(*pidx, 1)],
+            rs[(*pidx, 2)],
+            singular=modetype != to_modetype,
+            where=where[..., rows[:, None], cols],
+        )
     res[..., np.logical_not(where)] = 0
     res = core.AcousticsArray(res, k0=k0, basis=(to_basis, basis), material=material)
     if modetype == "singular" and to_modetype == "regular":
@@ -378,8 +420,15 @@ def _spw_spw_expand(basis, to_basis, k0, material, modetype, where):
     )
 
 
+@operator_cache
 def expand(
-    basis, modetype=None, *, k0=None, material=AcousticMaterial(), where=True
+    basis,
+    modetype=None,
+    *,
+    k0=None,
+    material=AcousticMaterial(),
+    where=True,
+    method=None,
 ):
     """Expansion matrix.
 
@@ -401,6 +450,9 @@ def expand(
             parameters. Defaults to the air.
         where (array_like of bool, optional): Only evaluate specified parts of the expansion 
             matrix. The given array must have a shape that matches the output shape.
+        method (str, optional): Evaluation method of the translation coefficients for
+            the expansion of :class:`ScalarSphericalWaveBasis` in itself, see
+            :func:`acoustotreams.ssw.translate`. Defaults to an automatic choice.
     """
     if isinstance(basis, (tuple, list)):
         to_basis, basis = basis
@@ -417,7 +469,7 @@ def expand(
         modetype = "regular" if modetype is None else modetype
         to_modetype = modetype if to_modetype is None else to_modetype
         return _ssw_ssw_expand(
-            basis, to_basis, to_modetype, k0, material, modetype, where
+            basis, to_basis, to_modetype, k0, material, modetype, where, method
         )
     if isinstance(basis, core.ScalarCylindricalWaveBasis):
         if isinstance(to_basis, core.ScalarCylindricalWaveBasis):
@@ -694,6 +746,7 @@ def _spw_scw_expand(basis, to_basis, k0, lattice, kpar, material, modetype, wher
         kpar=kpar,
     )
 
+@operator_cache
 def expandlattice(
     lattice=None,
     kpar=None,
@@ -936,31 +989,69 @@ class Permute(Operator):
     
 
 
+def _chunked_vfield(func, r, nmodes):
+    """Evaluate the velocity field in chunks of points.
+
+    The points `r` have the shape `(..., 1, 3)` and `func` maps a chunk of shape
+    `(n, 1, 3)` to the field of shape `(n, nmodes, 3)`, which limits the size of the
+    intermediate arrays.
+    """
+    shape = r.shape[:-2]
+    r = r.reshape(-1, 3)
+    res = np.empty((len(r), nmodes, 3), complex)
+    step = max(1, _CHUNKSIZE // max(1, nmodes))
+    for i in range(0, len(r), step):
+        res[i : i + step] = func(r[i : i + step, None, :])
+    return res.reshape(*shape, nmodes, 3)
+
+
+def _ssw_tables(r, basis, ks, modetype, lextra=0, derivatives=False):
+    """Radial and angular functions of scalar spherical waves.
+
+    The spherical Bessel or Hankel functions are computed once for each point, position,
+    and degree and the spherical harmonics once for each point, position, and mode up to
+    the maximal degree of the basis, such that they only need to be combined for each
+    mode. The radial functions are computed for `lextra` additional degrees.
+    """
+    if modetype not in ("regular", "singular"):
+        raise ValueError("invalid parameters")
+    rsph = sc.car2sph(r - basis.positions)
+    lmax = int(np.max(basis.l, initial=0))
+    radial = ats.spherical_bessel_table(
+        lmax + lextra, ks * rsph[..., 0], modetype == "singular"
+    )
+    angular = ats.sph_harm_table(lmax, rsph[..., 1], rsph[..., 2], derivatives)
+    return rsph, radial, angular
+
+
 def _ssw_vfield(r, basis, k0, material, modetype):
     """Velocity field of scalar spherical waves."""
     ks = k0 * AcousticMaterial().c / material.c
-    rsph = sc.car2sph(r - basis.positions)
-    res = None
-    if modetype == "regular":
-        res = ats.vsw_rL(
-            basis.l,
-            basis.m,
-            ks * rsph[..., basis.pidx, 0],
-            rsph[..., basis.pidx, 1],
-            rsph[..., basis.pidx, 2],
+    l, lm = basis.l, basis.l * (basis.l + 1) + basis.m  # noqa: E741
+    lprev = np.maximum(l - 1, 0)
+
+    def func(r):
+        rsph, radial, (ylm, dtheta, dphi) = _ssw_tables(
+            r, basis, ks, modetype, 1, True
         )
-    elif modetype == "singular":
-        res = ats.vsw_L(
-            basis.l,
-            basis.m,
-            ks * rsph[..., basis.pidx, 0],
-            rsph[..., basis.pidx, 1],
-            rsph[..., basis.pidx, 2],
+        rsph = rsph[..., basis.pidx, :]
+        zprev, z, znext = (radial[..., basis.pidx, i] for i in (lprev, l, l + 1))
+        # Derivative and division by the argument by recurrences, which are also finite
+        # at the origin for the regular waves
+        tangential = (zprev + znext) / (2 * l + 1)
+        res = np.stack(
+            (
+                (l * zprev - (l + 1) * znext) / (2 * l + 1) * ylm[..., basis.pidx, lm],
+                tangential * dtheta[..., basis.pidx, lm],
+                tangential * dphi[..., basis.pidx, lm],
+            ),
+            axis=-1,
         )
+        return sc.vsph2car(res, rsph)
+
+    res = _chunked_vfield(func, r, len(basis))
     res *= -1j / (material.rho * material.c)
-    if res is None:
-        raise ValueError("invalid parameters")
-    res = util.AnnotatedArray(sc.vsph2car(res, rsph[..., basis.pidx, :]))    
+    res = util.AnnotatedArray(res)
     res.ann[-2]["basis"] = basis
     res.ann[-2]["k0"] = k0
     res.ann[-2]["material"] = material
@@ -974,31 +1065,29 @@ def _scw_vfield(r, basis, k0, material, modetype):
     ks = material.ks(k0)
     krhos = material.krhos(k0, basis.kz)
     krhos[krhos.imag < 0] = -krhos[krhos.imag < 0]
-    rcyl = sc.car2cyl(r - basis.positions)
     if modetype == "regular":
-        res = ats.vcw_rL(
-            basis.kz,
-            basis.m,
-            krhos * rcyl[..., basis.pidx, 0],
-            rcyl[..., basis.pidx, 1],
-            rcyl[..., basis.pidx, 2],
-            krhos,
-            ks
-        )
+        wave = ats.vcw_rL
     elif modetype == "singular":
-        res = ats.vcw_L(
+        wave = ats.vcw_L
+    else:
+        raise ValueError("invalid parameters")
+
+    def func(r):
+        rcyl = sc.car2cyl(r - basis.positions)[..., basis.pidx, :]
+        res = wave(
             basis.kz,
             basis.m,
-            krhos * rcyl[..., basis.pidx, 0],
-            rcyl[..., basis.pidx, 1],
-            rcyl[..., basis.pidx, 2],
+            krhos * rcyl[..., 0],
+            rcyl[..., 1],
+            rcyl[..., 2],
             krhos,
-            ks
-        )   
+            ks,
+        )
+        return sc.vcyl2car(res, rcyl)
+
+    res = _chunked_vfield(func, r, len(basis))
     res *= -1j / (material.rho * material.c)
-    if res is None:
-        raise ValueError("invalid parameters")
-    res = util.AnnotatedArray(sc.vcyl2car(res, rcyl[..., basis.pidx, :]))
+    res = util.AnnotatedArray(res)
     res.ann[-2]["basis"] = basis
     res.ann[-2]["k0"] = k0
     res.ann[-2]["material"] = material
@@ -1061,37 +1150,33 @@ class VField(FieldOperator):
 
     _FUNC = staticmethod(vfield)
 
+    def probe(self, **kwargs):
+        """Precomputed field evaluation at the points of the operator.
+
+        Args:
+            **kwargs: Basis, wave number, material, mode type, and compression, see
+                :class:`FieldProbe`.
+
+        Returns:
+            FieldProbe
+        """
+        return FieldProbe(*self._args, "v", **kwargs)
+
 
 def _ssw_pfield(r, basis, k0, material, modetype):
     """Pressure field of scalar spherical waves."""
     ks = k0 * AcousticMaterial().c / material.c
-    rsph = sc.car2sph(r - basis.positions)
-    res = None
-    if modetype == "regular":
-        res = ats.ssw_rPsi(
-            basis.l,
-            basis.m,
-            ks * rsph[..., basis.pidx, 0],
-            rsph[..., basis.pidx, 1],
-            rsph[..., basis.pidx, 2],
-            )
-    elif modetype == "singular":
-            res = ats.ssw_Psi(
-            basis.l,
-            basis.m,
-            ks * rsph[..., basis.pidx, 0],
-            rsph[..., basis.pidx, 1],
-            rsph[..., basis.pidx, 2],
-        )
-    if res is None:
-        raise ValueError("invalid parameters")
-    res = util.AnnotatedArray(np.array([res]).T)  
+    _, radial, ylm = _ssw_tables(r, basis, ks, modetype)
+    lm = basis.l * (basis.l + 1) + basis.m
+    res = radial[..., basis.pidx, basis.l] * ylm[..., basis.pidx, lm]
+    res = util.AnnotatedArray(np.array([res]).T)
     res.ann[-2]["basis"] = basis
     res.ann[-2]["k0"] = k0
     res.ann[-2]["material"] = material
     res.ann[-2]["modetype"] = modetype
     return res
 
+
 def _scw_pfield(r, basis, k0, material, modetype):
     """Pressure field of scalar cylindrical waves."""
     material = AcousticMaterial(material)
@@ -1178,60 +1263,380 @@ class PField(FieldOperator):
 
     _FUNC = staticmethod(pfield)
 
+    def probe(self, **kwargs):
+        """Precomputed field evaluation at the points of the operator.
+
+        Args:
+            **kwargs: Basis, wave number, material, mode type, and compression, see
+                :class:`FieldProbe`.
+
+        Returns:
+            FieldProbe
+        """
+        return FieldProbe(*self._args, "p", **kwargs)
+
+
+def _field_tile(r, kind, basis, k0, material, modetype):
+    """Field matrix for the points `r` of shape `(n, 3)`.
+
+    The result has the shape `(n, nmodes)` for the pressure and `(n, 3, nmodes)` for
+    the velocity.
+    """
+    funcs = {
+        "p": (_ssw_pfield, _scw_pfield, _spw_pfield),
+        "v": (_ssw_vfield, _scw_vfield, _spw_vfield),
+    }
+    if kind not in funcs:
+        raise ValueError(f"invalid kind '{kind}'")
+    fssw, fscw, fspw = funcs[kind]
+    r = r[:, None, :]
+    if isinstance(basis, core.ScalarSphericalWaveBasis):
+        res = fssw(r, basis, k0, material, "regular" if modetype is None else modetype)
+    elif isinstance(basis, core.ScalarCylindricalWaveBasis):
+        res = fscw(r, basis, k0, material, "regular" if modetype is None else modetype)
+    elif isinstance(basis, core.ScalarPlaneWaveBasis):
+        if modetype is None and isinstance(basis, core.ScalarPlaneWaveBasisByComp):
+            modetype = "up"
+        res = fspw(r, basis, k0, material, modetype)
+    else:
+        raise TypeError("invalid basis")
+    res = np.asarray(res)
+    if kind == "p":
+        return res[..., 0].T
+    return res.swapaxes(-1, -2)
+
+
+def field_tiles(
+    coeffs,
+    grid,
+    kind="p",
+    *,
+    valid=None,
+    chunk_bytes=2 ** 26,
+    basis=None,
+    k0=None,
+    material=None,
+    modetype=None,
+):
+    """Field of the given coefficients on a grid, evaluated in tiles.
+
+    The points of the grid are evaluated in tiles, such that the field matrix of each
+    tile, that maps the coefficients to the field, takes at most `chunk_bytes`. This
+    matrix is contracted with the coefficients right away, so the full matrix of the
+    grid is never created. The basis, the wave number, the material, and the mode type
+    are taken from the annotations of the coefficients, unless they are given
+    explicitly.
+
+    Args:
+        coeffs (AcousticsArray): Expansion coefficients. For multiple fields, the last
+            dimension enumerates them.
+        grid (array_like): Evaluation points. The last dimension needs length three
+            and corresponds to the Cartesian coordinates.
+        kind (str, optional): Pressure field "p" (default) or velocity field "v".
+        valid (array_like, optional): Boolean mask of the points to evaluate, e.g.
+            from :meth:`AcousticTMatrix.valid_points`. Defaults to all points.
+        chunk_bytes (int, optional): Maximal size of the field matrix of a tile.
+        basis (:class:`~acoustotreams.ScalarBasisSet`, optional): Basis set.
+        k0 (float, optional): Angular wavenumber in the air. Has units of 1/r.
+        material (:class:`~acoustotreams.AcousticMaterial` or tuple, optional):
+            Material parameters.
+        modetype (str, optional): Mode type.
+
+    Yields:
+        tuple: Index into the grid without its last dimension and the field at these
+        points. The velocity field has the Cartesian components in the dimension after
+        the points.
+    """
+    ann = getattr(coeffs, "ann", ({},))[0]
+    basis = ann.get("basis") if basis is None else basis
+    if basis is None:
+        raise TypeError("missing 'basis'")
+    k0 = ann.get("k0") if k0 is None else k0
+    material = ann.get("material", AcousticMaterial()) if material is None else material
+    material = AcousticMaterial(material)
+    modetype = ann.get("modetype") if modetype is None else modetype
+    coeffs = np.asarray(coeffs)
+    grid = np.asarray(grid, float)
+    if grid.shape[-1] != 3:
+        raise ValueError("invalid grid")
+    shape = grid.shape[:-1]
+    grid = grid.reshape(-1, 3)
+    if valid is None:
+        idx = np.arange(len(grid))
+    else:
+        idx = np.flatnonzero(np.broadcast_to(valid, shape))
+    size = 16 * len(basis) * (3 if kind == "v" else 1)
+    step = max(1, chunk_bytes // size)
+    for i in range(0, len(idx), step):
+        tile = idx[i : i + step]
+        field = _field_tile(grid[tile], kind, basis, k0, material, modetype) @ coeffs
+        yield np.unravel_index(tile, shape), field
+
+
+def field_map(
+    coeffs, grid, kind="p", *, valid=None, chunk_bytes=2 ** 26, out=None, **kwargs
+):
+    """Field of the given coefficients on a grid.
+
+    The field is evaluated in memory-bounded tiles, see :func:`field_tiles`, and
+    written into a single array. Points that are not `valid` are set to `nan`.
+
+    Args:
+        coeffs (AcousticsArray): Expansion coefficients. For multiple fields, the last
+            dimension enumerates them.
+        grid (array_like): Evaluation points. The last dimension needs length three
+            and corresponds to the Cartesian coordinates.
+        kind (str, optional): Pressure field "p" (default) or velocity field "v".
+        valid (array_like, optional): Boolean mask of the points to evaluate, e.g.
+            from :meth:`AcousticTMatrix.valid_points`. Defaults to all points.
+        chunk_bytes (int, optional): Maximal size of the field matrix of a tile.
+        out (array, optional): Complex array to store the result in.
+        **kwargs: Basis, wave number, material and mode type, see :func:`field_tiles`.
+
+    Returns:
+        array: The field with the shape of the grid without the last dimension. The
+        velocity field has an additional dimension for the Cartesian components
+        followed by the dimensions of multiple fields.
+    """
+    grid = np.asarray(grid)
+    shape = grid.shape[:-1] + (3,) * (kind == "v") + np.shape(coeffs)[1:]
+    if out is None:
+        out = np.empty(shape, complex)
+    elif out.shape != shape:
+        raise ValueError(f"invalid shape of 'out' {out.shape}, expected {shape}")
+    if valid is not None:
+        out[np.logical_not(np.broadcast_to(valid, grid.shape[:-1]))] = np.nan
+    for idx, field in field_tiles(
+        coeffs, grid, kind, valid=valid, chunk_bytes=chunk_bytes, **kwargs
+    ):
+        out[idx] = field
+    return out
+
+
+class FieldProbe:
+    """Field evaluation at fixed points with a precomputed matrix.
+
+    The matrix, that maps the coefficients of the basis to the pressure or velocity
+    field at the points, is created once in tiles of at most `chunk_bytes`. Each
+    evaluation, e.g. for many incident fields with the same geometry, is then a single
+    matrix multiplication ``probe @ coeffs``. Optionally, the matrix is compressed by a
+    truncated singular value decomposition, when either `rank` or `rtol` is given,
+    and stored in single precision for ``dtype=numpy.complex64``. The memory usage,
+    the build time, and the error of the truncation are available from :meth:`info`.
+
+    Instances are usually created with :meth:`PField.probe` and :meth:`VField.probe`.
+
+    Args:
+        r (array_like): Evaluation points. The last dimension needs length three and
+            corresponds to the Cartesian coordinates.
+        kind (str, optional): Pressure field "p" (default) or velocity field "v".
+        basis (:class:`~acoustotreams.ScalarBasisSet`): Basis set.
+        k0 (float): Angular wavenumber in the air. Has units of 1/r.
+        material (:class:`~acoustotreams.AcousticMaterial` or tuple, optional):
+            Material parameters. Defaults to the air.
+        modetype (str, optional): Mode type.
+        rank (int, optional): Maximal rank of the compressed matrix.
+        rtol (float, optional): Singular values below `rtol` times the largest singular
+            value are discarded.
+        dtype (data-type, optional): Data type of the stored matrix, either complex
+            (default) or numpy.complex64.
+        chunk_bytes (int, optional): Maximal size of the field matrix of a tile.
+    """
+
+    def __init__(
+        self,
+        r,
+        kind="p",
+        *,
+        basis,
+        k0,
+        material=AcousticMaterial(),
+        modetype=None,
+        rank=None,
+        rtol=None,
+        dtype=complex,
+        chunk_bytes=2 ** 26,
+    ):
+        """Initialization."""
+        start = time.perf_counter()
+        if kind not in ("p", "v"):
+            raise ValueError(f"invalid kind '{kind}'")
+        r = np.asarray(r, float)
+        if r.shape[-1] != 3:
+            raise ValueError("invalid points")
+        dtype = np.dtype(dtype)
+        if dtype not in (np.complex64, np.complex128):
+            raise ValueError(f"invalid dtype '{dtype}'")
+        if modetype is None:
+            if isinstance(
+                basis, (core.ScalarSphericalWaveBasis, core.ScalarCylindricalWaveBasis)
+            ):
+                modetype = "regular"
+            elif isinstance(basis, core.ScalarPlaneWaveBasisByComp):
+                modetype = "up"
+        self.kind = kind
+        self.shape = r.shape[:-1]
+        self.basis = basis
+        self.k0 = k0
+        self.material = AcousticMaterial(material)
+        self.modetype = modetype
+        compress = rank is not None or rtol is not None
+        r = r.reshape(-1, 3)
+        ncomp = 3 if kind == "v" else 1
+        mat = np.empty((len(r), ncomp, len(basis)), complex if compress else dtype)
+        step = max(1, chunk_bytes // (16 * ncomp * max(1, len(basis))))
+        for i in range(0, len(r), step):
+            mat[i : i + step] = _field_tile(
+                r[i : i + step], kind, basis, k0, self.material, modetype
+            ).reshape(-1, ncomp, len(basis))
+        mat = mat.reshape(-1, len(basis))
+        self.rank = None
+        self.error = 0.0
+        self._right = None
+        if compress:
+            u, sv, vh = np.linalg.svd(mat, full_matrices=False)
+            keep = len(sv) if rank is None else min(rank, len(sv))
+            if rtol is not None:
+                keep = min(keep, int(np.count_nonzero(sv > rtol * sv[0])))
+            total = np.sqrt(np.sum(sv * sv))
+            if total > 0:
+                self.error = float(np.sqrt(np.sum(sv[keep:] * sv[keep:])) / total)
+            self.rank = keep
+            mat = u[:, :keep] * sv[:keep]
+            self._right = vh[:keep].astype(dtype)
+        self._left = mat.astype(dtype, copy=False)
+        self.build_time = time.perf_counter() - start
+
+    @property
+    def nbytes(self):
+        """Size of the stored matrices in bytes.
+
+        Returns:
+            int
+        """
+        if self._right is None:
+            return self._left.nbytes
+        return self._left.nbytes + self._right.nbytes
+
+    def info(self):
+        """Statistics of the probe.
+
+        Returns:
+            dict: The numbers of points and modes, the rank of the compressed matrix,
+            its relative error in the Frobenius norm, the size of the stored matrices in
+            bytes, and the build time in seconds.
+        """
+        return {
+            "points": int(np.prod(self.shape)),
+            "modes": len(self.basis),
+            "rank": self.rank,
+            "error": self.error,
+            "nbytes": self.nbytes,
+            "build_time": self.build_time,
+        }
+
+    def __matmul__(self, coeffs):
+        """Field of the given coefficients at the points.
+
+        The annotations of the coefficients, if present, must match the probe. For
+        multiple fields, the last dimension of the coefficients enumerates them.
+        """
+        ann = getattr(coeffs, "ann", ({},))[0]
+        for name in ("basis", "k0", "material", "modetype"):
+            val = ann.get(name)
+            if val is not None and val != getattr(self, name):
+                raise ValueError(f"mismatching '{name}' of the coefficients")
+        coeffs = np.asarray(coeffs)
+        if coeffs.shape[:1] != (len(self.basis),):
+            raise ValueError("invalid shape of the coefficients")
+        coeffs = coeffs.astype(self._left.dtype, copy=False)
+        if self._right is not None:
+            coeffs = self._right @ coeffs
+        res = self._left @ coeffs
+        return res.reshape(self.shape + (3,) * (self.kind == "v") + coeffs.shape[1:])
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(kind={self.kind!r}, points={np.prod(self.shape)}, "
+            f"modes={len(self.basis)}, rank={self.rank}, nbytes={self.nbytes})"
+        )
+
+
+def _ssw_farfield(unit, basis, ks):
+    """Far-field amplitudes of singular scalar spherical waves in the directions `unit`.
+
+    The spherical harmonics are computed once for each direction and reused for all
+    positions. The phases of all positions for all directions are a single outer
+    product. The last dimension of the result enumerates the modes.
+    """
+    rsph = sc.car2sph(unit)
+    ylm = ats.sph_harm_table(
+        int(np.max(basis.l, initial=0)), rsph[..., 1], rsph[..., 2]
+    )
+    phase = np.exp(-1j * ks * (unit @ basis.positions.T))
+    return (
+        np.power(-1j, basis.l + 1)
+        / ks
+        * ylm[..., basis.l * (basis.l + 1) + basis.m]
+        * phase[..., basis.pidx]
+    )
+
 
 def _ssw_pamplitudeff(r, basis, k0, material, modetype):
     """Far-field amplitude of pressure field of singular scalar spherical waves."""
     ks = k0 * AcousticMaterial().c / material.c
-    r = sc.car2sph(r)
-    r = np.broadcast_to(r, basis.positions.shape)
-    rsph = basis.positions
-    res = None
-    res = ats.ssw_psi(
-            basis.l,
-            basis.m,
-            rsph[..., basis.pidx, 0],
-            rsph[..., basis.pidx, 1],
-            rsph[..., basis.pidx, 2],
-            r[..., basis.pidx, 1],
-            r[..., basis.pidx, 2],
-            ks
-        )
-    if res is None:
-        raise ValueError("invalid parameters")
-    res = util.AnnotatedArray(np.array([res]).T)  
+    r = np.asarray(r)[..., 0, :]
+    res = _ssw_farfield(r / np.linalg.norm(r, axis=-1, keepdims=True), basis, ks)
+    res = util.AnnotatedArray(np.array([res]).T)
     res.ann[-2]["basis"] = basis
     res.ann[-2]["k0"] = k0
     res.ann[-2]["material"] = material
     res.ann[-2]["modetype"] = modetype
     return res
 
+
+def _scw_farfield(phi, z, basis, k0, material):
+    """Far-field amplitudes of singular scalar cylindrical waves.
+
+    The amplitudes are computed at the azimuthal angles `phi` and heights `z`. The
+    projections of all positions on all directions are a single outer product. The
+    amplitudes of evanescent modes are zero. The last dimension of the result
+    enumerates the modes.
+    """
+    krhos = material.krhos(k0, basis.kz)
+    krhos[krhos.imag < 0] = -krhos[krhos.imag < 0]
+    phi, z = np.broadcast_arrays(phi, z)
+    unit = np.stack((np.cos(phi), np.sin(phi)), axis=-1)
+    proj = (unit @ basis.positions[:, :2].T)[..., basis.pidx]
+    propagating = krhos.imag == 0
+    krhos_safe = np.where(propagating, krhos, 1)
+    return np.where(
+        propagating,
+        np.sqrt(2 / (np.pi * krhos_safe))
+        * np.power(-1j, basis.m)
+        * np.exp(
+            1j * basis.m * phi[..., None]
+            + 1j * basis.kz * z[..., None]
+            - 1j * krhos_safe * proj
+            - 0.25j * np.pi
+        ),
+        0,
+    )
+
+
 def _scw_pamplitudeff(r, basis, k0, material, modetype):
     """Far-field amplitude of pressure field of singular scalar cylindrical waves."""
-    r = sc.car2cyl(r)
-    r = np.broadcast_to(r, basis.positions.shape)
     material = AcousticMaterial(material)
-    krhos = material.krhos(k0, basis.kz)
-    krhos[krhos.imag < 0] = -krhos[krhos.imag < 0]
-    rcyl = basis.positions
-    res = None
-    res = ats.scw_psi(
-            basis.kz,
-            basis.m,
-            rcyl[..., basis.pidx, 0],
-            rcyl[..., basis.pidx, 1],
-            r[..., basis.pidx, 1],
-            r[..., basis.pidx, 2],
-            krhos,
-        )   
-    if res is None:
-        raise ValueError("invalid parameters")
-    res = util.AnnotatedArray(np.array([res]).T)  
+    rcyl = sc.car2cyl(np.asarray(r)[..., 0, :])
+    res = _scw_farfield(rcyl[..., 1], rcyl[..., 2], basis, k0, material)
+    res = util.AnnotatedArray(np.array([res]).T)
     res.ann[-2]["basis"] = basis
     res.ann[-2]["k0"] = k0
     res.ann[-2]["material"] = material
     res.ann[-2]["modetype"] = modetype
     return res
 
+
 def pamplitudeff(r, *, basis, k0, material=AcousticMaterial(), modetype=None):
     """Far-field amplitude of pressure field.
 
@@ -330,7 +330,8 @@ class AcousticSMatrices:
 
         Args:
             illu (complex or array_like): Insonification. If `modetype` is specified, the direction
-                is chosen accordingly.
+                is chosen accordingly. For multiple insonifications, the last dimension
+                enumerates them.
             illu2 (complex or array_like, optional): Second insonification. If used, the first
                 argument is taken to be coming from below and this one to be coming from
                 above.
@@ -342,7 +343,7 @@ class AcousticSMatrices:
         """
         modetype = getattr(illu, "modetype", "up")
         if isinstance(modetype, tuple):
-            modetype = modetype[max(-2, -len(tuple))]
+            modetype = modetype[max(-2, -len(modetype))]
         illu2 = np.zeros(np.shape(illu)[-2:]) if illu2 is None else illu2
         if modetype == "down":
             illu, illu2 = illu2, illu
@@ -366,14 +367,15 @@ class AcousticSMatrices:
         insonification and propagation direction.
 
         Args:
-            illu (complex or array_like): Expansion coefficients of the incoming wave.
+            illu (complex or array_like): Expansion coefficients of the incoming wave. For
+                multiple incoming waves, the last dimension enumerates them.
 
         Returns:
             tuple
         """
         modetype = getattr(illu, "modetype", "up")
         if isinstance(modetype, tuple):
-            modetype = modetype[max(-2, -len(tuple))]
+            modetype = modetype[max(-2, -len(modetype))]
         trans, refl = self.illuminate(illu)
         material = self.material
         if not isinstance(material, tuple):
@@ -382,13 +384,14 @@ class AcousticSMatrices:
         if modetype == "down":
             trans, refl = refl, trans
             paz.reverse()
-        illu = np.asarray(illu)
-        s_t = np.real(trans.conjugate().T @ paz[0] @ trans)             
-        s_r = np.real(refl.conjugate().T @ paz[1] @ refl)
-        s_i = np.real(np.conjugate(illu).T @ paz[1] @ illu)
+        illu, trans, refl = (np.asarray(i) for i in (illu, trans, refl))
+        paz = [np.asarray(i) for i in paz]
+        s_t = np.real(np.sum(trans.conjugate() * (paz[0] @ trans), axis=0))
+        s_r = np.real(np.sum(refl.conjugate() * (paz[1] @ refl), axis=0))
+        s_i = np.real(np.sum(illu.conjugate() * (paz[1] @ illu), axis=0))
         s_ir = np.real(
-            refl.conjugate().T @ paz[1] @ illu
-            - np.conjugate(illu).T @ paz[1] @ refl
+            np.sum(refl.conjugate() * (paz[1] @ illu), axis=0)
+            - np.sum(illu.conjugate() * (paz[1] @ refl), axis=0)
         )
         return s_t / (s_i + s_ir), s_r / (s_i + s_ir)
 
@@ -1,7 +1,14 @@
+import collections.abc
+import hashlib
+import inspect
 import warnings
 
 import numpy as np
+import scipy.integrate as si
+import scipy.linalg as sla
+import scipy.sparse.linalg as ssl
 
+from treams._lattice import Lattice
 from treams.util import AnnotationError
 
 from acoustotreams._coreacoustics import ScalarSphericalWaveBasis as SSWB
@@ -9,12 +16,151 @@ from acoustotreams._coreacoustics import ScalarPlaneWaveBasisByComp as SPWBC
 from acoustotreams._coreacoustics import ScalarCylindricalWaveBasis as SCWB
 from acoustotreams._coreacoustics import ScalarPlaneWaveBasisByUnitVector as SPWBUV
 from acoustotreams._materialacoustics import AcousticMaterial
-from acoustotreams.coeffs import mie_acoustics, mie_acoustics_cyl
+from acoustotreams.coeffs import mie_acoustics_batch, mie_acoustics_cyl
 from acoustotreams._coreacoustics import AcousticsArray
+from acoustotreams._fmm import ClusterFMM
 import acoustotreams._operatorsacoustics as opa
 import acoustotreams.special as ats
 
 
+_CHUNKSIZE = 2 ** 20
+
+_RTOL = "rtol" if "rtol" in inspect.signature(ssl.gmres).parameters else "tol"
+"""Name of the relative tolerance of the Krylov solvers, which is "tol" for scipy<1.12."""
+
+_LEBEDEV_ORDERS = (*range(3, 33, 2), *range(35, 132, 6))
+"""Degrees of the available Lebedev quadratures."""
+
+
+class _Factorization:
+    """LU factorization of an interaction matrix.
+
+    It is created by :meth:`interaction.factorize` and
+    :meth:`latticeinteraction.factorize` of a T-matrix and allows to solve the linear
+    system for many right-hand sides without repeating the factorization. A
+    block-diagonal interaction matrix is factorized block by block.
+
+    Args:
+        mats (AcousticsArray or Sequence): Interaction matrix or its diagonal blocks.
+        tmat (AcousticsArray): (Dense) T-matrix.
+        key (tuple): Parameters, that the interaction matrix depends on.
+        blocks (Sequence, optional): Indices of the modes of each diagonal block.
+    """
+
+    def __init__(self, mats, tmat, key, blocks=None):
+        """Initialization."""
+        if blocks is None:
+            mats = [mats]
+            blocks = [np.arange(np.shape(mats[0])[-1])]
+        self._lus = [sla.lu_factor(np.asarray(mat)) for mat in mats]
+        self._blocks = blocks
+        self._ann = dict(getattr(mats[0], "ann", ({}, {}))[-1])
+        if "basis" in self._ann:
+            self._ann["basis"] = tmat.basis
+        self._tmat = tmat
+        self.key = key
+
+    def solve(self, rhs):
+        """Solve the linear system.
+
+        The result is annotated like the result of :func:`numpy.linalg.solve` with the
+        interaction matrix.
+
+        Args:
+            rhs (array_like): Right-hand side. For multiple right-hand sides, the last
+                dimension enumerates them.
+
+        Returns:
+            AcousticsArray
+        """
+        arr = np.asarray(rhs)
+        res = np.empty(arr.shape, complex)
+        for lu, idx in zip(self._lus, self._blocks):
+            res[idx] = sla.lu_solve(lu, arr[idx])
+        ann = getattr(rhs, "ann", None)
+        ann = (self._ann, *(({},) * (res.ndim - 1) if ann is None else ann[1:]))
+        restype = type(rhs) if isinstance(rhs, AcousticsArray) else AcousticsArray
+        return restype.relax(res, ann)
+
+    def tmatrix(self):
+        """T-matrix including the interaction.
+
+        Returns:
+            AcousticTMatrix or AcousticTMatrixC
+        """
+        return self.solve(self._tmat)
+
+    def det(self):
+        """Determinant of the interaction matrix.
+
+        Returns:
+            complex
+        """
+        return np.exp(self.logdet())
+
+    def logdet(self):
+        r"""Logarithm of the determinant of the interaction matrix.
+
+        The imaginary part is only defined modulo :math:`2 \pi`. For large matrices it
+        avoids the overflow of :meth:`det`, e.g., when searching for resonances.
+
+        Returns:
+            complex
+        """
+        res = 0
+        for lu, piv in self._lus:
+            swaps = np.sum(piv != np.arange(piv.size))
+            res += np.sum(np.log(np.diag(lu).astype(complex))) + 1j * np.pi * (swaps % 2)
+        return res
+
+
+def _kz_blocks(tmat):
+    """Indices of the modes of each kz, if the T-matrix does not couple different kz"""
+    if not isinstance(tmat.basis, SCWB):
+        return None
+    kzs, inv = np.unique(tmat.basis.kz, return_inverse=True)
+    if len(kzs) < 2 or np.any(np.asarray(tmat)[inv[:, None] != inv]):
+        return None
+    return [np.flatnonzero(inv == i) for i in range(len(kzs))]
+
+
+def _interaction_matrix(tmat):
+    """Interaction matrix of a (dense) T-matrix"""
+    return np.eye(tmat.shape[-1]) - tmat @ opa.Expand(tmat.basis, "singular").inv
+
+
+def _data_digest(tmat):
+    """Digest of the entries of a (block) T-matrix
+
+    It is part of the keys of the stored factorizations, so that changes of the entries
+    in place are detected.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    arrs = getattr(tmat, "tmats", None)
+    if arrs is None:
+        arrs = [tmat]
+    else:
+        hasher.update(np.asarray(tmat.tidx).tobytes())
+    for arr in arrs:
+        arr = np.ascontiguousarray(arr)
+        hasher.update(f"{arr.dtype}{arr.shape}".encode())
+        hasher.update(arr.tobytes())
+    return hasher.digest()
+
+
+def _factorize(obj, name, key, create, store=True):
+    """Factorization stored at the T-matrix, that is recreated if the key changed
+
+    Without `store`, a stored factorization is reused, but a new one is not stored.
+    """
+    fac = getattr(obj, name, None)
+    if fac is None or fac.key != key:
+        fac = create()
+        if store:
+            setattr(obj, name, fac)
+    return fac
+
+
 class _Interaction:
     def __init__(self):
         self._obj = self._objtype = None
@@ -25,13 +171,319 @@ class _Interaction:
         return self
 
     def __call__(self):
-        basis = self._obj.basis
-        return (
-             np.eye(self._obj.shape[-1]) - self._obj @ opa.Expand(basis, "singular").inv
-        )
+        return _interaction_matrix(self._obj)
+
+    def _dense(self):
+        return self._obj
+
+    def _factorize(self, store):
+        tmat = self._obj
+        key = (tmat.k0, tmat.material, tmat.basis, _data_digest(tmat))
+
+        def create():
+            dense = self._dense()
+            blocks = _kz_blocks(dense)
+            if blocks is None:
+                return _Factorization(_interaction_matrix(dense), dense, key)
+            mats = [_interaction_matrix(dense[dense.basis[idx]]) for idx in blocks]
+            return _Factorization(mats, dense, key, blocks)
+
+        return _factorize(tmat, "_interaction_lu", key, create, store)
+
+    def factorize(self):
+        """LU factorization of the interaction matrix.
+
+        The factorization is kept at the T-matrix and reused by later calls and by
+        :meth:`solve`. It is recomputed automatically, when the wave number, the
+        material, the basis, which includes the positions, or the entries of the
+        T-matrix change. For cylindrical waves, that are only coupled between equal
+        values of kz, the interaction matrix is created and factorized separately for
+        each kz.
+
+        Returns:
+            _Factorization
+        """
+        return self._factorize(True)
 
     def solve(self):
-        return np.linalg.solve(self(), self._obj)
+        """T-matrix including the interaction.
+
+        A factorization kept by :meth:`factorize` is reused, otherwise the interaction
+        matrix is factorized without keeping the factorization.
+
+        Returns:
+            AcousticTMatrix or AcousticTMatrixC
+        """
+        return self._factorize(False).tmatrix()
+
+    def solve_iterative(
+        self,
+        inc,
+        method="gmres",
+        tol=1e-8,
+        precond=None,
+        maxiter=None,
+        cache=False,
+        fmm=None,
+    ):
+        r"""Solve the multiple scattering problem iteratively.
+
+        Instead of inverting the interaction matrix, the linear system
+
+        .. math::
+
+            (\mathbb{1} - T C^{(3)}) p = T a
+
+        is solved for the expansion coefficients :math:`p` of the scattered field with
+        a Krylov subspace method, where :math:`a` are the expansion coefficients of the
+        incident field and :math:`C^{(3)}` is the matrix of translations between the
+        expansion centers. The system matrix is never created: the T-matrix is applied
+        as it is, which is cheap for :class:`AcousticBlockTMatrix` and
+        :class:`AcousticBlockTMatrixC`, and the translation matrix is created in chunks
+        of rows. These chunks are either kept between the iterations or recomputed.
+        For large clusters of spherical scatterers, the translations can be applied with
+        the fast multipole method instead, see :class:`ClusterFMM`.
+
+        The block-Jacobi preconditioner inverts the diagonal blocks of the system
+        matrix, that belong to each expansion center. Only the blocks that differ from
+        the identity are inverted. For :class:`AcousticBlockTMatrix` and
+        :class:`AcousticBlockTMatrixC`, all diagonal blocks are the identity, so the
+        preconditioner is only useful for dense T-matrices, that couple the expansion
+        centers.
+
+        Args:
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
+            method (str, optional): Either "gmres" or "bicgstab".
+            tol (float, optional): Relative tolerance of the residual.
+            precond (str, optional): Preconditioner, either "block_jacobi" or `None`.
+            maxiter (int, optional): Maximal number of iterations for each incident wave,
+                see :func:`scipy.sparse.linalg.gmres` and
+                :func:`scipy.sparse.linalg.bicgstab`.
+            cache (bool, optional): Keep the translation matrix between the iterations
+                instead of recomputing it for each product. This needs the memory of the
+                dense translation matrix.
+            fmm (bool or ClusterFMM, optional): Apply the translations with the fast
+                multipole method. If `True`, a :class:`ClusterFMM` with the default
+                settings is used.
+
+        Returns:
+            tuple[AcousticsArray, dict]: Expansion coefficients of the scattered field
+            and a dictionary with the number of iterations, the final relative
+            residuals, and the convergence status of each incident wave.
+        """
+        solvers = {"gmres": ssl.gmres, "bicgstab": ssl.bicgstab}
+        if method not in solvers:
+            raise ValueError(f"invalid method '{method}'")
+        if precond not in (None, "block_jacobi"):
+            raise ValueError(f"invalid preconditioner '{precond}'")
+        tmat = self._obj
+        basis = tmat.basis
+        dim = len(basis)
+        kwargs = {"k0": tmat.k0, "material": tmat.material}
+        step = max(1, _CHUNKSIZE // dim)
+        chunks = [slice(i, i + step) for i in range(0, dim, step)]
+        cached = {}
+        if fmm is True:
+            fmm = ClusterFMM(basis, tmat.k0, tmat.material)
+
+        def translation(chunk):
+            res = cached.get(chunk.start)
+            if res is None:
+                res = np.asarray(
+                    opa.expand(
+                        (basis[chunk], basis), ("regular", "singular"), **kwargs
+                    )
+                )
+                if cache:
+                    cached[chunk.start] = res
+            return res
+
+        def matvec(x):
+            x = np.ravel(x)
+            if fmm:
+                y = fmm @ x
+            else:
+                y = np.empty(dim, complex)
+                for chunk in chunks:
+                    y[chunk] = translation(chunk) @ x
+            return x - np.asarray(tmat @ y)
+
+        mat = ssl.LinearOperator((dim, dim), matvec=matvec, dtype=complex)
+        if precond is not None:
+            precond = _block_jacobi(tmat, translation, chunks)
+        sca = tmat.sca(inc)
+        rhs = np.asarray(sca).reshape(dim, -1)
+        res = np.empty_like(rhs, complex)
+        iterations = np.zeros(rhs.shape[1], int)
+        residuals = np.zeros(rhs.shape[1])
+        converged = np.zeros(rhs.shape[1], bool)
+        for i, b in enumerate(rhs.T):
+
+            def callback(*args, i=i):
+                iterations[i] += 1
+
+            cbkwargs = {"callback_type": "pr_norm"} if method == "gmres" else {}
+            res[:, i], info = solvers[method](
+                mat,
+                b,
+                x0=b,
+                atol=0,
+                maxiter=maxiter,
+                M=precond,
+                callback=callback,
+                **{_RTOL: tol},
+                **cbkwargs,
+            )
+            norm = np.linalg.norm(b)
+            residuals[i] = np.linalg.norm(b - matvec(res[:, i])) / (norm if norm else 1)
+            converged[i] = info == 0
+        if not np.all(converged):
+            warnings.warn(
+                f"no convergence for '{np.sum(~converged)}' of '{converged.size}' "
+                "incident waves"
+            )
+        shape = sca.shape[1:]
+        info = {
+            "iterations": iterations.reshape(shape),
+            "residuals": residuals.reshape(shape),
+            "converged": converged.reshape(shape),
+        }
+        return AcousticsArray(res.reshape(sca.shape), sca.ann), info
+
+
+def _block_jacobi(tmat, translation, chunks):
+    """Preconditioner from the inverted diagonal blocks of the interaction matrix
+
+    The translation matrix is taken in chunks of rows from `translation`, like in the
+    matrix-vector product. Blocks that equal the identity are skipped. If all blocks
+    are the identity, which is always the case for block T-matrices, `None` is
+    returned.
+    """
+    if isinstance(tmat, _BlockTMatrix):
+        # The T-matrix does not couple different centers and the diagonal blocks of
+        # the translation matrix vanish
+        return None
+    basis = tmat.basis
+    arr = np.asarray(tmat)
+    centers = [np.flatnonzero(basis.pidx == i) for i in range(len(basis.positions))]
+    centers = [idx for idx in centers if idx.size > 0]
+    products = [np.zeros((idx.size, idx.size), complex) for idx in centers]
+    for chunk in chunks:
+        trans = translation(chunk)
+        for idx, product in zip(centers, products):
+            product += arr[idx, chunk] @ trans[:, idx]
+    blocks = [
+        (idx, np.linalg.inv(np.eye(idx.size) - product))
+        for idx, product in zip(centers, products)
+        if np.any(product)
+    ]
+    if not blocks:
+        return None
+
+    def matvec(x):
+        x = np.ravel(x)
+        y = x.astype(complex)
+        for idx, inv in blocks:
+            y[idx] = inv @ x[idx]
+        return y
+
+    return ssl.LinearOperator((len(basis), len(basis)), matvec=matvec, dtype=complex)
+
+
+def _sphere_quadrature(quadrature, order):
+    """Unit vectors and weights, that sum to one, of a quadrature on the unit sphere
+
+    Lebedev quadrature falls back to Gauss-Legendre quadrature for orders above the
+    largest Lebedev rule and if scipy does not provide the rules (scipy<1.15).
+    """
+    if quadrature == "lebedev":
+        if order <= _LEBEDEV_ORDERS[-1] and hasattr(si, "lebedev_rule"):
+            order = next(n for n in _LEBEDEV_ORDERS if n >= order)
+            qvecs, weights = si.lebedev_rule(order)
+            return qvecs.T, weights / np.sum(weights)
+        quadrature = "gauss-legendre"
+    if quadrature == "gauss-legendre":
+        cos, weights = np.polynomial.legendre.leggauss(order // 2 + 1)
+        phi = 2 * np.pi * np.arange(order + 1) / (order + 1)
+        sin = np.sqrt(1 - cos * cos)[:, None]
+        qvecs = np.stack(
+            np.broadcast_arrays(sin * np.cos(phi), sin * np.sin(phi), cos[:, None]),
+            axis=-1,
+        )
+        return qvecs.reshape(-1, 3), np.repeat(weights / (2 * phi.size), phi.size)
+    raise ValueError(f"invalid quadrature '{quadrature}'")
+
+
+def _incident(inc, basis, basistype):
+    """Expansion of the incident wave(s) in the regular modes of the basis
+
+    For a two-dimensional array the last dimension enumerates the incident waves.
+    """
+    inc = AcousticsArray(inc)
+    inc_basis, modetype = inc.basis, inc.modetype
+    inc_basis = inc_basis[-2] if isinstance(inc_basis, tuple) else inc_basis
+    modetype = modetype[-2] if isinstance(modetype, tuple) else modetype
+    if not isinstance(inc_basis, basistype) or modetype == "singular":
+        return opa.Expand(basis, "regular") @ inc
+    return inc
+
+
+def _bandlimit(positions, degree, k, digits=0):
+    """Maximal degree of the modes expanded about the center of the positions
+
+    Each mode is band-limited to its degree plus k r at a distance r. For a nonzero
+    number of digits, the excess bandwidth of the truncated expansion is added.
+    """
+    radius = np.max(np.linalg.norm(positions - np.mean(positions, axis=0), axis=-1))
+    kr = np.abs(k) * radius
+    excess = 1.8 * np.power(digits, 2 / 3) * np.cbrt(kr)
+    return int(np.max(np.abs(degree)) + np.ceil(kr + excess))
+
+
+def _farfield(func, sca, shape, nmodes):
+    """Far-field amplitudes of the scattered field on a grid of directions
+
+    The function `func` maps a slice of the flattened grid to the far-field amplitudes
+    of the modes, which are created in chunks of directions.
+    """
+    sca = np.asarray(sca)
+    if sca.shape[:1] != (nmodes,):
+        raise ValueError("invalid shape of 'sca'")
+    n = int(np.prod(shape))
+    res = np.empty((n,) + sca.shape[1:], complex)
+    step = max(1, _CHUNKSIZE // max(1, nmodes))
+    for i in range(0, n, step):
+        res[i : i + step] = func(slice(i, i + step)) @ sca
+    return res.reshape(shape + sca.shape[1:])
+
+
+def _xs_orientation_average(tmat, quadrature, order, flux):
+    """Average the cross sections of plane waves over a quadrature of directions"""
+    if not tmat.material.isreal or tmat.lattice is not None or tmat.kpar is not None:
+        raise NotImplementedError
+    basis = tmat.basis
+    ks = tmat.ks
+    if order is None:
+        order = 2 * _bandlimit(basis.positions[np.unique(basis.pidx)], basis.l, ks) + 1
+    qvecs, weights = _sphere_quadrature(quadrature, order)
+    kwargs = {"k0": tmat.k0, "material": tmat.material}
+    inc = np.asarray(opa.expand((basis, SPWBUV(qvecs)), "regular", **kwargs))
+    p = np.asarray(tmat @ inc)
+    p_invksq = p / (ks * ks)
+    if basis.isglobal:
+        trans_p = p_invksq
+    else:
+        # The translation matrix is dense, so it is created in chunks of rows
+        trans_p = np.empty_like(p_invksq)
+        step = max(1, _CHUNKSIZE // len(basis))
+        for i in range(0, len(basis), step):
+            trans = opa.expand((basis[i : i + step], basis), "singular", **kwargs)
+            trans_p[i : i + step] = np.asarray(trans) @ p_invksq
+    sca = 0.5 * np.real(np.sum(p.conjugate() * trans_p, axis=0)) / flux
+    ext = -0.5 * np.real(np.sum(inc.conjugate() * p_invksq, axis=0)) / flux
+    return weights @ sca, weights @ ext
+
 
 class _LatticeInteraction:
     def __init__(self):
@@ -47,8 +499,119 @@ class _LatticeInteraction:
             lattice=lattice, kpar=kpar, eta=eta
         )
 
+    def _factorize(self, lattice, kpar, eta, store):
+        tmat = self._obj
+        key = (
+            tmat.k0,
+            tmat.material,
+            tmat.basis,
+            _data_digest(tmat),
+            Lattice(lattice),
+            tuple(np.ravel(kpar)),
+            eta,
+        )
+        return _factorize(
+            tmat,
+            "_latticeinteraction_lu",
+            key,
+            lambda: _Factorization(self(lattice, kpar, eta=eta), tmat, key),
+            store,
+        )
+
+    def factorize(self, lattice, kpar, *, eta=0):
+        """LU factorization of the lattice interaction matrix.
+
+        The factorization is kept at the T-matrix and reused by later calls and by
+        :meth:`solve`. It is recomputed automatically, when the wave number, the
+        material, the basis, the entries of the T-matrix, the lattice, the wave vector,
+        or the splitting parameter change.
+
+        Args:
+            lattice (Lattice): Lattice definition.
+            kpar (array_like): Bloch wave vector.
+            eta (float or complex, optional): Splitting parameter of the lattice sums.
+
+        Returns:
+            _Factorization
+        """
+        return self._factorize(lattice, kpar, eta, True)
+
     def solve(self, lattice, kpar, *, eta=0):
-        return np.linalg.solve(self(lattice, kpar, eta=eta), self._obj)
+        """T-matrix including the lattice interaction.
+
+        A factorization kept by :meth:`factorize` is reused, otherwise the lattice
+        interaction matrix is factorized without keeping the factorization.
+
+        Args:
+            lattice (Lattice): Lattice definition.
+            kpar (array_like): Bloch wave vector.
+            eta (float or complex, optional): Splitting parameter of the lattice sums.
+
+        Returns:
+            AcousticTMatrix or AcousticTMatrixC
+        """
+        return self._factorize(lattice, kpar, eta, False).tmatrix()
+
+
+def _sphere_layers(radii, materials):
+    """Check the radii and materials of a (multilayered) sphere."""
+    materials = [AcousticMaterial(m) for m in materials]
+    if materials[-1].isshear:
+        raise NotImplementedError
+    radii = np.atleast_1d(radii)
+    if radii.size != len(materials) - 1:
+        raise ValueError("incompatible lengths of radii and materials")
+    if materials[-1].c == 0 and materials[-1].ct == 0 and radii.size != 1:
+        raise ValueError("only one radius must be given for soft and hard spheres")
+    return radii, materials
+
+
+def _cylinder_layers(radii, materials):
+    """Check the radii and materials of a (multilayered) cylinder."""
+    materials = [AcousticMaterial(m) for m in materials]
+    if materials[-1].isshear:
+        raise NotImplementedError
+    radii = np.atleast_1d(radii)
+    if radii.size != len(materials) - 1:
+        raise ValueError("incompatible lengths of radii and materials")
+    return radii, materials
+
+
+class _TMatrixSweep(collections.abc.Sequence):
+    """Sequence of diagonal T-matrices at multiple wavenumbers.
+
+    The T-matrices are created from the coefficients on access. The diagonal of each
+    T-matrix is `coeffs[i][idx]`.
+    """
+
+    def __init__(self, cls, k0s, coeffs, basis, material, idx=None):
+        self._cls = cls
+        self.k0s = k0s
+        self.coeffs = coeffs
+        self.basis = basis
+        self.material = material
+        self._idx = slice(None) if idx is None else idx
+
+    def __len__(self):
+        return len(self.k0s)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return type(self)(
+                self._cls,
+                self.k0s[key],
+                self.coeffs[key],
+                self.basis,
+                self.material,
+                self._idx,
+            )
+        return self._cls(
+            np.diag(self.coeffs[key][self._idx]),
+            k0=self.k0s[key],
+            basis=self.basis,
+            material=self.material,
+        )
+
 
 class AcousticTMatrix(AcousticsArray):
     """Acoustic T-matrix in a spherical-wave basis.
@@ -122,25 +685,52 @@ class AcousticTMatrix(AcousticsArray):
         Returns:
             AcousticTMatrix
         """
-        materials = [AcousticMaterial(m) for m in materials]
-        if materials[-1].isshear:
-            raise NotImplementedError
-        radii = np.atleast_1d(radii)
-        if radii.size != len(materials) - 1:
-            raise ValueError("incompatible lengths of radii and materials")
-        if materials[-1].c == 0 and materials[-1].ct == 0 and radii.size != 1:
-            raise ValueError("only one radius must be given for soft and hard spheres")
-        dim = SSWB.defaultdim(lmax)
-        tmat = np.zeros((dim, dim), complex)
-        for l in range(lmax + 1):  # noqa: E741
-            miecoeffs = mie_acoustics(l, k0 * radii, *zip(*materials))
-            pos = SSWB.defaultdim(l - 1)                                                         
-            for i in range(2 * l + 1):
-                tmat[pos + i, pos + i] = miecoeffs[0]
-        return cls(tmat, k0=k0, basis=SSWB.default(lmax), material=materials[-1])
-    
+        radii, materials = _sphere_layers(radii, materials)
+        basis = SSWB.default(lmax)
+        miecoeffs = mie_acoustics_batch(
+            np.arange(lmax + 1), k0 * radii, *zip(*materials)
+        )
+        return cls(
+            np.diag(miecoeffs[basis.l]), k0=k0, basis=basis, material=materials[-1]
+        )
+
+    @classmethod
+    def sphere_sweep(cls, lmax, k0s, radii, materials):
+        """Acoustic T-matrices of a sphere for multiple wavenumbers.
+
+        The Mie coefficients for all wavenumbers and degrees are computed at once, see
+        :func:`acoustotreams.coeffs.mie_acoustics_batch`. The T-matrices are returned as
+        a sequence, that creates each T-matrix only when it is accessed. The Mie
+        coefficients themselves are available as array of shape `(len(k0s), lmax + 1)`
+        in the attribute `coeffs` of the sequence.
+
+        Please note:
+            1. :math:`c_t` of the **last** material must be zero.
+            2. For the soft and hard spheres, only one radius must be given.
+
+        Args:
+            lmax (int): Non-negative integer for the maximum degree of the T-matrices.
+            k0s (array_like): Angular wavenumbers in air.
+            radii (float or array): Radii from inside to outside of the sphere. Has units
+                of 1/k0.
+            material (list[AcousticMaterial]): The material parameters from the inside to the
+                outside. The last material in the list specifies the background medium.
+
+        Returns:
+            Sequence[AcousticTMatrix]
+        """
+        radii, materials = _sphere_layers(radii, materials)
+        k0s = np.array(k0s, ndmin=1)
+        if k0s.ndim != 1:
+            raise ValueError("'k0s' must be one-dimensional")
+        miecoeffs = mie_acoustics_batch(
+            np.arange(lmax + 1), k0s[:, None, None] * radii, *zip(*materials)
+        )
+        basis = SSWB.default(lmax)
+        return _TMatrixSweep(cls, k0s, miecoeffs, basis, materials[-1], basis.l)
+
     @classmethod
-    def cluster(cls, tmats, positions):
+    def cluster(cls, tmats, positions, blocks=False):
         r"""Block-diagonal T-matrix of multiple scatterers.
 
         Construct the initial block-diagonal T-matrix for a cluster of scatterers. The
@@ -163,10 +753,14 @@ class AcousticTMatrix(AcousticsArray):
         Args:
             tmats (Sequence): List of T-matrices.
             positions (array): The positions of all individual objects in the cluster (m).
+            blocks (bool, optional): Return a :class:`AcousticBlockTMatrix`, that stores each
+                distinct T-matrix only once, instead of the dense T-matrix.
 
         Returns:
-            AcousticTMatrix
+            AcousticTMatrix or AcousticBlockTMatrix
         """
+        if blocks:
+            return AcousticBlockTMatrix(tmats, positions)
         for tm in tmats:
             if not tm.basis.isglobal:
                 raise ValueError("global basis required")
@@ -196,7 +790,7 @@ class AcousticTMatrix(AcousticsArray):
             pidx += [j] * dim
             tres[i : i + dim, i : i + dim] = tm
             i += dim
-        basis = SSWB(zip(pidx, *modes), positions)
+        basis = SSWB._from_arrays(pidx, *modes, positions)
         return cls(tres, k0=k0, material=mat, basis=basis)
     
     @property
@@ -260,6 +854,33 @@ class AcousticTMatrix(AcousticsArray):
         res = 4 * np.pi * np.sum((re * re + im * im) / (k * k))
         return res.real
     
+    def xs_orientation_average(self, quadrature="lebedev", order=None, flux=0.5):
+        """Orientation-averaged scattering and extinction cross section (m^2).
+
+        The cross sections for incident plane waves, see :meth:`xs`, are averaged over
+        all directions of incidence, which is equal to the average over all
+        orientations of the scatterer. In contrast to :attr:`xs_ext_avg` and
+        :attr:`xs_sca_avg`, local T-matrices, for example of clusters, are possible.
+        The average is computed by a quadrature on the unit sphere. The plane waves of
+        all directions are expanded at once and the cross sections are reduced without
+        a loop over the directions.
+
+        Args:
+            quadrature (str, optional): Quadrature on the unit sphere, either "lebedev"
+                (see :func:`scipy.integrate.lebedev_rule`) or "gauss-legendre", which
+                uses Gauss-Legendre nodes in the polar angle and equidistant azimuthal
+                angles. Lebedev quadrature falls back to Gauss-Legendre quadrature for
+                orders above 131 and for scipy<1.15.
+            order (int, optional): Maximal degree of the spherical harmonics that are
+                integrated exactly. By default, it is estimated from the maximal degree
+                of the modes and the size of the cluster.
+            flux (float, optional): Input flux corresponding to the incident waves.
+
+        Returns:
+            tuple[float]
+        """
+        return _xs_orientation_average(self, quadrature, order, flux)
+
     def sca(self, inc):
         r"""Expansion coefficients of the scattered field.
 
@@ -274,17 +895,13 @@ class AcousticTMatrix(AcousticsArray):
         and :math:`T` is the T-matrix.
 
         Args:
-            inc (array_like): Incident wave or its expansion coefficients
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
 
         Returns:
             AcousticsArray
         """
-        inc = AcousticsArray(inc)
-        inc_basis = inc.basis
-        inc_basis = inc_basis[-2] if isinstance(inc_basis, tuple) else inc_basis
-        if (not isinstance(inc_basis, SSWB)) or (isinstance(inc_basis, SSWB) and inc.modetype == "singular"):
-            return self @ inc.expand(self.basis, "regular")
-        return self @ inc
+        return self @ _incident(inc, self.basis, SSWB)
     
 
     def xs(self, inc, flux=0.5):
@@ -309,7 +926,8 @@ class AcousticTMatrix(AcousticsArray):
         repeated indices are summed over. The incoming flux is :math:`I`.
 
         Args:
-            inc (array_like): Incident wave or its expansion coefficients.
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
             flux (float, optional): Input flux corresponding to the incident wave. Used for
                 the result's normalization. A plane pressure wave has the flux `0.5` in this 
                 normalization, which is used as default.
@@ -319,19 +937,106 @@ class AcousticTMatrix(AcousticsArray):
         """
         if not self.material.isreal:
             raise NotImplementedError
-        inc = AcousticsArray(inc)
-        inc_basis = inc.basis
-        inc_basis = inc_basis[-2] if isinstance(inc_basis, tuple) else inc_basis
-        if (not isinstance(inc_basis, SSWB)) or (isinstance(inc_basis, SSWB) and inc.modetype == "singular"):
-            inc = inc.expand(self.basis, "regular")
+        inc = _incident(inc, self.basis, SSWB)
         p = self @ inc
         p_invksq = p * np.power(self.ks, -2)
-        del inc.modetype
+        trans_p = np.asarray(opa.Expand(self.basis) @ p_invksq)
+        p, p_invksq = np.asarray(p), np.asarray(p_invksq)
         return (
-            0.5 * np.real(p.conjugate().T @ p_invksq.expand(p.basis)) / flux,
-            -0.5 * np.real(inc.conjugate().T @ p_invksq) / flux,
+            0.5 * np.real(np.sum(p.conjugate() * trans_p, axis=0)) / flux,
+            -0.5 * np.real(np.sum(np.asarray(inc).conjugate() * p_invksq, axis=0)) / flux,
         )
     
+    def radiation_pattern(self, sca, theta, phi):
+        r"""Far-field amplitudes of the scattered pressure field.
+
+        Far from the scatterer, the scattered field is
+        :math:`p(\boldsymbol r) \approx f(\theta, \varphi) \frac{\mathrm e^{\mathrm i k r}}{r}`.
+        The amplitudes :math:`f` on a whole grid of directions are computed at once.
+        The spherical harmonics are computed once for each direction and reused for all
+        positions of the basis and the phases of the positions are a single outer
+        product. See also :func:`~acoustotreams.pamplitudeff`.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field, see
+                :meth:`sca`. For multiple incident waves, the last dimension enumerates
+                them.
+            theta (float or array_like): Polar angles (rad).
+            phi (float or array_like): Azimuthal angles (rad).
+
+        Returns:
+            array: The leading dimensions are those of the broadcast angles.
+        """
+        if self.lattice is not None or self.kpar is not None:
+            raise NotImplementedError
+        theta, phi = np.broadcast_arrays(theta, phi)
+        unit = np.stack(
+            (np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)),
+            axis=-1,
+        ).reshape(-1, 3)
+        return _farfield(
+            lambda i: opa._ssw_farfield(unit[i], self.basis, self.ks),
+            sca,
+            theta.shape,
+            len(self.basis),
+        )
+
+    def xs_differential(self, sca, theta, phi, flux=0.5):
+        r"""Differential scattering cross section (m^2).
+
+        The differential cross section is calculated from the far-field amplitudes of
+        :meth:`radiation_pattern` as
+
+        .. math::
+
+            \frac{\mathrm d \sigma_\mathrm{sca}}{\mathrm d \Omega}
+            = \frac{|f(\theta, \varphi)|^2}{2 I},
+
+        where :math:`I` is the incoming flux.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field.
+            theta (float or array_like): Polar angles (rad).
+            phi (float or array_like): Azimuthal angles (rad).
+            flux (float, optional): Input flux corresponding to the incident wave.
+
+        Returns:
+            float array
+        """
+        if not self.material.isreal:
+            raise NotImplementedError
+        res = self.radiation_pattern(sca, theta, phi)
+        return 0.5 * (res.real * res.real + res.imag * res.imag) / flux
+
+    def xs_sca_farfield(self, sca, quadrature="lebedev", order=None, flux=0.5):
+        r"""Scattering cross section from the far field (m^2).
+
+        The differential cross section, see :meth:`xs_differential`, is integrated over
+        all directions by a quadrature on the unit sphere. For a sufficient order, it
+        equals the scattering cross section of :meth:`xs`.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field.
+            quadrature (str, optional): Quadrature on the unit sphere, either "lebedev"
+                or "gauss-legendre", see :meth:`xs_orientation_average`.
+            order (int, optional): Maximal degree of the spherical harmonics that are
+                integrated exactly. By default, it is estimated from the maximal degree
+                of the modes and the size of the cluster for a relative accuracy of
+                about ten digits.
+            flux (float, optional): Input flux corresponding to the incident wave.
+
+        Returns:
+            float or float array
+        """
+        if order is None:
+            positions = self.basis.positions[np.unique(self.basis.pidx)]
+            order = 2 * _bandlimit(positions, self.basis.l, self.ks, 10) + 1
+        qvecs, weights = _sphere_quadrature(quadrature, order)
+        theta = np.arccos(np.clip(qvecs[:, 2], -1, 1))
+        phi = np.arctan2(qvecs[:, 1], qvecs[:, 0])
+        res = self.xs_differential(sca, theta, phi, flux)
+        return 4 * np.pi * np.tensordot(weights, res, axes=1)
+
     def valid_points(self, grid, radii):
         """Points on the grid where the expansion is valid.
 
@@ -360,7 +1065,7 @@ class AcousticTMatrix(AcousticsArray):
      
     def __getitem__(self, key):
         if isinstance(key, SSWB):
-            key = np.array([self.basis.index(i) for i in key])
+            key = self.basis.indices(key)
             key = (key[:, None], key)
         return super().__getitem__(key)
     
@@ -452,25 +1157,50 @@ class AcousticTMatrixC(AcousticsArray):
         Returns:
             AcousticTMatrixC
         """
-        materials = [AcousticMaterial(m) for m in materials]
-        if materials[-1].isshear:
-            raise NotImplementedError
-        kzs = np.atleast_1d(kzs)
-        radii = np.atleast_1d(radii)
-        if radii.size != len(materials) - 1:
-            raise ValueError("incompatible lengths of radii and materials")
-        dim = SCWB.defaultdim(len(kzs), mmax)
-        tmat = np.zeros((dim, dim), complex)
-        idx = 0
-        for kz in kzs:
-            for m in range(-mmax, mmax + 1):
-                miecoeffs = mie_acoustics_cyl(kz, m, k0, radii, *zip(*materials))
-                tmat[idx, idx] = miecoeffs[0]
-                idx += 1
-        return cls(tmat, k0=k0, basis=SCWB.default(kzs, mmax), material=materials[-1])
+        radii, materials = _cylinder_layers(radii, materials)
+        basis = SCWB.default(np.atleast_1d(kzs), mmax)
+        miecoeffs = mie_acoustics_cyl(
+            basis.kz, basis.m, k0, radii, *zip(*materials)
+        )
+        return cls(np.diag(miecoeffs), k0=k0, basis=basis, material=materials[-1])
+
+    @classmethod
+    def cylinder_sweep(cls, kzs, mmax, k0s, radii, materials):
+        """Acoustic T-matrices of an infinite cylinder for multiple wavenumbers.
+
+        The coefficients for all wavenumbers and modes are computed at once, see
+        :func:`acoustotreams.coeffs.mie_acoustics_cyl`. The T-matrices are returned as
+        a sequence, that creates each T-matrix only when it is accessed. The
+        coefficients themselves are available as array of shape `(len(k0s), len(basis))`
+        in the attribute `coeffs` of the sequence.
+
+        Please note:
+            1. :math:`c_t` of **all** the materials must be zero.
+            2. For the soft and hard cylinders, only one radius must be given.
+
+        Args:
+            kzs (float or array_like): Z-components of the wave vector in the medium (rad/m).
+            mmax (int): Positive integer for the maximum order of the T-matrices.
+            k0s (array_like): Angular wavenumbers in the air.
+            radii (float): Radii from inside to outside of the cylinder. Has units of 1/k0.
+            material (list[AcousticMaterial]): The material parameters from the inside to the
+                outside. The last material in the list specifies the background medium.
+
+        Returns:
+            Sequence[AcousticTMatrixC]
+        """
+        radii, materials = _cylinder_layers(radii, materials)
+        k0s = np.array(k0s, ndmin=1)
+        if k0s.ndim != 1:
+            raise ValueError("'k0s' must be one-dimensional")
+        basis = SCWB.default(np.atleast_1d(kzs), mmax)
+        miecoeffs = mie_acoustics_cyl(
+            basis.kz, basis.m, k0s[:, None], radii, *zip(*materials)
+        )
+        return _TMatrixSweep(cls, k0s, miecoeffs, basis, materials[-1])
 
     @classmethod
-    def cluster(cls, tmats, positions):
+    def cluster(cls, tmats, positions, blocks=False):
         r"""Block-diagonal T-matrix of multiple objects.
 
         Construct the initial block-diagonal T-matrix for a cluster of objects. The
@@ -493,10 +1223,14 @@ class AcousticTMatrixC(AcousticsArray):
         Args:
             tmats (Sequence): List of T-matrices.
             positions (array): The positions of all individual objects in the cluster.
+            blocks (bool, optional): Return a :class:`AcousticBlockTMatrixC`, that stores each
+                distinct T-matrix only once, instead of the dense T-matrix.
 
         Returns:
-            AcousticTMatrixC
+            AcousticTMatrixC or AcousticBlockTMatrixC
         """
+        if blocks:
+            return AcousticBlockTMatrixC(tmats, positions)
         for tm in tmats:
             if not tm.basis.isglobal:
                 raise ValueError("global basis required")
@@ -526,7 +1260,7 @@ class AcousticTMatrixC(AcousticsArray):
             pidx += [j] * dim
             tres[i : i + dim, i : i + dim] = tm
             i += dim
-        basis = SCWB(zip(pidx, *modes), positions)
+        basis = SCWB._from_arrays(pidx, *modes, positions)
         return cls(tres, k0=k0, material=mat, basis=basis)
 
     @classmethod
@@ -621,17 +1355,13 @@ class AcousticTMatrixC(AcousticsArray):
         and :math:`T` is the T-matrix.
 
         Args:
-            inc (array_like): Incident wave or its expansion coefficients
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
 
         Returns:
             AcousticsArray
         """
-        inc = AcousticsArray(inc)
-        inc_basis = inc.basis
-        inc_basis = inc_basis[-2] if isinstance(inc_basis, tuple) else inc_basis
-        if (not isinstance(inc_basis, SCWB)) or (isinstance(inc_basis, SCWB) and inc.modetype == "singular"):
-            return self @ inc.expand(self.basis, "regular")
-        return self @ inc
+        return self @ _incident(inc, self.basis, SCWB)
         
     def xw(self, inc, flux=0.5):
         r"""Scattering and extinction cross width (m).
@@ -656,7 +1386,8 @@ class AcousticTMatrixC(AcousticsArray):
         are summed over. The flux of a plane pressure wave is :math:`I = 0.5`.
 
         Args:
-            inc (array_like): Incident wave or its expansion coefficients
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
             flux (float, optional): Ingoing flux corresponding to the incident wave. Used for
                 the result's normalization. A plane wave has the flux `0.5` in this 
                 normalization, which is used as default.
@@ -666,19 +1397,129 @@ class AcousticTMatrixC(AcousticsArray):
         """
         if not self.material.isreal:
             raise NotImplementedError
-        inc = AcousticsArray(inc)
-        inc_basis = inc.basis
-        inc_basis = inc_basis[-2] if isinstance(inc_basis, tuple) else inc_basis
-        if (not isinstance(inc_basis, SCWB)) or (isinstance(inc_basis, SCWB) and inc.modetype == "singular"):
-            inc = inc.expand(self.basis, "regular")
+        inc = _incident(inc, self.basis, SCWB)
         p = self @ inc
         p_invksq = p * np.power(self.ks, -1)
-        del inc.modetype
+        trans_p = np.asarray(opa.Expand(self.basis) @ p_invksq)
+        p, p_invksq = np.asarray(p), np.asarray(p_invksq)
         return (
-            2.0 * np.real(p.conjugate().T @ p_invksq.expand(p.basis)) / flux,
-            -2.0 * np.real(inc.conjugate().T @ p_invksq) / flux,
+            2.0 * np.real(np.sum(p.conjugate() * trans_p, axis=0)) / flux,
+            -2.0 * np.real(np.sum(np.asarray(inc).conjugate() * p_invksq, axis=0)) / flux,
+        )
+
+    def radiation_pattern(self, sca, phi, z=0):
+        r"""Far-field amplitudes of the scattered pressure field.
+
+        Far from the scatterer, each mode with the wave vector component :math:`k_z`
+        decays as :math:`\mathrm e^{\mathrm i k_\rho \rho} / \sqrt{\rho}`, so the
+        polar angle of its radiation is fixed and the scattered field is
+        :math:`p(\boldsymbol r) \approx \sum_{k_z} f_{k_z}(\varphi, z)
+        \frac{\mathrm e^{\mathrm i k_\rho \rho}}{\sqrt{\rho}}`. The sum
+        :math:`\sum_{k_z} f_{k_z}` is computed for all azimuthal angles and heights at
+        once. The projections of the positions of the basis on the directions are a
+        single outer product. See also :func:`~acoustotreams.pamplitudeff`.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field, see
+                :meth:`sca`. For multiple incident waves, the last dimension enumerates
+                them.
+            phi (float or array_like): Azimuthal angles (rad).
+            z (float or array_like, optional): Heights.
+
+        Returns:
+            array: The leading dimensions are those of the broadcast angles and heights.
+        """
+        if self.lattice is not None or self.kpar is not None:
+            raise NotImplementedError
+        phi, z = np.broadcast_arrays(phi, z)
+        phi_flat, z_flat = phi.ravel(), z.ravel()
+        return _farfield(
+            lambda i: opa._scw_farfield(
+                phi_flat[i], z_flat[i], self.basis, self.k0, self.material
+            ),
+            sca,
+            phi.shape,
+            len(self.basis),
         )
 
+    def xw_differential(self, sca, phi, flux=0.5):
+        r"""Differential scattering cross width (m).
+
+        The differential cross width is calculated from the far-field amplitudes of
+        each :math:`k_z` component, see :meth:`radiation_pattern`, as
+
+        .. math::
+
+            \frac{\mathrm d \lambda_\mathrm{sca}}{\mathrm d \varphi}
+            = \sum_{k_z} \frac{k_\rho}{k} \frac{|f_{k_z}(\varphi)|^2}{2 I},
+
+        where :math:`k` is the wavenumber in the background medium and :math:`I` is the
+        incoming flux. The interference of different :math:`k_z` components averages
+        out along the z-axis.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field.
+            phi (float or array_like): Azimuthal angles (rad).
+            flux (float, optional): Input flux corresponding to the incident wave.
+
+        Returns:
+            float array
+        """
+        if (
+            not self.material.isreal
+            or self.lattice is not None
+            or self.kpar is not None
+        ):
+            raise NotImplementedError
+        sca = np.asarray(sca)
+        if sca.shape[:1] != (len(self.basis),):
+            raise ValueError("invalid shape of 'sca'")
+        phi = np.asarray(phi)
+        phi_flat = phi.ravel()
+        res = 0
+        for kz in np.unique(self.basis.kz):
+            krho = self.material.krhos(self.k0, kz)
+            if krho.imag != 0:
+                continue
+            select = self.basis.kz == kz
+            basis = self.basis[select]
+            amp = _farfield(
+                lambda i: opa._scw_farfield(
+                    phi_flat[i], 0, basis, self.k0, self.material
+                ),
+                sca[select],
+                phi.shape,
+                len(basis),
+            )
+            res = res + (amp.real * amp.real + amp.imag * amp.imag) * krho.real
+        return 0.5 * res / (self.ks * flux)
+
+    def xw_sca_farfield(self, sca, order=None, flux=0.5):
+        r"""Scattering cross width from the far field (m).
+
+        The differential cross width, see :meth:`xw_differential`, is integrated over
+        equidistant azimuthal angles, which integrates trigonometric polynomials up to
+        the given order exactly. For a sufficient order, it equals the scattering cross
+        width of :meth:`xw`.
+
+        Args:
+            sca (array_like): Expansion coefficients of the scattered field.
+            order (int, optional): Maximal order of the trigonometric polynomials that
+                are integrated exactly. By default, it is estimated from the maximal
+                order of the modes and the size of the cluster for a relative accuracy
+                of about ten digits.
+            flux (float, optional): Input flux corresponding to the incident wave.
+
+        Returns:
+            float or float array
+        """
+        if order is None:
+            positions = self.basis.positions[np.unique(self.basis.pidx), :2]
+            order = 2 * _bandlimit(positions, self.basis.m, self.ks, 10) + 1
+        phi = 2 * np.pi * np.arange(order + 1) / (order + 1)
+        res = self.xw_differential(sca, phi, flux)
+        return 2 * np.pi * np.mean(res, axis=0)
+
     def valid_points(self, grid, radii):
         """Points on the grid where the expansion is valid.
 
@@ -707,11 +1548,308 @@ class AcousticTMatrixC(AcousticsArray):
 
     def __getitem__(self, key):
         if isinstance(key, SCWB):
-            key = np.array([self.basis.index(i) for i in key])
+            key = self.basis.indices(key)
             key = (key[:, None], key)
         return super().__getitem__(key)
 
 
+class _BlockInteraction(_Interaction):
+    def _dense(self):
+        return self._obj.dense()
+
+
+def _distinct_tmats(tmats):
+    """Distinct T-matrices and the index into them for each T-matrix of the list.
+
+    T-matrices are first compared by identity and then by their content.
+    """
+    distinct = []
+    tidx = []
+    seen = {}
+    for tm in tmats:
+        i = seen.get(id(tm))
+        if i is None:
+            for i, other in enumerate(distinct):
+                if (
+                    other.shape == tm.shape
+                    and other.basis == tm.basis
+                    and np.array_equal(np.asarray(other), np.asarray(tm))
+                ):
+                    break
+            else:
+                i = len(distinct)
+                distinct.append(tm)
+            seen[id(tm)] = i
+        tidx.append(i)
+    return distinct, np.array(tidx, int)
+
+
+class _BlockTMatrix:
+    """Block-diagonal T-matrix of a cluster of objects.
+
+    Each distinct T-matrix is stored only once. The dense T-matrix is only created on
+    request by :meth:`dense`.
+    """
+
+    _DENSE = None
+    _BASIS = None
+    _MODES = None
+    interaction = _BlockInteraction()
+    modetype = ("singular", "regular")
+    ndim = 2
+    lattice = None
+    kpar = None
+
+    def __init__(self, tmats, positions):
+        """Initialization."""
+        for tm in tmats:
+            if not tm.basis.isglobal:
+                raise ValueError("global basis required")
+        positions = np.array(positions)
+        if len(tmats) < positions.shape[0]:
+            warnings.warn("specified more positions than T-matrices")
+        elif len(tmats) > positions.shape[0]:
+            raise ValueError(
+                f"'{len(tmats)}' T-matrices "
+                f"but only '{positions.shape[0]}' positions given"
+            )
+        self.material = tmats[0].material
+        self.k0 = tmats[0].k0
+        self.tmats, self.tidx = _distinct_tmats(tmats)
+        for tm in self.tmats:
+            if tm.material != self.material:
+                raise ValueError(
+                    f"incompatible materials: '{self.material}' and '{tm.material}'"
+                )
+            if tm.k0 != self.k0:
+                raise ValueError(f"incompatible k0: '{self.k0}' and '{tm.k0}'")
+        sizes = np.array([tm.shape[0] for tm in self.tmats])[self.tidx]
+        offsets = np.cumsum(sizes) - sizes
+        self._groups = []
+        for i, tm in enumerate(self.tmats):
+            rows = offsets[self.tidx == i, None] + np.arange(tm.shape[0])
+            self._groups.append((np.asarray(tm), rows))
+        modes = [getattr(tm.basis, self._MODES) for tm in self.tmats]
+        modes = [np.concatenate([modes[i][j] for i in self.tidx]) for j in range(2)]
+        pidx = np.repeat(np.arange(self.tidx.size), sizes)
+        self.basis = self._BASIS._from_arrays(pidx, *modes, positions)
+
+    @property
+    def shape(self):
+        """Shape of the (dense) T-matrix."""
+        return len(self.basis), len(self.basis)
+
+    @property
+    def ks(self):
+        """Wave numbers (in medium)."""
+        return self.material.ks(self.k0)
+
+    @property
+    def isglobal(self):
+        """Test if the T-matrix is global."""
+        return self.basis.isglobal
+
+    def dense(self):
+        """Dense T-matrix.
+
+        Returns:
+            AcousticTMatrix or AcousticTMatrixC
+        """
+        return self._DENSE.cluster(
+            [self.tmats[i] for i in self.tidx], self.basis.positions
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.dense(), dtype=dtype)
+
+    def _ann(self, modetype):
+        return {
+            "basis": self.basis,
+            "k0": self.k0,
+            "material": self.material,
+            "modetype": modetype,
+        }
+
+    def __matmul__(self, other):
+        if isinstance(other, opa.Operator):
+            return NotImplemented
+        arr = np.asarray(other)
+        if arr.ndim == 0 or arr.shape[0] != self.shape[1]:
+            raise ValueError(f"incompatible shapes: '{self.shape}' and '{arr.shape}'")
+        res = np.zeros(arr.shape, complex)
+        for tm, rows in self._groups:
+            x = arr[rows]
+            res[rows] = (tm @ x.reshape(*rows.shape, -1)).reshape(x.shape)
+        ann = getattr(other, "ann", None)
+        if ann is None:
+            return AcousticsArray(res, (self._ann("singular"),))
+        ann[0].match(self._ann("regular"))
+        return AcousticsArray(res, (self._ann("singular"), *ann[1:]))
+
+    def __rmatmul__(self, other):
+        arr = np.asarray(other)
+        if arr.ndim == 0 or arr.shape[-1] != self.shape[0]:
+            raise ValueError(f"incompatible shapes: '{arr.shape}' and '{self.shape}'")
+        res = np.zeros(arr.shape, complex)
+        for tm, rows in self._groups:
+            res[..., rows] = arr[..., rows] @ tm
+        ann = getattr(other, "ann", None)
+        if ann is None:
+            return AcousticsArray(res, (*({},) * (arr.ndim - 1), self._ann("regular")))
+        ann[-1].match(self._ann("singular"))
+        return AcousticsArray(res, (*ann[:-1], self._ann("regular")))
+
+    def sca(self, inc):
+        """Expansion coefficients of the scattered field.
+
+        See :meth:`AcousticTMatrix.sca` and :meth:`AcousticTMatrixC.sca`.
+
+        Args:
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
+
+        Returns:
+            AcousticsArray
+        """
+        return self @ _incident(inc, self.basis, self._BASIS)
+
+    def _xs(self, inc, flux, power, factor):
+        if not self.material.isreal:
+            raise NotImplementedError
+        inc = _incident(inc, self.basis, self._BASIS)
+        p = np.asarray(self @ inc)
+        p_invks = p * np.power(self.ks, -power)
+        # The translation matrix is dense, so it is created in chunks of rows
+        sca = 0
+        step = max(1, _CHUNKSIZE // self.shape[0])
+        for i in range(0, self.shape[0], step):
+            trans = opa.expand(
+                (self.basis[i : i + step], self.basis),
+                "singular",
+                k0=self.k0,
+                material=self.material,
+            )
+            sca += np.sum(
+                p[i : i + step].conjugate() * (np.asarray(trans) @ p_invks), axis=0
+            )
+        return (
+            factor * np.real(sca) / flux,
+            -factor * np.real(np.sum(np.asarray(inc).conjugate() * p_invks, axis=0)) / flux,
+        )
+
+    def expand(self, basis):
+        """Expand the T-matrix into another basis.
+
+        Only the expansion matrices are created, the cluster T-matrix stays block-diagonal.
+
+        Args:
+            basis (ScalarBasisSet): Basis set.
+
+        Returns:
+            AcousticTMatrix or AcousticTMatrixC
+        """
+        kwargs = {"k0": self.k0, "material": self.material}
+        left = opa.expand((basis, self.basis), "singular", **kwargs)
+        right = opa.expand((self.basis, basis), "regular", **kwargs)
+        return self._DENSE(left @ (self @ right))
+
+
+class AcousticBlockTMatrix(_BlockTMatrix):
+    r"""Block-diagonal T-matrix of a cluster of scatterers in a spherical-wave basis.
+
+    This is a memory-saving alternative to :meth:`AcousticTMatrix.cluster`. Instead of
+    creating the dense matrix
+
+    .. math::
+
+        \begin{pmatrix}
+            T_0 & 0 & \dots & 0 \\
+            0 & T_1 & \ddots & \vdots \\
+            \vdots & \ddots & \ddots & 0 \\
+            0 & \dots & 0 & T_{N-1} \\
+        \end{pmatrix},
+
+    each distinct T-matrix is stored only once, see :attr:`tmats`, and referenced for
+    each scatterer by :attr:`tidx`. Matrix multiplication, :meth:`sca`, :meth:`xs`,
+    :meth:`expand`, and :attr:`interaction` operate block-wise. The dense T-matrix is
+    created by :meth:`dense`.
+
+    Args:
+        tmats (Sequence): List of T-matrices.
+        positions (array): The positions of all individual objects in the cluster (m).
+    """
+
+    _DENSE = AcousticTMatrix
+    _BASIS = SSWB
+    _MODES = "lm"
+
+    def xs(self, inc, flux=0.5):
+        """Scattering and extinction cross section (m^2).
+
+        See :meth:`AcousticTMatrix.xs`.
+
+        Args:
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
+            flux (float, optional): Input flux corresponding to the incident wave.
+
+        Returns:
+            tuple[float]
+        """
+        return self._xs(inc, flux, 2, 0.5)
+
+    def xs_orientation_average(self, quadrature="lebedev", order=None, flux=0.5):
+        """Orientation-averaged scattering and extinction cross section (m^2).
+
+        See :meth:`AcousticTMatrix.xs_orientation_average`.
+
+        Args:
+            quadrature (str, optional): Quadrature on the unit sphere, either "lebedev"
+                or "gauss-legendre".
+            order (int, optional): Maximal degree of the spherical harmonics that are
+                integrated exactly.
+            flux (float, optional): Input flux corresponding to the incident waves.
+
+        Returns:
+            tuple[float]
+        """
+        return _xs_orientation_average(self, quadrature, order, flux)
+
+
+class AcousticBlockTMatrixC(_BlockTMatrix):
+    r"""Block-diagonal T-matrix of a cluster of objects in a cylindrical-wave basis.
+
+    This is a memory-saving alternative to :meth:`AcousticTMatrixC.cluster`. Each
+    distinct T-matrix is stored only once, see :attr:`tmats`, and referenced for each
+    object by :attr:`tidx`. Matrix multiplication, :meth:`sca`, :meth:`xw`,
+    :meth:`expand`, and :attr:`interaction` operate block-wise. The dense T-matrix is
+    created by :meth:`dense`.
+
+    Args:
+        tmats (Sequence): List of T-matrices.
+        positions (array): The positions of all individual objects in the cluster.
+    """
+
+    _DENSE = AcousticTMatrixC
+    _BASIS = SCWB
+    _MODES = "zm"
+
+    def xw(self, inc, flux=0.5):
+        """Scattering and extinction cross width (m).
+
+        See :meth:`AcousticTMatrixC.xw`.
+
+        Args:
+            inc (array_like): Incident wave or its expansion coefficients. For multiple
+                incident waves, the last dimension enumerates them.
+            flux (float, optional): Ingoing flux corresponding to the incident wave.
+
+        Returns:
+            tuple[float]
+        """
+        return self._xs(inc, flux, 1, 2.0)
+
+
 def _plane_wave_partial_scalar(
     kpar, *, k0=None, basis=None, material=None, modetype=None
 ):
@@ -9,6 +9,7 @@ interface (Fresnel coefficients).
    :toctree:
 
    mie_acoustics
+   mie_acoustics_batch
    mie_acoustics_cyl
    fresnel_acoustics
 
@@ -28,6 +29,8 @@ def _mie_acoustics_iter(tm, l, x, mat_sphere, mat_env):
     :math:`(\rho, c, c_t)`, the soft medium has :math:`(\rho = 0, c = 0, c_t = 0)`,
     and the hard medium has :math:`(\rho = \infty, c = 0, c_t = 0)`.
 
+    It is the single-degree case of :func:`_mie_acoustics_iter_batch`.
+
     Note:
         The order of T-matrix entries is LL, NL, LN, and NN.
 
@@ -40,25 +43,104 @@ def _mie_acoustics_iter(tm, l, x, mat_sphere, mat_env):
 
     Returns:
         complex 4-array
-    """ 
+    """
+    return _mie_acoustics_iter_batch(tm, l, x, mat_sphere, mat_env)
+
+
+def mie_acoustics(l, x, *materials):
+    r"""Mie-scattering coefficient of degree :math:`l` for a sphere.
+
+    The sphere is defined by its size parameter :math:`k_0 r`, where :math:`r` is the
+    radius and :math:`k_0` the wavenumber in the air. A multilayered sphere is defined
+    by an array of ascending numbers that define the size parameters of the layers
+    starting from the center.
+
+    Likewise, the material parameters are given from inside to outside. These arrays
+    are expected to contain exactly one element more than the array `x`.
+
+    The result is a complex number relating the incident and scattered field coefficients,
+    both indexed identically. It is evaluated by :func:`mie_acoustics_batch` for a single
+    set of size parameters.
+
+    Note:
+        1. :math:`c_t` of the **last** material must be zero. 
+        2. For the soft and hard spheres, only one radius must be given. 
+
+    Args:
+        l (int or array_like): Degree :math:`l \geq 0`.
+        x (float or array_like): Size parameters in the array.
+        rho (array_like of float or complex): Mass density (kg/m^3). The length must be at least two.
+        c (array_like of float or complex): Longitudinal speed of sound (m/s). The length must be at least two.
+        c_t (array_like of float or complex): Transverse speed of sound (m/s). The length must be at least two.
+
+    Returns:
+        complex array
+    """
+    return list(mie_acoustics_batch(np.atleast_1d(l), x, *materials))
+
+
+def _solve_stacked(matrix, rhs, where):
+    """Solve a stack of linear systems.
+
+    The entries of the matrix and the right-hand side(s) are given as nested lists of
+    scalars or arrays. The systems are only set up and solved for the elements selected
+    by `where`.
+    """
+    n = len(matrix)
+    count = np.count_nonzero(where)
+    a = np.zeros((count, n, n), complex)
+    for i, row in enumerate(matrix):
+        for j, val in enumerate(row):
+            a[:, i, j] = np.broadcast_to(val, where.shape)[where]
+    b = np.zeros((count, n, len(rhs)), complex)
+    for k, vec in enumerate(rhs):
+        for i, val in enumerate(vec):
+            b[:, i, k] = np.broadcast_to(val, where.shape)[where]
+    return np.linalg.solve(a, b)
+
+
+def _mie_acoustics_iter_batch(tm, l, x, mat_sphere, mat_env):
+    r"""Solve the interface conditions at a spherical interface for arrays of modes.
+
+    The same six types of interfaces as in :func:`_mie_acoustics_iter` are supported.
+    All (spherical) Bessel and Hankel functions are evaluated at once and the linear
+    systems are solved as stacks.
+
+    Args:
+        tm (array_like of complex): T-matrix of the previous layer with the entries LL,
+            NL, LN, and NN in the last dimension.
+        l (int or array_like): Degree of the coefficient.
+        x (float or array_like): Size parameters in the air.
+        mat_sphere (array_like of float or complex): Material of the sphere :math:`(\rho, c, c_t)`.
+        mat_env (array_like of float or complex): Material of the medium :math:`(\rho, c, c_t)`.
+
+    Returns:
+        complex array
+    """
+    l, x = np.broadcast_arrays(l, x)  # noqa: E741
+    res = np.zeros(l.shape + (4,), complex)
+    tm = np.broadcast_to(tm, res.shape)
+    tm = [tm[..., i] for i in range(4)]
     x_env = x * AcousticMaterial().c / mat_env[1]
 
     j = treams.special.spherical_jn(l, x_env, derivative=False)
     h = treams.special.spherical_hankel1(l, x_env)
-    if (np.abs(mat_sphere[2]) == 0 
-        and np.abs(mat_sphere[1]) == 0 
+    if (np.abs(mat_sphere[2]) == 0
+        and np.abs(mat_sphere[1]) == 0
         and np.abs(mat_sphere[0]) == 0
         and np.abs(mat_env[2]) == 0):
-        return np.array([-j / h, 0, 0, 0])
+        res[..., 0] = -j / h
+        return res
 
     j_d = treams.special.spherical_jn(l, x_env, derivative=True)
     h_d = treams.special.spherical_hankel1_d(l, x_env)
-    if (np.abs(mat_sphere[2]) == 0 
-        and np.abs(mat_sphere[1]) == 0 
+    if (np.abs(mat_sphere[2]) == 0
+        and np.abs(mat_sphere[1]) == 0
         and np.abs(mat_sphere[0]) == np.inf
         and np.abs(mat_env[2]) == 0):
-        return np.array([-j_d / h_d, 0, 0, 0])
-    
+        res[..., 0] = -j_d / h_d
+        return res
+
     x_sphere = x * AcousticMaterial().c / mat_sphere[1]
     j1 = treams.special.spherical_jn(l, x_sphere, derivative=False)
     j1_d = treams.special.spherical_jn(l, x_sphere, derivative=True)
@@ -76,218 +158,185 @@ def _mie_acoustics_iter(tm, l, x, mat_sphere, mat_env):
     d1L = j
     d2L = x_env * j_d
     d3L = x_env * j_d - j
-    
-    res = np.zeros(4, complex)
+    # Solutions for l = 0 and l > 0 are obtained from systems of different sizes
+    zero = l == 0
+    nonzero = ~zero
 
     if np.abs(mat_env[2]) > 0:
         x_env_t = x * AcousticMaterial().c / mat_env[2]
         d42 = (psi**2 - 0.5 * x_env_t**2) * h - 2 * x_env * h_d
         d4L = (psi**2 - 0.5 * x_env_t**2) * j - 2 * x_env * j_d
-        if l > 0:
-            jt = treams.special.spherical_jn(l, x_env_t, derivative=False)
-            jt_d = treams.special.spherical_jn(l, x_env_t, derivative=True)
-            ht = treams.special.spherical_hankel1(l, x_env_t)
-            ht_d = treams.special.spherical_hankel1_d(l, x_env_t)
-            d21 = psi**2 * ht 
-            d31 = (psi**2 - 0.5 * x_env_t**2 - 1) * ht - x_env_t * ht_d
-            d41 = psi**2 * (x_env_t * ht_d - ht)
-            d2N = psi**2 * jt
-            d3N = (psi**2 - 0.5 * x_env_t**2 - 1) * jt - x_env_t * jt_d
-            d4N = psi**2 * (x_env_t * jt_d - jt) 
+        jt = treams.special.spherical_jn(l, x_env_t, derivative=False)
+        jt_d = treams.special.spherical_jn(l, x_env_t, derivative=True)
+        ht = treams.special.spherical_hankel1(l, x_env_t)
+        ht_d = treams.special.spherical_hankel1_d(l, x_env_t)
+        d21 = psi**2 * ht
+        d31 = (psi**2 - 0.5 * x_env_t**2 - 1) * ht - x_env_t * ht_d
+        d41 = psi**2 * (x_env_t * ht_d - ht)
+        d2N = psi**2 * jt
+        d3N = (psi**2 - 0.5 * x_env_t**2 - 1) * jt - x_env_t * jt_d
+        d4N = psi**2 * (x_env_t * jt_d - jt)
 
     if np.abs(mat_sphere[2]) > 0:
         x_sphere_t = x * AcousticMaterial().c / mat_sphere[2]
-        if l > 0:
-            j1t = treams.special.spherical_jn(l, x_sphere_t, derivative=False)
-            j1t_d = treams.special.spherical_jn(l, x_sphere_t, derivative=True)
-            h1t = treams.special.spherical_hankel1(l, x_sphere_t)
-            h1t_d = treams.special.spherical_hankel1_d(l, x_sphere_t)
-            f23 = psi**2 * h1t
-            d23 = psi**2 * j1t
+        j1t = treams.special.spherical_jn(l, x_sphere_t, derivative=False)
+        j1t_d = treams.special.spherical_jn(l, x_sphere_t, derivative=True)
+        h1t = treams.special.spherical_hankel1(l, x_sphere_t)
+        h1t_d = treams.special.spherical_hankel1_d(l, x_sphere_t)
+        f23 = psi**2 * h1t
+        d23 = psi**2 * j1t
 
     if np.abs(mat_sphere[2]) == 0 and np.abs(mat_env[2]) == 0:
-        delta = x_sphere * mat_env[0] / (x_env * mat_sphere[0]) 
-        matrix = np.zeros((2, 2), complex)
-        rhs = np.zeros(2, complex)
-        matrix[0][0] = -d12
-        matrix[0][1] = (d14 + tm[0] * f14) / delta
-        rhs[0] = d1L
-        matrix[1][0] = -d22 / x_env
-        matrix[1][1] = (d24 + tm[0] * f24) / x_sphere
-        rhs[1] = d2L / x_env
-        sol = np.linalg.solve(matrix, rhs)
-        res[0] = sol[0]
+        delta = x_sphere * mat_env[0] / (x_env * mat_sphere[0])
+        sol = _solve_stacked(
+            [
+                [-d12, (d14 + tm[0] * f14) / delta],
+                [-d22 / x_env, (d24 + tm[0] * f24) / x_sphere],
+            ],
+            [[d1L, d2L / x_env]],
+            np.ones(l.shape, bool),
+        )
+        res[..., 0] = sol[:, 0, 0].reshape(l.shape)
         return res
     elif np.abs(mat_sphere[2]) == 0 and np.abs(mat_env[2]) > 0:
-        d44 = -mat_sphere[0] / mat_env[0] * 0.5 * x_env_t**2 * j1 
-        f44 = -mat_sphere[0] / mat_env[0] * 0.5 * x_env_t**2 * h1 
-        if l == 0:
-            matrix = np.zeros((2, 2), complex)
-            rhs = np.zeros(2, complex)
-            matrix[0][0] = -d22 / x_env
-            matrix[0][1] = (d24 + tm[0] * f24) / x_sphere
-            matrix[1][0] = -d42 / x_env
-            matrix[1][1] = (d44 + tm[0] * f44) / x_sphere
-            rhs[0] = d2L / x_env
-            rhs[1] = d4L / x_env
-            sol = np.linalg.solve(matrix, rhs)
-            res[0] = sol[0]
-            return res
-        elif l > 0:
-            matrix = np.zeros((3, 3), complex)
-            rhs_L = np.zeros(3, complex)
-            rhs_N = np.zeros(3, complex)
-            matrix[0][0] = d21 / x_env_t
-            matrix[0][1] = -psi * d22 / x_env
-            matrix[0][2] = psi * (d24 + tm[0] * f24) / x_sphere
-            rhs_L[0] = psi * d2L / x_env
-            rhs_L[1] = psi * d3L / x_env
-            rhs_L[2] = psi * d4L / x_env
-            matrix[1][0] = d31 / x_env_t
-            matrix[1][1] = -psi * d32 / x_env
-            matrix[2][0] = d41 / x_env_t
-            matrix[2][1] = -psi * d42 / x_env
-            matrix[2][2] = psi * (d44 + tm[0] * f44) / x_sphere
-            sol_L = np.linalg.solve(matrix, rhs_L)
-            res[0] = sol_L[1]
-            res[1] = sol_L[0]
-            rhs_N[0] = -d2N / x_env_t
-            rhs_N[1] = -d3N / x_env_t
-            rhs_N[2] = -d4N / x_env_t
-            sol_N = np.linalg.solve(matrix, rhs_N)
-            res[2] = sol_N[1]
-            res[3] = sol_N[0]
-            return res
+        d44 = -mat_sphere[0] / mat_env[0] * 0.5 * x_env_t**2 * j1
+        f44 = -mat_sphere[0] / mat_env[0] * 0.5 * x_env_t**2 * h1
+        if np.any(zero):
+            sol = _solve_stacked(
+                [
+                    [-d22 / x_env, (d24 + tm[0] * f24) / x_sphere],
+                    [-d42 / x_env, (d44 + tm[0] * f44) / x_sphere],
+                ],
+                [[d2L / x_env, d4L / x_env]],
+                zero,
+            )
+            res[zero, 0] = sol[:, 0, 0]
+        if np.any(nonzero):
+            sol = _solve_stacked(
+                [
+                    [d21 / x_env_t, -psi * d22 / x_env, psi * (d24 + tm[0] * f24) / x_sphere],
+                    [d31 / x_env_t, -psi * d32 / x_env, 0],
+                    [d41 / x_env_t, -psi * d42 / x_env, psi * (d44 + tm[0] * f44) / x_sphere],
+                ],
+                [
+                    [psi * d2L / x_env, psi * d3L / x_env, psi * d4L / x_env],
+                    [-d2N / x_env_t, -d3N / x_env_t, -d4N / x_env_t],
+                ],
+                nonzero,
+            )
+            res[nonzero] = sol[:, [1, 0, 1, 0], [0, 0, 1, 1]]
+        return res
     elif np.abs(mat_sphere[2]) > 0 and np.abs(mat_env[2]) == 0:
         d42 = -mat_env[0]/mat_sphere[0] * x_sphere_t**2 * 0.5 * h
         d44 = (l * (l + 1) - 0.5 * x_sphere_t**2) * j1 - 2 * x_sphere * j1_d
         f44 = (l * (l + 1) - 0.5 * x_sphere_t**2) * h1 - 2 * x_sphere * h1_d
         d4L = -mat_env[0]/mat_sphere[0] * 0.5 * x_sphere_t**2 * j
-        if l == 0:
-            matrix = np.zeros((2, 2), complex)
-            rhs = np.zeros(2, complex)
-            matrix[0][0] = -d22 / x_env
-            matrix[0][1] = (d24 + tm[0] * f24) / x_sphere
-            matrix[1][0] = -d42 / x_env
-            matrix[1][1] = (d44 + tm[0] * f44) / x_sphere
-            rhs[0] = d2L / x_env
-            rhs[1] = d4L / x_env
-            sol = np.linalg.solve(matrix, rhs)
-            res[0] = sol[0]
-            return res
-        elif l > 0:
+        if np.any(zero):
+            sol = _solve_stacked(
+                [
+                    [-d22 / x_env, (d24 + tm[0] * f24) / x_sphere],
+                    [-d42 / x_env, (d44 + tm[0] * f44) / x_sphere],
+                ],
+                [[d2L / x_env, d4L / x_env]],
+                zero,
+            )
+            res[zero, 0] = sol[:, 0, 0]
+        if np.any(nonzero):
             d33 = (l * (l + 1) - 0.5 * x_sphere_t**2 - 1) * j1t - x_sphere_t * j1t_d
             d43 = l * (l + 1) * (x_sphere_t * j1t_d - j1t)
             f33 = (psi**2 - 0.5 * x_sphere_t**2 - 1) * h1t - x_sphere_t * h1t_d
-            f43 = psi**2 * (x_sphere_t * h1t_d - h1t)  
-            d34 = x_sphere * j1_d - j1    
-            f34 = x_sphere * h1_d - h1 
-            matrix = np.zeros((3, 3), complex)
-            rhs = np.zeros(3, complex)
-            matrix[0][0] = -psi * d22 / x_env
-            matrix[2][0] = -psi * d42 / x_env
-            matrix[0][1] = -d23 / x_sphere_t - f23 * tm[3] / x_sphere_t + psi * tm[2] * f24 / x_sphere
-            matrix[1][1] = -d33 / x_sphere_t - f33 * tm[3] / x_sphere_t + psi * tm[2] * f34 / x_sphere
-            matrix[2][1] = -d43 / x_sphere_t - f43 * tm[3] / x_sphere_t + psi * tm[2] * f44 / x_sphere
-            matrix[0][2] = psi * (d24 + tm[0] * f24) / x_sphere - tm[1] * f23 / x_sphere_t
-            matrix[1][2] = psi * (d34 + tm[0] * f34) / x_sphere - tm[1] * f33 / x_sphere_t
-            matrix[2][2] = psi * (d44 + tm[0] * f44) / x_sphere - tm[1] * f43 / x_sphere_t 
-            rhs[0] = psi * d2L / x_env
-            rhs[2] = psi * d4L / x_env
-            sol = np.linalg.solve(matrix, rhs)
-            res[0] = sol[0]
-            return res 
+            f43 = psi**2 * (x_sphere_t * h1t_d - h1t)
+            d34 = x_sphere * j1_d - j1
+            f34 = x_sphere * h1_d - h1
+            sol = _solve_stacked(
+                [
+                    [
+                        -psi * d22 / x_env,
+                        -d23 / x_sphere_t - f23 * tm[3] / x_sphere_t + psi * tm[2] * f24 / x_sphere,
+                        psi * (d24 + tm[0] * f24) / x_sphere - tm[1] * f23 / x_sphere_t,
+                    ],
+                    [
+                        0,
+                        -d33 / x_sphere_t - f33 * tm[3] / x_sphere_t + psi * tm[2] * f34 / x_sphere,
+                        psi * (d34 + tm[0] * f34) / x_sphere - tm[1] * f33 / x_sphere_t,
+                    ],
+                    [
+                        -psi * d42 / x_env,
+                        -d43 / x_sphere_t - f43 * tm[3] / x_sphere_t + psi * tm[2] * f44 / x_sphere,
+                        psi * (d44 + tm[0] * f44) / x_sphere - tm[1] * f43 / x_sphere_t,
+                    ],
+                ],
+                [[psi * d2L / x_env, 0, psi * d4L / x_env]],
+                nonzero,
+            )
+            res[nonzero, 0] = sol[:, 0, 0]
+        return res
     elif np.abs(mat_sphere[2]) > 0 and np.abs(mat_env[2]) > 0:
-        d44 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-               * ((psi**2 - 0.5 * x_sphere_t**2) * j1 - 2 * x_sphere * j1_d))
-        f44 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-               * ((psi**2 - 0.5 * x_sphere_t**2) * h1 - 2 * x_sphere * h1_d))
-        if l == 0:
-            matrix = np.zeros((2, 2), complex)
-            rhs_L = np.zeros(2, complex)
-            matrix[0][0] = -d22 / x_env
-            matrix[1][0] = -d42 / x_env
-            matrix[0][1] = (d24 + tm[0] * f24) / x_sphere
-            matrix[1][1] = (d44 + tm[0] * f44) / x_sphere
-            rhs_L[0] = d2L / x_env
-            rhs_L[1] = d4L / x_env
-            sol_L = np.linalg.solve(matrix, rhs_L)
-            res[0] = sol_L[0]
-            return res
-        elif l > 0:
+        ratio = mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2
+        d44 = ratio * ((psi**2 - 0.5 * x_sphere_t**2) * j1 - 2 * x_sphere * j1_d)
+        f44 = ratio * ((psi**2 - 0.5 * x_sphere_t**2) * h1 - 2 * x_sphere * h1_d)
+        if np.any(zero):
+            sol = _solve_stacked(
+                [
+                    [-d22 / x_env, (d24 + tm[0] * f24) / x_sphere],
+                    [-d42 / x_env, (d44 + tm[0] * f44) / x_sphere],
+                ],
+                [[d2L / x_env, d4L / x_env]],
+                zero,
+            )
+            res[zero, 0] = sol[:, 0, 0]
+        if np.any(nonzero):
             d11 = x_env_t * ht_d + ht
             d13 = x_sphere_t * j1t_d + j1t
-            d33 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-                * ((psi**2 - 0.5 * x_sphere_t**2 - 1) * j1t - x_sphere_t * j1t_d))
-            d43 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2  * psi**2 
-                * (x_sphere_t * j1t_d - j1t))
-            d34 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-                * (x_sphere * j1_d - j1))
-            f34 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-               * (x_sphere * h1_d - h1))
+            d33 = ratio * ((psi**2 - 0.5 * x_sphere_t**2 - 1) * j1t - x_sphere_t * j1t_d)
+            d43 = ratio * psi**2 * (x_sphere_t * j1t_d - j1t)
+            d34 = ratio * (x_sphere * j1_d - j1)
+            f34 = ratio * (x_sphere * h1_d - h1)
             f13 = x_sphere_t * h1t_d + h1t
-            f33 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2 
-               * ((psi**2 - 0.5 * x_sphere_t**2 - 1) * h1t - x_sphere_t * h1t_d))
-            f43 = (mat_sphere[0]/mat_env[0] * (x_env_t/x_sphere_t)**2  * psi**2 
-               * (x_sphere_t * h1t_d - h1t))
+            f33 = ratio * ((psi**2 - 0.5 * x_sphere_t**2 - 1) * h1t - x_sphere_t * h1t_d)
+            f43 = ratio * psi**2 * (x_sphere_t * h1t_d - h1t)
             d1N = x_env_t * jt_d + jt
-            matrix = np.zeros((4, 4), complex)
-            rhs_L = np.zeros(4, complex)
-            rhs_N = np.zeros(4, complex)
-            matrix[0][0] = d11 / x_env_t
-            matrix[1][0] = d21 / x_env_t
-            matrix[2][0] = d31 / x_env_t
-            matrix[3][0] = d41 / x_env_t
-            matrix[0][1] = -psi * d12 / x_env
-            matrix[1][1] = -psi * d22 / x_env
-            matrix[2][1] = -psi * d32 / x_env
-            matrix[3][1] = -psi * d42 / x_env
-            matrix[0][2] = -d13 / x_sphere_t - tm[3] * f13 / x_sphere_t + psi * tm[2] * f14 / x_sphere
-            matrix[1][2] = -d23 / x_sphere_t - tm[3] * f23 / x_sphere_t + psi * tm[2] * f24 / x_sphere
-            matrix[2][2] = -d33 / x_sphere_t - tm[3] * f33 / x_sphere_t + psi * tm[2] * f34 / x_sphere
-            matrix[3][2] = -d43 / x_sphere_t - tm[3] * f43 / x_sphere_t + psi * tm[2] * f44 / x_sphere
-            matrix[0][3] = psi * (d14 + tm[0] * f14) / x_sphere - tm[1] * f13 / x_sphere_t 
-            matrix[1][3] = psi * (d24 + tm[0] * f24) / x_sphere - tm[1] * f23 / x_sphere_t 
-            matrix[2][3] = psi * (d34 + tm[0] * f34) / x_sphere - tm[1] * f33 / x_sphere_t 
-            matrix[3][3] = psi * (d44 + tm[0] * f44) / x_sphere - tm[1] * f43 / x_sphere_t 
-            rhs_L[0] = psi * d1L / x_env
-            rhs_L[1] = psi * d2L / x_env
-            rhs_L[2] = psi * d3L / x_env
-            rhs_L[3] = psi * d4L / x_env
-            rhs_N[0] = -d1N / x_env_t
-            rhs_N[1] = -d2N / x_env_t
-            rhs_N[2] = -d3N / x_env_t
-            rhs_N[3] = -d4N / x_env_t
-            sol_N = np.linalg.solve(matrix, rhs_N)
-            res[2] = sol_N[1]
-            res[3] = sol_N[0] 
-            sol_L = np.linalg.solve(matrix, rhs_L)
-            res[0] = sol_L[1]
-            res[1] = sol_L[0] 
-            return res
-    return res 
+            ds = [(d11, d12, d13, d14, f13, f14), (d21, d22, d23, d24, f23, f24),
+                  (d31, d32, d33, d34, f33, f34), (d41, d42, d43, d44, f43, f44)]
+            sol = _solve_stacked(
+                [
+                    [
+                        a1 / x_env_t,
+                        -psi * a2 / x_env,
+                        -a3 / x_sphere_t - tm[3] * b3 / x_sphere_t + psi * tm[2] * b4 / x_sphere,
+                        psi * (a4 + tm[0] * b4) / x_sphere - tm[1] * b3 / x_sphere_t,
+                    ]
+                    for a1, a2, a3, a4, b3, b4 in ds
+                ],
+                [
+                    [psi * d1L / x_env, psi * d2L / x_env, psi * d3L / x_env, psi * d4L / x_env],
+                    [-d1N / x_env_t, -d2N / x_env_t, -d3N / x_env_t, -d4N / x_env_t],
+                ],
+                nonzero,
+            )
+            res[nonzero] = sol[:, [1, 0, 1, 0], [0, 0, 1, 1]]
+        return res
+    return res
 
-def mie_acoustics(l, x, *materials):
-    r"""Mie-scattering coefficient of degree :math:`l` for a sphere.
 
-    The sphere is defined by its size parameter :math:`k_0 r`, where :math:`r` is the
-    radius and :math:`k_0` the wavenumber in the air. A multilayered sphere is defined
-    by an array of ascending numbers that define the size parameters of the layers
-    starting from the center.
+def mie_acoustics_batch(l, x, *materials):
+    r"""Mie-scattering coefficients of a sphere for arrays of degrees and size parameters.
 
-    Likewise, the material parameters are given from inside to outside. These arrays
-    are expected to contain exactly one element more than the array `x`.
-
-    The result is a complex number relating the incident and scattered field coefficients,
-    both indexed identically.
+    This function gives the same results as :func:`mie_acoustics` but evaluates all
+    degrees and, e.g., all frequencies of a spectrum at once. The last dimension of `x`
+    contains the size parameters of the layers from inside to outside, the remaining
+    dimensions are broadcast against the degrees `l`. For example, the coefficients for
+    a spectrum with wavenumbers `k0s` are obtained with `x = k0s[:, None, None] * radii`
+    and `l = np.arange(lmax + 1)` as an array of shape `(len(k0s), lmax + 1)`.
 
     Note:
-        1. :math:`c_t` of the **last** material must be zero. 
-        2. For the soft and hard spheres, only one radius must be given. 
+        1. :math:`c_t` of the **last** material must be zero.
+        2. For the soft and hard spheres, only one radius must be given.
 
     Args:
         l (int or array_like): Degree :math:`l \geq 0`.
-        x (float or array_like): Size parameters in the array.
+        x (float or array_like): Size parameters in the air with the layers in the last
+            dimension.
         rho (array_like of float or complex): Mass density (kg/m^3). The length must be at least two.
         c (array_like of float or complex): Longitudinal speed of sound (m/s). The length must be at least two.
         c_t (array_like of float or complex): Transverse speed of sound (m/s). The length must be at least two.
@@ -295,21 +344,17 @@ def mie_acoustics(l, x, *materials):
     Returns:
         complex array
     """
-    
     mat = list(zip(*materials))
-    l = np.atleast_1d(l)
-    x = np.atleast_1d(x)
-    res = []
-    for j in l:
-        mie = np.zeros(4, complex)
-        for i in range(len(list(mat)) - 1):
-            mat_sphere, mat_env = mat[i], mat[i + 1]
-            mie = _mie_acoustics_iter(mie, j, x[i], mat_sphere, mat_env)
-        res.append(mie[0])
-    return res
+    x = np.array(x, ndmin=1)
+    shape = np.broadcast_shapes(np.shape(l), x.shape[:-1])
+    mie = np.zeros(shape + (4,), complex)
+    for i in range(len(mat) - 1):
+        mie = _mie_acoustics_iter_batch(mie, l, x[..., i], mat[i], mat[i + 1])
+    return mie[..., 0]
+
 
 def _mie_acoustics_iter_cyl(tm, kz, m, k0, radius, mat_cyl, mat_env):
-    """Solve a matrix for the interface conditions at a cylindrical interface.
+    r"""Solve the interface conditions at a cylindrical interface.
 
     Three types of interfaces are supported: fluid-fluid, soft-fluid, and hard-fluid.
 
@@ -317,19 +362,21 @@ def _mie_acoustics_iter_cyl(tm, kz, m, k0, radius, mat_cyl, mat_env):
     the soft medium has :math:`(\rho = 0, c = 0, c_t = 0)`,
     and the hard medium has :math:`(\rho = \infty, c = 0, c_t = 0)`.
 
+    All parameters except the materials can be arrays, that are broadcast against each
+    other. The 2x2 linear system of the fluid-fluid interface is solved in closed form.
+
     Args:
-        tm (complex): T-matrix of the previous layer.
-        kz (float): Z-component of the wave vector.
-        m (int): Order.
-        k0 (float): Angular wavenumber in the air.
-        radius (float): Radius of the cylinder.
+        tm (complex or array_like): T-matrix of the previous layer.
+        kz (float or array_like): Z-component of the wave vector.
+        m (int or array_like): Order.
+        k0 (float or array_like): Angular wavenumber in the air.
+        radius (float or array_like): Radius of the cylinder.
         mat_cyl (array_like of float or complex): Material of the cylinder :math:`(\rho, c, c_t)`.
         mat_env (array_like of float or complex): Material of the medium :math:`(\rho, c, c_t)`.
 
     Returns:
-        complex
-    """ 
-
+        complex or complex array
+    """
     k_env = k0 * AcousticMaterial().c / mat_env[1] + 0j
     krho_env = np.sqrt(k_env * k_env - kz * kz)
     x_env = krho_env * radius
@@ -337,7 +384,6 @@ def _mie_acoustics_iter_cyl(tm, kz, m, k0, radius, mat_cyl, mat_env):
     j_d = treams.special.jv_d(m, x_env)
     h = treams.special.hankel1(m, x_env)
     h_d = treams.special.hankel1_d(m, x_env)
-    res = 0
     if np.abs(mat_cyl[2]) == 0 and np.abs(mat_cyl[1]) == 0 and np.abs(mat_cyl[0]) == np.inf:
         return -j_d / h_d
     elif np.abs(mat_cyl[2]) == 0 and np.abs(mat_cyl[1]) == 0 and np.abs(mat_cyl[0]) == 0:
@@ -350,21 +396,14 @@ def _mie_acoustics_iter_cyl(tm, kz, m, k0, radius, mat_cyl, mat_env):
         j1_d = treams.special.jv_d(m, x_cyl)
         h1 = treams.special.hankel1(m, x_cyl)
         h1_d = treams.special.hankel1_d(m, x_cyl)
-        matrix = np.zeros((2, 2), complex)
-        rhs = np.zeros(2, complex)
-        rhs[0] = x_env * j_d
-        rhs[1] = j
+        # Cramer's rule for the second component of the solution of
+        # [[aL, al], [cL, cl]] @ sol = [x_env * j_d, j]
         aL = x_cyl * (j1_d + tm * h1_d) * mat_env[0]/mat_cyl[0]
         cL = j1 + tm * h1
         al = -x_env * h_d
         cl = -h
-        matrix[0][0] = aL
-        matrix[1][0] = cL
-        matrix[0][1] = al
-        matrix[1][1] = cl
-        res = np.linalg.solve(matrix, rhs)
-        return res[1]
-    return res
+        return (aL * j - cL * x_env * j_d) / (aL * cl - al * cL)
+    return np.zeros_like(x_env)
 
 
 def mie_acoustics_cyl(kz, m, k0, radii, *materials):
@@ -380,14 +419,19 @@ def mie_acoustics_cyl(kz, m, k0, radii, *materials):
     The result is a complex number relating the incident and scattered field 
     coefficients, both indexed identically.
 
+    The z-components of the wave vector, the orders, and the wavenumbers can be arrays,
+    that are broadcast against each other, e.g., to compute the coefficients of a
+    whole spectrum at once. The radii of the layers are given in the last dimension of
+    `radii`, the remaining dimensions are broadcast against the other parameters.
+
     Note:
         1. :math:`c_t` of **all** the materials must be zero. 
         2. For the soft and hard infinite cylinders, only one radius must be given. 
 
     Args:
-        kz (float): Z-component of the wave vector in the medium.
+        kz (float or array_like): Z-component of the wave vector in the medium.
         m (int or array_like): Order.
-        k0 (float or complex): Angular wavenumber in the air. Has units of :math:`kz`.
+        k0 (float or complex or array_like): Angular wavenumber in the air. Has units of :math:`kz`.
         radii (float or array_like): Radii of the layers. Has units of :math:`1/kz`.
         rho (float or complex or array_like): Mass density (kg/m^3).
         c (float or complex or array_like): Longitudinal speed of sound (m/s).
@@ -400,14 +444,12 @@ def mie_acoustics_cyl(kz, m, k0, radii, *materials):
     mat = list(zip(*materials))
     radii = np.atleast_1d(radii)
     m = np.atleast_1d(m)
-    res = []
-    for j in m:
-        mie = 0
-        for i in range(len(list(mat)) - 1):
-            mat_cyl, mat_env = mat[i], mat[i + 1]
-            mie = _mie_acoustics_iter_cyl(mie, kz, j, k0, radii[i], mat_cyl, mat_env)
-        res.append(mie)
-    return res
+    shape = np.broadcast_shapes(np.shape(kz), m.shape, np.shape(k0), radii.shape[:-1])
+    mie = 0
+    for i in range(len(mat) - 1):
+        mat_cyl, mat_env = mat[i], mat[i + 1]
+        mie = _mie_acoustics_iter_cyl(mie, kz, m, k0, radii[..., i], mat_cyl, mat_env)
+    return np.broadcast_to(mie, shape).astype(complex)
 
 def fresnel_acoustics(kzs, rhos):
     r"""Fresnel coefficients for a planar interface.
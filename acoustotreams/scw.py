@@ -17,6 +17,43 @@ import numpy as np
 from treams import lattice
 import scipy.special as ss
 
+from acoustotreams.ssw import _distinct
+
+
+def _translate_array(kz, mu, qz, m, krr, phi, z, singular=True, where=True):
+    """Array-based evaluation of translation coefficients for cylindrical modes.
+
+    Only the coefficients between modes with equal z-components of the wave vector are
+    computed, all others vanish. The Bessel or Hankel function and the phase factor are
+    evaluated once for each distinct combination of the order difference and the
+    translation.
+    """
+    kz, mu, qz, m, krr, phi, z, where = np.broadcast_arrays(
+        kz, mu, qz, m, krr, phi, z, where
+    )
+    res = np.zeros(kz.shape, complex)
+    compute = where.astype(bool) & (kz == qz)
+    if singular:
+        compute &= (np.abs(krr) >= 1e-16) | (np.abs(z) >= 1e-16)
+    if not np.any(compute):
+        return res[()]
+    # The translations are made distinct first, then combined with the order difference
+    krr, phi, kzz, vidx = _distinct(
+        np.asarray(krr[compute], complex), phi[compute], kz[compute] * z[compute]
+    )
+    diff = np.asarray(m[compute] - mu[compute], int)
+    diffs, didx = np.unique(diff, return_inverse=True)
+    pairs, idx = np.unique(didx * len(krr) + vidx, return_inverse=True)
+    didx, vidx = np.divmod(pairs, len(krr))
+    diff, krr, phi, kzz = diffs[didx], krr[vidx], phi[vidx], kzz[vidx]
+    if singular:
+        vals = sc.hankel1(diff, krr)
+    else:
+        vals = sc.jv(diff, krr)
+    vals *= np.exp(1j * (diff * phi + kzz))
+    res[compute] = vals[idx]
+    return res[()]
+
 
 def _translate_s(kz, mu, qz, m, krr, phi, z, *args, **kwargs):
     if abs(krr) < 1e-16 and abs(z) < 1e-16:
@@ -31,8 +68,10 @@ _translate_s = np.vectorize(_translate_s)
 _translate_r = np.vectorize(_translate_r)
 
 
-def translate(kz, mu, qz, m, krr, phi, z, singular=True, *args, **kwargs):
-    """translate(kz, mu, qz, m, krr, phi, z, singular=True)
+def translate(
+    kz, mu, qz, m, krr, phi, z, singular=True, *args, method="array", **kwargs
+):
+    """translate(kz, mu, qz, m, krr, phi, z, singular=True, method="array")
     
     Translation coefficients for scalar cylindrical modes.
 
@@ -40,6 +79,12 @@ def translate(kz, mu, qz, m, krr, phi, z, singular=True, *args, **kwargs):
     and :func:`acoustotreams.scw.tl_scw_r` or combinations thereof for the specified modes and
     basis.
 
+    The default method "array" only evaluates the coefficients between modes with equal
+    z-components of the wave vector and computes each Bessel or Hankel function once
+    for each distinct combination of the order difference and the translation. The
+    method "vectorize" calls :func:`acoustotreams.special.tl_scw` and
+    :func:`acoustotreams.special.tl_scw_r` for each element separately.
+
     Args:
         kz (float or array_like): Z-component of the wave vector of output modes.
         mu (int or array_like): Order of output modes.
@@ -51,10 +96,16 @@ def translate(kz, mu, qz, m, krr, phi, z, singular=True, *args, **kwargs):
         z (float or array_like): Z-coordinate. Has units of 1/kz.
         singular (bool, optional): If true, singular translation coefficients are used,
             else regular coefficients. Defaults to ``True``.
+        method (str, optional): Implementation used for the evaluation, either "array"
+            or "vectorize".
 
     Returns:
         complex or array_like
     """
+    if method == "array":
+        return _translate_array(kz, mu, qz, m, krr, phi, z, singular, *args, **kwargs)
+    if method != "vectorize":
+        raise ValueError(f"invalid method '{method}'")
     if singular:
         return _translate_s(kz, mu, qz, m, krr, phi, z, *args, **kwargs)
     return _translate_r(kz, mu, qz, m, krr, phi, z, *args, **kwargs)
@@ -21,6 +21,8 @@ Spherical waves
    vsw_rL
    tl_ssw
    tl_ssw_r
+   sph_harm_table
+   spherical_bessel_table
 
 Cylindrical waves
 -----------------
@@ -47,6 +49,16 @@ Plane waves
    vpw_L
 
 
+Coefficient tables
+------------------
+
+.. autosummary::
+   :toctree: generated/
+
+   CoefficientStore
+   coefficients
+
+
 Those functions are just imported from Scipy. So, one only needs to import this
 package within acoustotreams.
 
@@ -198,4 +210,8 @@ from treams.special import(   # noqa: F401
     vpol2car,
     )
 
+from acoustotreams.special._coefficients import (  # noqa: F401
+    CoefficientStore,
+    coefficients,
+)
 from acoustotreams.special._wavesacoustics import *  # noqa: F401
\ No newline at end of file
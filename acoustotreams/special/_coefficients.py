@@ -0,0 +1,260 @@
+"""Tables of coupling coefficients for scalar spherical waves"""
+
+import collections
+import os
+import threading
+
+import numpy as np
+import treams.special as sc
+
+
+def _modes(lmax):
+    """Degrees and orders of all modes up to `lmax` ordered by `l * (l + 1) + m`"""
+    l = np.arange(lmax + 1)  # noqa: E741
+    return (
+        np.repeat(l, 2 * l + 1),
+        np.concatenate([np.arange(-i, i + 1) for i in l]),
+    )
+
+
+def _indices(lmax):
+    """Degrees and orders of output and input modes with the summation index"""
+    l, m = _modes(lmax)  # noqa: E741
+    lambda_, mu = l[:, None, None], m[:, None, None]
+    l, m = l[:, None], m[:, None]  # noqa: E741
+    p = lambda_ + l - 2 * np.arange(lmax + 1)
+    valid = p >= np.maximum(np.abs(lambda_ - l), np.abs(m - mu))
+    return lambda_, mu, l, m, p, valid
+
+
+def _build_tl_ssw(lmax):
+    """Coupling coefficients of :func:`acoustotreams.special.tl_ssw`"""
+    lambda_, mu, l, m, p, valid = _indices(lmax)  # noqa: E741
+    res = np.zeros(p.shape, complex)
+    sc._tl_vsw_helper(l, m, lambda_, -mu, p, p, where=valid, out=res)
+    return res
+
+
+def _pairs_tl_ssw(lambda_, mu, l, m, lmax):  # noqa: E741
+    """Coupling coefficients of :func:`acoustotreams.special.tl_ssw` for pairs of modes
+
+    The result has the same layout as the last dimension of the table "tl_ssw" for a
+    maximal degree `lmax`.
+    """
+    lambda_, mu, l, m = (np.asarray(i)[..., None] for i in (lambda_, mu, l, m))  # noqa: E741
+    p = lambda_ + l - 2 * np.arange(lmax + 1)
+    valid = p >= np.maximum(np.abs(lambda_ - l), np.abs(m - mu))
+    res = np.zeros(p.shape, complex)
+    sc._tl_vsw_helper(l, m, lambda_, -mu, p, p, where=valid, out=res)
+    return res
+
+
+def _build_lattice_ssw(lmax):
+    """Coupling coefficients of the lattice sums in :func:`acoustotreams.ssw.translate_periodic`"""
+    lambda_, mu, l, m, p, valid = _indices(lmax)  # noqa: E741
+    res = np.zeros(p.shape)
+    sc.wigner3j(l, lambda_, p, m, -mu, -m + mu, where=valid, out=res)
+    res *= sc.wigner3j(l, lambda_, p, 0, 0, 0, where=valid, out=np.zeros(p.shape))
+    p = np.maximum(p, 0)
+    return res * (
+        np.power(-1, np.abs(m))
+        * np.sqrt(4 * np.pi * (2 * l + 1) * (2 * lambda_ + 1))
+        * np.power(1j, lambda_ - l + p)
+        * np.sqrt(2 * p + 1)
+    )
+
+
+def _pack(table):
+    """Nonzero coefficients of a table in the order of :func:`numpy.nonzero`
+
+    The positions of the vanishing coefficients only depend on the maximal degree, so
+    they are not stored.
+    """
+    return table[_indices(table.shape[-1] - 1)[-1]]
+
+
+def _unpack(values, lmax):
+    """Table up to the degree `lmax` from its nonzero coefficients, see :func:`_pack`"""
+    valid = _indices(lmax)[-1]
+    res = np.zeros(valid.shape, values.dtype)
+    res[valid] = values
+    res.flags.writeable = False
+    return res
+
+
+def _npz_path(path):
+    """Path with the suffix `.npz`, that :func:`numpy.savez` appends to file names"""
+    path = os.fspath(path)
+    return path if path.endswith(".npz") else path + ".npz"
+
+
+class CoefficientStore:
+    """Process-wide store of coupling coefficients.
+
+    The coupling coefficients of the translation coefficients for scalar spherical waves
+    only depend on the integer indices of the modes. They are computed once up to a
+    requested maximal degree and kept for later use. Each table is an array of shape
+    `(N, N, lmax + 1)` with `N = (lmax + 1) ** 2`. The first two dimensions correspond to
+    the output and input modes, respectively, each indexed by `l * (l + 1) + m`. The last
+    dimension indexes the summation over `p = lambda_ + l - 2 * k`, which skips all
+    vanishing terms of odd parity. So, a table for a smaller degree is a slice of a table
+    for a larger degree and only the largest table of each kind is kept. When a larger
+    degree is requested, the table is recomputed and replaces the old one.
+
+    The tables are evicted in least recently used order, when their total size exceeds
+    `maxbytes`. If `path` is set, missing tables are read from this `.npz` file before they
+    are computed and newly computed tables are written to it. The suffix `.npz` is
+    appended to the path, if it is missing.
+
+    In the files, only the nonzero coefficients of each table are stored, which are
+    about 40 % of the entries, together with the maximal degree, that determines their
+    positions. In memory, the tables are kept dense, since the translation coefficients
+    gather them directly by the indices of the modes.
+
+    Args:
+        maxbytes (int, optional): Maximal total size of the tables in bytes.
+        path (str, optional): Path to a `.npz` file for the persistence of the tables.
+    """
+
+    _BUILDERS = {"tl_ssw": _build_tl_ssw, "lattice_ssw": _build_lattice_ssw}
+
+    def __init__(self, maxbytes=2 ** 30, path=None):
+        """Initialization."""
+        self.maxbytes = maxbytes
+        self.path = None if path is None else _npz_path(path)
+        self._tables = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def nbytes(self):
+        """Total size of the stored tables in bytes.
+
+        Returns:
+            int
+        """
+        with self._lock:
+            return sum(table.nbytes for table in self._tables.values())
+
+    def lmax(self, kind):
+        """Maximal degree of the stored table.
+
+        Args:
+            kind (str): Kind of the table.
+
+        Returns:
+            int or None
+        """
+        with self._lock:
+            table = self._tables.get(kind)
+        return None if table is None else table.shape[-1] - 1
+
+    def get(self, kind, lmax):
+        """Get the table of coefficients up to the degree `lmax`.
+
+        The returned array is read-only and might be a view of a larger table.
+
+        Args:
+            kind (str): Kind of the table, either "tl_ssw" or "lattice_ssw".
+            lmax (int): Maximal degree.
+
+        Returns:
+            array
+        """
+        if kind not in self._BUILDERS:
+            raise ValueError(f"invalid kind '{kind}'")
+        lmax = int(lmax)
+        if lmax < 0:
+            raise ValueError("'lmax' must be non-negative")
+        with self._lock:
+            table = self._tables.get(kind)
+            if table is None or table.shape[-1] <= lmax:
+                table = self._read(kind, lmax)
+            if table is None:
+                table = self._BUILDERS[kind](lmax)
+                table.flags.writeable = False
+                self._insert(kind, table)
+                if self.path is not None:
+                    self.save(self.path)
+            else:
+                self._insert(kind, table)
+        dim = (lmax + 1) * (lmax + 1)
+        return table[:dim, :dim, : lmax + 1]
+
+    def _insert(self, kind, table):
+        self._tables[kind] = table
+        self._tables.move_to_end(kind)
+        while self._tables and self.nbytes > self.maxbytes:
+            # The current table is returned even if it alone exceeds the limit
+            self._tables.popitem(last=False)
+
+    def _read(self, kind, lmax):
+        if self.path is None or not os.path.isfile(self.path):
+            return None
+        with np.load(self.path) as data:
+            if kind + "_lmax" not in data.files:
+                return None
+            stored = int(data[kind + "_lmax"])
+            if stored < lmax:
+                return None
+            values = data[kind]
+        return _unpack(values, stored)
+
+    def clear(self):
+        """Remove all tables from memory."""
+        with self._lock:
+            self._tables.clear()
+
+    def save(self, path):
+        """Save all tables to a `.npz` file.
+
+        Tables in the file, that are larger than the stored ones, are kept. The suffix
+        `.npz` is appended to the path, if it is missing.
+
+        Args:
+            path (str): File path.
+        """
+        path = _npz_path(path)
+        with self._lock:
+            tables = {}
+            if os.path.isfile(path):
+                with np.load(path) as data:
+                    tables = _read_tables(data)
+            for kind, table in self._tables.items():
+                lmax = table.shape[-1] - 1
+                if kind not in tables or tables[kind][0] < lmax:
+                    tables[kind] = lmax, _pack(table)
+            arrays = {}
+            for kind, (lmax, values) in tables.items():
+                arrays[kind] = values
+                arrays[kind + "_lmax"] = lmax
+            np.savez(path, **arrays)
+
+    def load(self, path):
+        """Load tables from a `.npz` file.
+
+        Only tables that are larger than the stored ones are loaded. The suffix `.npz` is
+        appended to the path, if it is missing.
+
+        Args:
+            path (str): File path.
+        """
+        with self._lock, np.load(_npz_path(path)) as data:
+            for kind, (lmax, values) in _read_tables(data).items():
+                if kind not in self._BUILDERS:
+                    continue
+                stored = self.lmax(kind)
+                if stored is None or lmax > stored:
+                    self._insert(kind, _unpack(values, lmax))
+
+
+def _read_tables(data):
+    """Maximal degree and nonzero coefficients of each table in an opened `.npz` file"""
+    return {
+        kind: (int(data[kind + "_lmax"]), data[kind])
+        for kind in data.files
+        if kind + "_lmax" in data.files
+    }
+
+
+coefficients = CoefficientStore()
+"""Process-wide instance of :class:`CoefficientStore`."""
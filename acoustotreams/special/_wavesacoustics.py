@@ -64,6 +64,104 @@ def vpw_L(kx, ky, kz, x, y, z):
     else:
         return 1j * np.asarray([kx * phase, ky * phase, kz * phase], complex).T / k
 
+
+def _sph_legendre(lmax, theta):
+    """Normalized associated Legendre functions for non-negative orders.
+
+    The item `[l, m]` of the result is :math:`Y_{lm}(\\theta, 0)` for `m <= l`, including
+    the Condon-Shortley phase, and the trailing dimensions are those of `theta`.
+    """
+    theta = np.asarray(theta)
+    x, s = np.cos(theta), np.sin(theta)
+    res = np.zeros((lmax + 1, lmax + 1) + theta.shape, np.result_type(theta, float))
+    pmm = np.full(theta.shape, 0.5 / np.sqrt(np.pi), res.dtype)
+    for m in range(lmax + 1):
+        if m > 0:
+            pmm = -np.sqrt((2 * m + 1) / (2 * m)) * s * pmm
+        res[m, m] = pmm
+        if m < lmax:
+            res[m + 1, m] = np.sqrt(2 * m + 3) * x * pmm
+        for l in range(m + 2, lmax + 1):  # noqa: E741
+            a = np.sqrt((4 * l * l - 1) / (l * l - m * m))
+            b = np.sqrt(((l - 1) * (l - 1) - m * m) / (4 * (l - 1) * (l - 1) - 1))
+            res[l, m] = a * (x * res[l - 1, m] - b * res[l - 2, m])
+    return res
+
+
+def sph_harm_table(lmax, theta, phi, derivatives=False):
+    r"""Spherical harmonics up to a maximal degree.
+
+    All spherical harmonics :math:`Y_{lm}(\theta, \varphi)` with :math:`l \leq l_\max`
+    are computed at once. The associated Legendre functions are obtained by recurrences
+    over the degree and the order and :math:`\mathrm e^{\mathrm i m \varphi}` once
+    for each order. The last dimension of the result enumerates the modes with the
+    index :math:`l (l + 1) + m`. The values agree with
+    :func:`acoustotreams.special.sph_harm`.
+
+    Optionally, the derivative :math:`\partial_\theta Y_{lm}` and
+    :math:`\frac{\mathrm i m}{\sin \theta} Y_{lm}` are returned, too, which are the
+    angular components of the gradient. The latter is also finite on the z-axis.
+
+    Args:
+        lmax (int): Maximal degree.
+        theta (float or array_like): Polar angle (rad).
+        phi (float or array_like): Azimuthal angle (rad).
+        derivatives (bool, optional): Return also the angular derivatives.
+
+    Returns:
+        complex array or tuple
+    """
+    theta, phi = np.broadcast_arrays(theta, phi)
+    l = np.repeat(np.arange(lmax + 1), 2 * np.arange(lmax + 1) + 1)  # noqa: E741
+    m = np.concatenate([np.arange(-i, i + 1) for i in range(lmax + 1)])
+    lmax_legendre = lmax + bool(derivatives)
+    legendre = np.moveaxis(_sph_legendre(lmax_legendre, theta), (0, 1), (-2, -1))
+
+    def table(l, m):  # noqa: E741
+        valid = np.abs(m) <= l
+        sign = np.where((m < 0) & (m % 2 == 1), -1, 1)
+        idx = np.minimum(l, lmax_legendre), np.where(valid, np.abs(m), 0)
+        return np.where(valid, sign * legendre[..., idx[0], idx[1]], 0)
+
+    phase = np.exp(1j * m * phi[..., None])
+    res = table(l, m) * phase
+    if not derivatives:
+        return res
+    dtheta = 0.5 * (
+        np.sqrt((l - m) * (l + m + 1)) * table(l, m + 1)
+        - np.sqrt((l + m) * (l - m + 1)) * table(l, m - 1)
+    )
+    dphi = -0.5j * np.sqrt((2 * l + 1) / (2 * l + 3)) * (
+        np.sqrt((l + m + 1) * (l + m + 2)) * table(l + 1, m + 1)
+        + np.sqrt((l - m + 1) * (l - m + 2)) * table(l + 1, m - 1)
+    )
+    return res, dtheta * phase, dphi * phase
+
+
+def spherical_bessel_table(lmax, x, singular=False):
+    r"""Spherical Bessel or Hankel functions up to a maximal degree.
+
+    The functions :math:`j_l(x)` or :math:`h_l^{(1)}(x)` for all degrees
+    :math:`l \leq l_\max` are evaluated once for each argument, such that they can be
+    reused for all orders :math:`m`. The last dimension of the result enumerates the
+    degree.
+
+    Args:
+        lmax (int): Maximal degree.
+        x (float or complex, array_like): Argument.
+        singular (bool, optional): Compute the spherical Hankel functions of the first
+            kind instead of the spherical Bessel functions.
+
+    Returns:
+        complex array
+    """
+    x = np.asarray(x)[..., None]
+    l = np.arange(lmax + 1)  # noqa: E741
+    if singular:
+        return sc.spherical_hankel1(l, x)
+    return sc.spherical_jn(l, x) + 0j
+
+
 def ssw_Psi(l, m, kr, theta, phi):
     r"""Singular scalar spherical wave :math:`\Psi`
 
@@ -278,9 +376,11 @@ def vsw_L(l, m, kr, theta, phi):
     Returns:
         complex 3-array
      """
-     return np.transpose(sc.vsh_Z(l, m, theta, phi).T * sc.spherical_hankel1_d(l, kr)  + np.sqrt(
-         l * (l + 1)
-     ) * sc.vsh_Y(l, m, theta, phi).T * sc.spherical_hankel1(l, kr) / kr) * (-1.0j)
+     return (
+         sc.vsh_Z(l, m, theta, phi) * sc.spherical_hankel1_d(l, kr)[..., None]
+         + sc.vsh_Y(l, m, theta, phi)
+         * (np.sqrt(l * (l + 1)) * sc.spherical_hankel1(l, kr) / kr)[..., None]
+     ) * (-1.0j)
 
 def vsw_rL(l, m, kr, theta, phi):
      r"""Regular longitudinal vector spherical wave L
@@ -309,26 +409,18 @@ def vsw_rL(l, m, kr, theta, phi):
     Returns:
         complex, 3-array
      """
-     res = []
-     for i, x in enumerate(kr):
-            if x == 0:
-                if l[i] != 1:
-                    val = np.zeros(3, complex).T
-                    res.append(val)
-                else:
-                   val = np.transpose(
-                       sc.vsh_Z(1, m[i], 0, 0).T + 
-                       np.sqrt(2) * sc.vsh_Y(1, m[i], 0, 0).T) * (1/3) * (-1.0j)
-                   res.append(val)
-            else:      
-                val = np.transpose(
-                    sc.vsh_Z(l[i], m[i], theta[i], phi[i]).T * 
-                    sc.spherical_jn_d(l[i], kr[i])  
-                    + np.sqrt(l[i] * (l[i] + 1)) * 
-                    sc.vsh_Y(l[i], m[i], theta[i], phi[i]).T * 
-                    sc.spherical_jn(l[i], kr[i]) / kr[i]) * (-1.0j)
-                res.append(val)
-     return np.array(res)
+     l, kr = np.asarray(l), np.asarray(kr)
+     origin = kr == 0
+     # Limits at the origin: j_l'(x) and j_l(x) / x tend to 1 / 3 for l = 1 and to zero
+     # otherwise
+     limit = np.where(l == 1, 1 / 3, 0)
+     kr_safe = np.where(origin, 1, kr)
+     radial = np.where(origin, limit, sc.spherical_jn_d(l, kr_safe))
+     tangential = np.where(origin, limit, sc.spherical_jn(l, kr_safe) / kr_safe)
+     return (
+         sc.vsh_Z(l, m, theta, phi) * radial[..., None]
+         + sc.vsh_Y(l, m, theta, phi) * (np.sqrt(l * (l + 1)) * tangential)[..., None]
+     ) * (-1.0j)
 
 
 def vcw_L(kz, m, krr, phi, z, krho, k):
@@ -361,14 +453,14 @@ def vcw_L(kz, m, krr, phi, z, krho, k):
      Returns:
          complex 3-array
       """
-     return np.transpose(
-         np.array(
-             [
-                 sc.hankel1_d(m, krr) * krho / k  * np.exp(1j * (m * phi + kz * z)),
-                 1j * m * sc.hankel1(m, krr) / krr * krho / k  * np.exp(1j * (m * phi + kz * z)),
-                 1j * kz / k * sc.hankel1(m, krr) * np.exp(1j * (m * phi + kz * z)),
-             ]
-         )
+     phase = np.exp(1j * (m * phi + kz * z))
+     return np.stack(
+         np.broadcast_arrays(
+             sc.hankel1_d(m, krr) * krho / k * phase,
+             1j * m * sc.hankel1(m, krr) / krr * krho / k * phase,
+             1j * kz / k * sc.hankel1(m, krr) * phase,
+         ),
+         axis=-1,
      )
 
 
@@ -402,40 +494,23 @@ def vcw_rL(kz, m, krr, phi, z, krho, k):
      Returns:
          complex 3-array
      """
-     # todo: implement for k as array_like
-     res = []
-     for i, x in enumerate(krr):
-            if x == 0:
-                if (abs(m[i]) != 1) and (m[i] != 0):
-                    val = np.zeros(3, complex).T
-                    res.append(val)
-                elif abs(m[i]) == 1:
-                   val = np.array(
-                                  [
-                       0.5 * krho[i] / k,
-                       0.5 * 1j * m[i] * krho[i] / k,
-                       0. 
-                       ]).T * np.exp(1j * (m[i] * phi[i] + kz[i] * z[i]))
-                   res.append(val)
-                elif m[i] == 0:
-                    val = np.array(
-                        [
-                            0., 
-                            0., 
-                            1j * kz[i] / k * np.exp(1j * (m[i] * phi[i] + kz[i] * z[i]))
-                            ]
-                            ).T
-                    res.append(val)
-            else:      
-                val = np.array(
-                [
-                    sc.jv_d(m[i], krr[i]) * krho[i] / k,
-                    1j * m[i] * sc.jv(m[i], krr[i]) / krr[i] * krho[i] / k,
-                    1j * kz[i] / k * sc.jv(m[i], krr[i]),
-                ] 
-            ).T * np.exp(1j * (m[i] * phi[i] + kz[i] * z[i]))
-                res.append(val)
-     return np.array(res)
+     m, krr = np.asarray(m), np.asarray(krr)
+     origin = krr == 0
+     krr_safe = np.where(origin, 1, krr)
+     # Limit at the origin: J_m(x) / x tends to m / 2 for |m| = 1 and m J_m(x) / x to
+     # zero otherwise
+     jv_x = np.where(
+         origin, np.where(np.abs(m) == 1, 0.5 * m, 0), sc.jv(m, krr_safe) / krr_safe
+     )
+     phase = np.exp(1j * (m * phi + kz * z))
+     return np.stack(
+         np.broadcast_arrays(
+             sc.jv_d(m, krr) * krho / k * phase,
+             1j * m * jv_x * krho / k * phase,
+             1j * kz / k * sc.jv(m, krr) * phase,
+         ),
+         axis=-1,
+     )
 
 def tl_ssw(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs):
     r"""tl_ssw(lambda_, mu, l, m, kr, theta, phi)
@@ -479,7 +554,9 @@ def tl_ssw(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs):
     pref = np.power(-1, np.abs(m)) * np.sqrt((2 * l + 1) * (2 * lambda_ + 1)) * cmath.exp(1j * (m - mu) * phi)
     res = 0.
     max_ = np.max([np.abs(int(lambda_) - int(l)), np.abs(int(m) - int(mu))])
-    min_ = int(l) +  int(lambda_)
+    min_ = int(l) + int(lambda_)
+    # The coupling coefficients are computed directly and not taken from the shared
+    # tables, which grow like lmax ** 5, so this also serves as an independent reference
     for p in range(min_, max_ - 1, -2):
         res += (
             sc._tl_vsw_helper(l, m, lambda_, -mu, p, p)
@@ -533,6 +610,8 @@ def tl_ssw_r(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs):
     res = 0.
     max_ = np.max([np.abs(int(lambda_) - int(l)), np.abs(int(m) - int(mu))])
     min_ = int(l) + int(lambda_)
+    # The coupling coefficients are computed directly and not taken from the shared
+    # tables, which grow like lmax ** 5, so this also serves as an independent reference
     for p in range(min_, max_ - 1, -2):
         res += (
             sc._tl_vsw_helper(l, m, lambda_, -mu, p, p)
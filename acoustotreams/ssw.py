@@ -6,17 +6,109 @@
    periodic_to_scw
    periodic_to_spw
    rotate
+   rotation_matrix
    translate
    translate_periodic
 
 """
 
 import acoustotreams.special as ats
+from acoustotreams.special import _coefficients
 import treams.special as sc
 import numpy as np
 from treams import lattice
 import scipy.special as ss
 
+_CHUNKSIZE = 2 ** 18
+"""Maximal number of coefficient terms that are evaluated at once by array-based
+functions."""
+
+_TABLE_LMAX = 20
+"""Maximal degree, up to which the full table of coupling coefficients is used."""
+
+_RTR_LMAX = 6
+"""Minimal degree, from which on translations use the rotate-translate-rotate method by
+default."""
+
+
+def _translate_array(lambda_, mu, l, m, kr, theta, phi, singular=True, where=True):
+    """Array-based evaluation of translation coefficients for spherical modes.
+
+    The (spherical) Bessel or Hankel functions and the associated Legendre polynomials
+    are only evaluated once for each distinct value of `kr` and `theta`, respectively.
+    The coupling coefficients are taken from :data:`acoustotreams.special.coefficients`.
+    Above the degree `_TABLE_LMAX` only the coupling coefficients of the requested pairs
+    of modes are computed, unless a large enough table is already stored.
+    """
+    lambda_, mu, l, m, kr, theta, phi, where = np.broadcast_arrays(  # noqa: E741
+        lambda_, mu, l, m, kr, theta, phi, where
+    )
+    res = np.zeros(lambda_.shape, complex)
+    compute = where.astype(bool)
+    if singular:
+        compute &= np.abs(kr) >= 1e-16
+    if not np.any(compute):
+        return res[()]
+    lambda_, mu, l, m = (np.asarray(i[compute], int) for i in (lambda_, mu, l, m))  # noqa: E741
+    kr, theta, phi = (i[compute] for i in (kr, theta, phi))
+
+    lmax = max(np.max(lambda_), np.max(l))
+    pmax = 2 * lmax
+    idx_out = lambda_ * (lambda_ + 1) + mu
+    idx_in = l * (l + 1) + m
+    stored = ats.coefficients.lmax("tl_ssw")
+    if lmax <= _TABLE_LMAX or (stored is not None and stored >= lmax):
+        table = ats.coefficients.get("tl_ssw", lmax)
+    else:
+        # The table grows with lmax ** 5, so only the needed coefficients are computed
+        pairs, pidx = np.unique(
+            idx_out * (lmax + 1) ** 2 + idx_in, return_inverse=True
+        )
+        pairs_out, pairs_in = np.divmod(pairs, (lmax + 1) ** 2)
+        pairs_lambda = np.sqrt(pairs_out).astype(int)
+        pairs_l = np.sqrt(pairs_in).astype(int)
+        table = _coefficients._pairs_tl_ssw(
+            pairs_lambda,
+            pairs_out - pairs_lambda * (pairs_lambda + 1),
+            pairs_l,
+            pairs_in - pairs_l * (pairs_l + 1),
+            lmax,
+        )[:, None, :]
+        idx_out = pidx.ravel()
+        idx_in = np.zeros_like(idx_out)
+    krs, kidx = np.unique(kr, return_inverse=True)
+    ps = np.arange(pmax + 1)
+    if singular:
+        zs = sc.spherical_hankel1(ps, krs[:, None])
+    else:
+        zs = sc.spherical_jn(ps, krs[:, None])
+    costs, tidx = np.unique(np.cos(theta), return_inverse=True)
+    legendre = sc.lpmv(np.arange(-pmax, pmax + 1)[:, None], ps, costs[:, None, None])
+    kidx, tidx = kidx.ravel(), tidx.ravel()
+
+    q = m - mu + pmax
+    ks = 2 * np.arange(lmax + 1)
+    vals = np.empty(len(l), complex)
+    step = max(1, _CHUNKSIZE // (lmax + 1))
+    for i in range(0, len(l), step):
+        s = slice(i, i + step)
+        # The coefficients vanish for all invalid (clipped) values of p
+        p = np.maximum(lambda_[s, None] + l[s, None] - ks, 0)
+        vals[s] = np.sum(
+            table[idx_out[s], idx_in[s]]
+            * zs[kidx[s, None], p]
+            * legendre[tidx[s, None], q[s, None], p],
+            axis=-1,
+        )
+    vals *= (
+        np.power(-1, np.abs(m))
+        * np.sqrt((2 * l + 1) * (2 * lambda_ + 1))
+        * np.exp(1j * (m - mu) * phi)
+    )
+    res[compute] = vals
+    return res[()]
+
+
 def _translate_s(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs):
     """Regular translation coefficient for spherical modes"""
     if abs(kr) < 1e-16:
@@ -32,8 +124,10 @@ _translate_s = np.vectorize(_translate_s)
 _translate_r = np.vectorize(_translate_r)
 
 
-def translate(lambda_, mu, l, m, kr, theta, phi, singular=True, *args, **kwargs):
-    """translate(lambda_, mu, l, m, kr, theta, phi, singular=True)
+def translate(
+    lambda_, mu, l, m, kr, theta, phi, singular=True, *args, method=None, **kwargs
+):
+    """translate(lambda_, mu, l, m, kr, theta, phi, singular=True, method=None)
 
     Translation coefficients for spherical waves.
 
@@ -41,6 +135,18 @@ def translate(lambda_, mu, l, m, kr, theta, phi, singular=True, *args, **kwargs)
     and :func:`acoustotreams.ssw.tl_ssw_r` or combinations thereof for the specified modes and
     basis.
 
+    Three implementations are available. The method "array" evaluates the
+    radial functions and the associated Legendre polynomials once for each distinct
+    argument and sums over the precomputed coupling coefficients for all modes at once.
+    The method "rtr" (rotate-translate-rotate) rotates the translation direction onto
+    the z-axis, translates along the z-axis, and rotates back. It computes all
+    coefficients for each distinct translation vector at once, which is faster for high
+    degrees. The method "vectorize" calls :func:`acoustotreams.special.tl_ssw` and
+    :func:`acoustotreams.special.tl_ssw_r` for each element separately. All methods give
+    the same results. By default, the method "rtr" is used when the maximal degree is at
+    least `_RTR_LMAX` and, on average, at least half of all coefficients up to this degree
+    are requested for each translation vector; otherwise, the method "array" is used.
+
     Args:
         lambda_ (int or array_like): Degree of output modes.
         mu (int or array_like): Order of output modes.
@@ -51,15 +157,222 @@ def translate(lambda_, mu, l, m, kr, theta, phi, singular=True, *args, **kwargs)
         phi (float or array_like): Azimuthal angle (rad).
         singular (bool, optional): If True, singular translation coefficients are used,
             else regular coefficients. Defaults to ``True``.
+        method (str, optional): Implementation used for the evaluation, either "array",
+            "rtr", or "vectorize". Defaults to an automatic choice between "array" and
+            "rtr".
 
     Returns:
         complex or array_like
     """
+    if method is None:
+        method = "array"
+        lmax = max(np.max(lambda_, initial=0), np.max(l, initial=0))
+        if lmax >= _RTR_LMAX:
+            size = np.broadcast(lambda_, mu, l, m, kr, theta, phi).size
+            nvec = _distinct(kr, theta, phi)[0].size
+            if 2 * size >= nvec * (lmax + 1) ** 4:
+                method = "rtr"
+    if method == "array":
+        return _translate_array(
+            lambda_, mu, l, m, kr, theta, phi, singular, *args, **kwargs
+        )
+    if method == "rtr":
+        return _translate_rtr_array(
+            lambda_, mu, l, m, kr, theta, phi, singular, *args, **kwargs
+        )
+    if method != "vectorize":
+        raise ValueError(f"invalid method '{method}'")
     if singular:
         return _translate_s(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs)
     return _translate_r(lambda_, mu, l, m, kr, theta, phi, *args, **kwargs)
 
 
+def _rotation_blocks(lmax, phi, theta=0, psi=0):
+    """Wigner-D matrices for all degrees up to `lmax`.
+
+    The result has the shape `(..., lmax + 1, 2 * lmax + 1, 2 * lmax + 1)`. The last three
+    dimensions are indexed by `l`, `mu + lmax`, and `m + lmax`. All entries with
+    `abs(mu) > l` or `abs(m) > l` are zero.
+
+    The small Wigner-d matrices are only evaluated once for each distinct value of
+    `theta`. For each pair of `mu` and `m` the lowest degree is taken from
+    :func:`treams.special.wignersmalld` and the higher degrees follow from the
+    three-term recurrence in the degree.
+    """
+    m = np.arange(-lmax, lmax + 1)
+    mu = m[:, None]
+    lstart = np.maximum(np.abs(mu), np.abs(m))
+    phi, theta, psi = np.broadcast_arrays(phi, theta, psi)
+    thetas, tidx = np.unique(theta, return_inverse=True)
+    cos = np.cos(thetas)[:, None, None]
+    start = sc.wignersmalld(lstart, mu, m, thetas[:, None, None])
+    smalld = np.zeros((thetas.size, lmax + 1) + lstart.shape)
+    prev = cur = np.zeros((thetas.size,) + lstart.shape)
+    musq, msq = mu * mu, m * m
+    for l in range(lmax + 1):  # noqa: E741
+        cur = np.where(lstart == l, start, cur)
+        smalld[:, l] = cur
+        if l == lmax:
+            break
+        den = ((l + 1) ** 2 - musq) * ((l + 1) ** 2 - msq)
+        a = np.divide(
+            (l + 1) * (2 * l + 1),
+            np.sqrt(np.maximum(den, 0)),
+            out=np.zeros(den.shape),
+            where=den > 0,
+        )
+        b = mu * m / max(l * (l + 1), 1)
+        c = np.sqrt(np.maximum((l * l - musq) * (l * l - msq), 0)) / (
+            max(l, 1) * (2 * l + 1)
+        )
+        prev, cur = cur, a * ((cos - b) * cur - c * prev)
+    phi, psi = phi[..., None, None, None], psi[..., None, None, None]
+    return smalld[tidx.reshape(theta.shape)] * np.exp(-1j * (mu * phi + m * psi))
+
+
+def _axial_blocks(lmax, kr, singular=True):
+    """Translation coefficients for translations along the z-axis.
+
+    Only coefficients with `mu == m` are nonzero for these translations. The result has
+    the shape `(..., 2 * lmax + 1, lmax + 1, lmax + 1)`. The last three dimensions are
+    indexed by `m + lmax`, `lambda_`, and `l`.
+    """
+    m = np.arange(-lmax, lmax + 1)[:, None, None]
+    lambda_ = np.arange(lmax + 1)[:, None]
+    l = np.arange(lmax + 1)  # noqa: E741
+    where = (np.abs(m) <= lambda_) & (np.abs(m) <= l)
+    kr = np.asarray(kr)[..., None, None, None]
+    return _translate_array(lambda_, m, l, m, kr, 0, 0, singular, where)
+
+
+def _translate_rtr(coeffs, rotation, axial):
+    """Translate coefficients by rotating, translating along z, and rotating back.
+
+    The coefficients have the shape `(..., lmax + 1, 2 * lmax + 1)` and are indexed by
+    `l` and `m + lmax`. All of them are translated by the same vector. The rotation
+    rotates the z-axis onto the translation direction, see :func:`_rotation_blocks`, and
+    the axial translation coefficients are taken from :func:`_axial_blocks`. Each step
+    costs `O(lmax ** 3)` operations for each set of coefficients.
+    """
+    shape = coeffs.shape
+    res = coeffs.reshape(-1, *shape[-2:]).transpose(1, 0, 2) @ rotation.conjugate()
+    res = axial @ res.transpose(2, 0, 1)
+    res = res.transpose(1, 2, 0) @ rotation.transpose(0, 2, 1)
+    return res.transpose(1, 0, 2).reshape(shape)
+
+
+def _distinct(*args):
+    """Distinct combinations of the broadcast arguments and the index of each element"""
+    args = np.broadcast_arrays(*args)
+    cols = []
+    for arg in args:
+        cols += [arg.real, arg.imag] if np.iscomplexobj(arg) else [arg]
+    vecs = np.stack(cols, axis=-1).reshape(-1, len(cols))
+    # Equal combinations often follow each other, so only the first of each run is sorted
+    runs = np.ones(len(vecs), bool)
+    runs[1:] = np.any(vecs[1:] != vecs[:-1], axis=-1)
+    starts = np.flatnonzero(runs)
+    _, first, idx = np.unique(
+        vecs[starts], axis=0, return_index=True, return_inverse=True
+    )
+    first = starts[first]
+    idx = idx.ravel()[np.cumsum(runs) - 1]
+    return (*(arg.ravel()[first] for arg in args), idx.reshape(args[0].shape))
+
+
+def _translate_rtr_array(lambda_, mu, l, m, kr, theta, phi, singular=True, where=True):
+    """Rotate-translate-rotate evaluation of translation coefficients for spherical modes.
+
+    For each distinct translation vector the matrix of all translation coefficients up to
+    the maximal degree is composed from the rotation of the z-axis onto the translation
+    direction, the translation along the z-axis, and the inverse rotation. The requested
+    coefficients are then taken from these matrices.
+    """
+    # The distinct translation vectors are found before broadcasting with the modes
+    kr, theta, phi, vidx = _distinct(np.asarray(kr, complex), theta, phi)
+    lambda_, mu, l, m, vidx, where = np.broadcast_arrays(  # noqa: E741
+        lambda_, mu, l, m, vidx, where
+    )
+    res = np.zeros(lambda_.shape, complex)
+    compute = where.astype(bool)
+    if singular:
+        compute &= np.abs(kr[vidx]) >= 1e-16
+    if not np.any(compute):
+        return res[()]
+    lambda_, mu, l, m, vidx = (  # noqa: E741
+        np.asarray(i[compute], int) for i in (lambda_, mu, l, m, vidx)
+    )
+    lmax = max(np.max(lambda_), np.max(l))
+    dim = 2 * lmax + 1
+    vals = np.empty(len(l), complex)
+    # Sort the coefficients by the degree l and then by the translation vector
+    key = l * len(kr) + vidx
+    order = np.argsort(key, kind="stable")
+    key = key[order]
+    degrees = np.unique(l)
+    step = max(1, 4 * _CHUNKSIZE // ((lmax + 1) * dim) ** 2)
+    for i in range(0, len(kr), step):
+        s = slice(i, i + step)
+        rotation = _rotation_blocks(lmax, phi[s], theta[s])
+        axial = _axial_blocks(lmax, kr[s], singular)
+        # coeffs[..., l, lambda_ * dim + mu, nu] = D[lambda_, mu, nu] * A[nu, lambda_, l]
+        coeffs = (
+            rotation[:, None] * axial.transpose(0, 3, 2, 1)[:, :, :, None, :]
+        ).reshape(-1, lmax + 1, (lmax + 1) * dim, dim)
+        for lcur in degrees:
+            start, stop = np.searchsorted(
+                key, [lcur * len(kr) + i, lcur * len(kr) + min(i + step, len(kr))]
+            )
+            if start == stop:
+                continue
+            # Sum over nu with the inverse rotation conj(D[l, m, nu]) for |m|, |nu| <= l
+            modes = slice(lmax - lcur, lmax + lcur + 1)
+            full = coeffs[:, lcur, :, modes] @ np.conjugate(
+                rotation[:, lcur, modes, modes].transpose(0, 2, 1)
+            )
+            sel = order[start:stop]
+            vals[sel] = full[
+                vidx[sel] - i, lambda_[sel] * dim + mu[sel] + lmax, m[sel] + lcur
+            ]
+    res[compute] = vals
+    return res[()]
+
+
+def _rotate_array(lambda_, mu, l, m, phi, theta, psi, where=True):
+    """Array-based evaluation of rotation coefficients for spherical modes.
+
+    The Wigner-D matrices of all degrees are computed once for each distinct set of
+    Euler angles, see :func:`_rotation_blocks`, and the requested coefficients are taken
+    from them.
+    """
+    phi, theta, psi, aidx = _distinct(phi, theta, psi)
+    lambda_, mu, l, m, aidx, where = np.broadcast_arrays(  # noqa: E741
+        lambda_, mu, l, m, aidx, where
+    )
+    res = np.zeros(lambda_.shape, complex)
+    compute = (
+        where.astype(bool) & (lambda_ == l) & (np.abs(mu) <= l) & (np.abs(m) <= l)
+    )
+    if not np.any(compute):
+        return res[()]
+    mu, l, m, aidx = (np.asarray(i[compute], int) for i in (mu, l, m, aidx))  # noqa: E741
+    lmax = np.max(l)
+    dim = 2 * lmax + 1
+    vals = np.empty(len(l), complex)
+    order = np.argsort(aidx, kind="stable")
+    step = max(1, _CHUNKSIZE // ((lmax + 1) * dim * dim))
+    bounds = np.searchsorted(aidx[order], np.arange(0, len(phi) + step, step))
+    for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        if start == stop:
+            continue
+        s = slice(i * step, (i + 1) * step)
+        rotation = _rotation_blocks(lmax, phi[s], theta[s], psi[s])
+        sel = order[start:stop]
+        vals[sel] = rotation[aidx[sel] - i * step, l[sel], mu[sel] + lmax, m[sel] + lmax]
+    res[compute] = vals
+    return res[()]
+
+
 def _rotate(lambda_, mu, l, m, phi, theta, psi, *args, **kwargs):
     """
     Rotation coefficients for the rotation by the Euler angles phi, theta, and psi.
@@ -73,8 +386,8 @@ def _rotate(lambda_, mu, l, m, phi, theta, psi, *args, **kwargs):
 _rotate = np.vectorize(_rotate)
 
 
-def rotate(lambda_, mu, l, m, phi, theta=0, psi=0, *args, **kwargs):
-    """rotate(lambda_, mu, l, m, phi, theta=0, psi=0)
+def rotate(lambda_, mu, l, m, phi, theta=0, psi=0, *args, method="array", **kwargs):
+    """rotate(lambda_, mu, l, m, phi, theta=0, psi=0, method="array")
     
     Rotation coefficients for scalar spherical modes.
 
@@ -84,6 +397,11 @@ def rotate(lambda_, mu, l, m, phi, theta=0, psi=0, *args, **kwargs):
     first, theta second, and psi third. In the extrinsic (global or reference frame fixed
     coordinate system), the rotations are applied psi first, theta second, phi third.
 
+    The default method "array" computes the Wigner-D matrices of all degrees once for
+    each distinct set of angles, see :func:`rotation_matrix`, and only evaluates the
+    coefficients with `lambda_ == l`. The method "vectorize" calls
+    :func:`treams.special.wignerd` for each element separately.
+
     Args:
         lambda_ (int or array_like): Degree of output modes.
         mu (int or array_like): Order of output modes.
@@ -92,22 +410,53 @@ def rotate(lambda_, mu, l, m, phi, theta=0, psi=0, *args, **kwargs):
         phi (float or complex or array_like): First Euler angle.
         theta (float or array_like): Second Euler angle.
         psi (float or array_like): Third Euler angle.
+        method (str, optional): Implementation used for the evaluation, either "array"
+            or "vectorize". Defaults to "array".
 
     Returns:
         complex or array_like
     """
+    if method == "array":
+        return _rotate_array(lambda_, mu, l, m, phi, theta, psi, *args, **kwargs)
+    if method != "vectorize":
+        raise ValueError(f"invalid method '{method}'")
     return _rotate(lambda_, mu, l, m, phi, theta, psi, *args, **kwargs)
 
 
-def _transl_a_lattice(lambda_, mu, l, m, dlms):
-    """Singular translation coefficient for a scalar spherical wave on a lattice"""
-    pref = np.power(-1, np.abs(m)) * np.sqrt(4 * np.pi * (2 * l + 1) * (2 * lambda_ + 1)) * np.power(1.0j, lambda_ - l)
-    dlm = 0
-    res = 0
-    for p in range(l + lambda_, max(abs(lambda_ - l), abs(mu - m)) - 1, -2):
-        dlm = dlms[p * (p + 1) + m - mu]
-        res += dlm * np.power(1.0j, p) * np.sqrt(2 * p + 1) * sc.wigner3j(l, lambda_, p, m, -mu, -m + mu) * sc.wigner3j(l, lambda_, p, 0, 0, 0)
-    return res * pref
+def rotation_matrix(lmax, phi, theta=0, psi=0, blocks=False):
+    """Rotation matrix of all scalar spherical modes up to a maximal degree.
+
+    The modes are ordered by their degree `l` and then by their order `m` like in
+    :meth:`ScalarSphericalWaveBasis.default` for a single position. The rotation does
+    not couple modes of different degrees, so the matrix is block-diagonal. The
+    Wigner-D matrices are computed with a recurrence in the degree, which is batched
+    over all given Euler angles.
+
+    Args:
+        lmax (int): Maximal degree.
+        phi (float or array_like): First Euler angle.
+        theta (float or array_like, optional): Second Euler angle.
+        psi (float or array_like, optional): Third Euler angle.
+        blocks (bool, optional): Return the list of blocks of each degree instead of
+            the full matrix.
+
+    Returns:
+        array or list: Array of shape `(..., (lmax + 1) ** 2, (lmax + 1) ** 2)` or list
+        of arrays of shape `(..., 2 * l + 1, 2 * l + 1)` for `l` up to `lmax`, where
+        `...` is the broadcast shape of the angles.
+    """
+    rotation = _rotation_blocks(lmax, phi, theta, psi)
+    res = [
+        rotation[..., l, lmax - l : lmax + l + 1, lmax - l : lmax + l + 1]
+        for l in range(lmax + 1)  # noqa: E741
+    ]
+    if blocks:
+        return res
+    dim = (lmax + 1) * (lmax + 1)
+    mat = np.zeros(rotation.shape[:-3] + (dim, dim), complex)
+    for l, block in enumerate(res):  # noqa: E741
+        mat[..., l * l : (l + 1) * (l + 1), l * l : (l + 1) * (l + 1)] = block
+    return mat
 
 
 def translate_periodic(ks, kpar, a, rs, out, in_=None, rsin=None, eta=0, func=lattice.lsumsw):
@@ -167,10 +516,24 @@ def translate_periodic(ks, kpar, a, rs, out, in_=None, rsin=None, eta=0, func=la
     dim = 1 if kpar.ndim == 0 else kpar.shape[-1]
     # The result has the shape (n_rs, n_rs, n_modes)
     dlms = func(dim, modes[:, 0], modes[:, 1], ks, kpar, a, rsdiff, eta)
-    res = np.zeros((out[1:][0].shape[-1], in_[1:][0].shape[-1]), complex)
-    for i in range(out[1:][0].shape[-1]):
-        for j in range(in_[1:][0].shape[-1]):
-                res[i][j] = _transl_a_lattice(out[1:][0][i], out[1:][1][i], in_[1:][0][j], in_[1:][1][j], dlms[out[0][i]][in_[0][j]])
+    res = np.zeros((out[1].shape[-1], in_[1].shape[-1]), complex)
+    if res.size == 0:
+        return res
+    lmax = max(np.max(out[1]), np.max(in_[1]))
+    table = ats.coefficients.get("lattice_ssw", lmax)
+    lambda_, mu = out[1][:, None, None], out[2][:, None, None]
+    l, m = in_[1][:, None], in_[2][:, None]  # noqa: E741
+    p = lambda_ + l - 2 * np.arange(lmax + 1)
+    # Gather the lattice sums, the coefficients vanish for invalid values of p
+    valid = p >= np.maximum(np.abs(lambda_ - l), np.abs(m - mu))
+    idx = np.where(valid, p * (p + 1) + m - mu, 0)
+    coeffs = table[(out[1] * (out[1] + 1) + out[2])[:, None], in_[1] * (in_[1] + 1) + in_[2]]
+    for i in np.unique(out[0]):
+        rows = np.nonzero(out[0] == i)[0]
+        for j in np.unique(in_[0]):
+            cols = np.nonzero(in_[0] == j)[0]
+            tile = np.ix_(rows, cols)
+            res[tile] = np.sum(coeffs[tile] * dlms[i, j][idx[tile]], axis=-1)
     return res
          
 
@@ -0,0 +1,58 @@
+"""Benchmark of the annotation handling of acoustics arrays.
+
+For plane-wave bases of increasing size, a single matrix multiplication of two
+annotated arrays, the coupling of two S-matrices with :meth:`AcousticSMatrices.add`,
+and the insonification of a pair of S-matrices with
+:meth:`AcousticSMatrices.illuminate` are timed with the regular annotation handling
+and within :func:`acoustotreams.fast_annotations`. The time of the multiplication of
+the bare arrays is printed for reference. All times are in microseconds per call.
+
+Run it with `python benchmarks/annotations.py`.
+"""
+
+import timeit
+import warnings
+
+import numpy as np
+
+import acoustotreams
+from treams.util import AnnotationWarning
+
+warnings.simplefilter("ignore", AnnotationWarning)
+k0 = 12
+materials = [(200, 1029), (900, 686), (100, 343)]
+
+
+def timed(func, number):
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def run(func, number):
+    regular = timed(func, number)
+    with acoustotreams.fast_annotations():
+        fast = timed(func, number)
+    return regular, fast
+
+
+print(
+    f"{'modes':>5} {'numpy':>7} {'matmul':>7} {'fast':>7} "
+    f"{'add':>8} {'fast':>8} {'illu':>8} {'fast':>8}"
+)
+for nmax in (2, 3, 4):
+    kpars = [(i, j) for i in range(-nmax, nmax + 1) for j in range(-nmax, nmax + 1)]
+    kpars = [kpar for kpar in kpars if np.hypot(*kpar) <= nmax]
+    basis = acoustotreams.ScalarPlaneWaveBasisByComp.default(kpars)
+    sm = acoustotreams.AcousticSMatrices.slab(3, basis, k0, materials)
+    illu = acoustotreams.AcousticsArray(
+        np.ones(len(basis)), basis=basis, k0=float(k0), modetype="up"
+    )
+    arr = sm[0, 0]
+    bare = np.asarray(arr)
+    tnumpy = timed(lambda: bare @ bare, 1000)
+    tmatmul = run(lambda: arr @ arr, 1000)
+    tadd = run(lambda: sm.add(sm), 20)
+    tillu = run(lambda: sm.illuminate(illu, smat=sm), 100)
+    print(
+        f"{len(basis):>5} {tnumpy:>7.1f} {tmatmul[0]:>7.1f} {tmatmul[1]:>7.1f} "
+        f"{tadd[0]:>8.1f} {tadd[1]:>8.1f} {tillu[0]:>8.1f} {tillu[1]:>8.1f}"
+    )
@@ -0,0 +1,96 @@
+"""Benchmark of the fast multipole method for clusters of spheres.
+
+The translations within a cluster of randomly placed small spheres are applied once
+with the dense translation matrix, that is created in chunks of rows, and once with
+:class:`acoustotreams.ClusterFMM`. The setup times, the times for one application, and
+the relative error of the fast multipole method are printed. Without a stored matrix,
+each application of the dense translations costs its setup and application time, so
+the fast multipole method is compared to their sum, too. Finally, the scattered field of
+the cluster with 500 spheres is solved iteratively with both methods, where the dense
+translations are recomputed in each iteration.
+
+Run it with `python benchmarks/fmm.py`.
+"""
+
+import time
+
+import numpy as np
+
+import acoustotreams
+
+k0 = 4
+lmax = 1
+density = 250  # scatterers per unit volume
+materials = [(1000, 1500, 0), (1.3, 343, 0)]
+rng = np.random.default_rng(0)
+nsolve = 500
+
+
+def dense_translation(basis, material):
+    step = max(1, 2 ** 20 // len(basis))
+    return [
+        np.asarray(
+            acoustotreams.expand(
+                (basis[i : i + step], basis),
+                ("regular", "singular"),
+                k0=k0,
+                material=material,
+            )
+        )
+        for i in range(0, len(basis), step)
+    ]
+
+
+print(
+    f"{'N':>6} {'dense setup':>12} {'dense apply':>12} "
+    f"{'fmm setup':>10} {'fmm apply':>10} {'rel. error':>11} {'speed-up':>9}"
+)
+for n in (125, 250, 500, 1000, 2000):
+    positions = rng.random((n, 3)) * np.cbrt(n / density)
+    basis = acoustotreams.ScalarSphericalWaveBasis.default(lmax, n, positions)
+    material = acoustotreams.AcousticMaterial(materials[-1])
+    x = rng.random(len(basis)) + 1j * rng.random(len(basis))
+
+    start = time.perf_counter()
+    chunks = dense_translation(basis, material)
+    dense_setup = time.perf_counter() - start
+    start = time.perf_counter()
+    expect = np.concatenate([chunk @ x for chunk in chunks])
+    dense_apply = time.perf_counter() - start
+    del chunks
+
+    start = time.perf_counter()
+    fmm = acoustotreams.ClusterFMM(basis, k0, material)
+    fmm_setup = time.perf_counter() - start
+    start = time.perf_counter()
+    res = fmm @ x
+    fmm_apply = time.perf_counter() - start
+    err = np.linalg.norm(res - expect) / np.linalg.norm(expect)
+    # Speed-up of one application compared to the dense translations without storage
+    speedup = (dense_setup + dense_apply) / fmm_apply
+    print(
+        f"{n:>6} {dense_setup:>12.3f} {dense_apply:>12.4f} "
+        f"{fmm_setup:>10.3f} {fmm_apply:>10.4f} {err:>11.2e} {speedup:>9.1f}"
+    )
+    if n == nsolve:
+        solve_positions = positions
+
+sphere = acoustotreams.AcousticTMatrix.sphere(lmax, k0, [0.02], materials)
+tm = acoustotreams.AcousticTMatrix.cluster(
+    [sphere] * nsolve, solve_positions, blocks=True
+)
+inc = acoustotreams.plane_wave_scalar([0, 0, 1], k0=k0, material=tm.material)
+start = time.perf_counter()
+dense, info = tm.interaction.solve_iterative(inc)
+dense = np.asarray(dense)
+print(
+    f"iterative solve, dense: {time.perf_counter() - start:.2f} s, "
+    f"{info['iterations']} iterations"
+)
+start = time.perf_counter()
+res, info = tm.interaction.solve_iterative(inc, fmm=True)
+print(
+    f"iterative solve, fmm:   {time.perf_counter() - start:.2f} s, "
+    f"{info['iterations']} iterations, "
+    f"rel. error {np.linalg.norm(np.asarray(res - dense)) / np.linalg.norm(dense):.2e}"
+)
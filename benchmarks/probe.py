@@ -0,0 +1,54 @@
+"""Benchmark of the repeated field evaluation on a fixed grid.
+
+The pressure field scattered by a cluster of two spheres is evaluated on a grid in the
+xz-plane for many incident plane waves. It is computed once with one call of
+:func:`acoustotreams.field_map` per incident wave and once with a
+:class:`acoustotreams.FieldProbe`, which is built once and stored uncompressed, with a
+truncated singular value decomposition, and in single precision. The build time, the
+size of the stored matrices, the time for all evaluations, and the maximal difference
+relative to the largest field value are printed.
+
+Run it with `python benchmarks/probe.py`.
+"""
+
+import time
+
+import numpy as np
+
+import acoustotreams
+
+k0 = 2 * np.pi * 150000 / acoustotreams.AcousticMaterial().c
+materials = [(1050 + 100j, 2350 - 300j), (998, 1497)]
+sphere = acoustotreams.AcousticTMatrix.sphere(3, k0, 0.005, materials)
+tm = acoustotreams.AcousticTMatrix.cluster(
+    [sphere, sphere], [[0.0075, 0, 0], [-0.0075, 0, 0]]
+).interaction.solve()
+x = np.linspace(-0.02, 0.02, 101)
+grid = np.stack(np.meshgrid(x, 0, x, indexing="ij"), axis=-1)[:, 0].swapaxes(0, 1)
+points = grid[tm.valid_points(grid, [0.005, 0.005])]
+scas = [
+    tm.sca(acoustotreams.plane_wave_angle_scalar(theta, 0, k0=k0, material=tm.material))
+    for theta in np.linspace(0, np.pi, 100)
+]
+
+start = time.perf_counter()
+expect = np.stack([acoustotreams.field_map(sca, points) for sca in scas], axis=-1)
+print(f"{'method':>10} {'build':>8} {'MB':>7} {'eval':>8} {'rel. diff':>10}")
+print(f"{'field_map':>10} {'':>8} {'':>7} {time.perf_counter() - start:>8.4f}")
+for name, kwargs in [
+    ("dense", {}),
+    ("svd", {"rtol": 1e-12}),
+    ("complex64", {"dtype": np.complex64}),
+]:
+    probe = acoustotreams.PField(points).probe(
+        basis=tm.basis, k0=k0, material=tm.material, modetype="singular", **kwargs
+    )
+    start = time.perf_counter()
+    res = np.stack([probe @ sca for sca in scas], axis=-1)
+    teval = time.perf_counter() - start
+    info = probe.info()
+    diff = np.max(np.abs(res - expect)) / np.max(np.abs(expect))
+    print(
+        f"{name:>10} {info['build_time']:>8.4f} {info['nbytes'] / 2 ** 20:>7.2f} "
+        f"{teval:>8.4f} {diff:>10.2e}"
+    )
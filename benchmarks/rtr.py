@@ -0,0 +1,42 @@
+"""Benchmark of the rotate-translate-rotate evaluation of spherical translations.
+
+The expansion matrix of the singular modes of a small cluster in the regular modes is
+created once with the method "array" and once with the method "rtr" of
+:func:`acoustotreams.ssw.translate` for increasing maximal degrees. The times, the
+method of the automatic choice, and the maximal difference relative to the largest
+coefficient are printed. The coupling coefficients are computed before the timing.
+
+Run it with `python benchmarks/rtr.py`.
+"""
+
+import time
+
+import numpy as np
+
+import acoustotreams
+from acoustotreams import ssw
+
+k0 = 3
+positions = np.random.default_rng(0).random((4, 3)) * 2
+material = acoustotreams.AcousticMaterial()
+
+
+def run(basis, method):
+    start = time.perf_counter()
+    res = acoustotreams.expand(
+        basis, ("regular", "singular"), k0=k0, material=material, method=method
+    )
+    return time.perf_counter() - start, np.asarray(res)
+
+
+print(f"{'lmax':>4} {'array':>9} {'rtr':>9} {'auto':>6} {'rel. diff':>10}")
+for lmax in (1, 2, 4, 6, 8, 10, 12, 16, 20):
+    acoustotreams.special.coefficients.get("tl_ssw", lmax)
+    basis = acoustotreams.ScalarSphericalWaveBasis.default(
+        lmax, len(positions), positions
+    )
+    tarray, expect = run(basis, "array")
+    trtr, res = run(basis, "rtr")
+    auto = "rtr" if lmax >= ssw._RTR_LMAX else "array"
+    diff = np.max(np.abs(res - expect)) / np.max(np.abs(expect))
+    print(f"{lmax:>4} {tarray:>9.4f} {trtr:>9.4f} {auto:>6} {diff:>10.2e}")
@@ -1,6 +1,5 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from joblib import Parallel, delayed
 
 import acoustotreams
 
@@ -25,22 +24,12 @@ xs = tm.xs(inc)
 
 x = np.linspace(-0.02, 0.02, 101)
 z = np.linspace(-0.02, 0.02, 101)
-def compute_intensity(i, j, tm, radii, inc, sca):
-    r = [x[j], 0, z[i]]
-    result = 0  
-    if tm.valid_points(r, radii): 
-        result = np.abs(inc.pfield(r) + sca.pfield(r))**2  
-    else:
-        result = np.nan
-    return i, j, result  
-results = Parallel(n_jobs=-1)(
-    delayed(compute_intensity)(i, j, tm, radii, inc, sca) 
-    for i in range(len(z)) 
-    for j in range(len(x))
+grid = np.stack(np.meshgrid(x, 0, z, indexing="ij"), axis=-1)[:, 0].swapaxes(0, 1)
+valid = tm.valid_points(grid, radii)
+field = acoustotreams.field_map(inc, grid) + acoustotreams.field_map(
+    sca, grid, valid=valid
 )
-intensity = np.zeros((len(z), len(x)))
-for i, j, result in results:
-    intensity[i, j] = result
+intensity = np.abs(field) ** 2
 
 fig, ax = plt.subplots()
 cax = ax.imshow(
@@ -77,12 +66,11 @@ tm_global = tm.expand(acoustotreams.ScalarSphericalWaveBasis.default(10))
 sca = tm_global.sca(inc)
 xs = tm_global.xs(inc)
 
-results_global = Parallel(n_jobs=-1)(
-    delayed(compute_intensity)(i, j, tm_global, [0.0125], inc, sca) for i in range(len(z)) for j in range(len(x))
+valid = tm_global.valid_points(grid, [0.0125])
+field = acoustotreams.field_map(inc, grid) + acoustotreams.field_map(
+    sca, grid, valid=valid
 )
-intensity_global = np.zeros((len(z), len(x)))
-for i, j, result in results_global:
-    intensity_global[i, j] = result
+intensity_global = np.abs(field) ** 2
 
 fig, ax = plt.subplots()
 cax = ax.imshow(
@@ -118,12 +106,11 @@ inc = acoustotreams.plane_wave_scalar([k0, 0, 0], k0=tm.k0, material=tm.material
 tm_rotate = tm_global.rotate(0, np.pi / 2)
 sca = tm_rotate.sca(inc)
 
-results_rotate = Parallel(n_jobs=-1)(
-    delayed(compute_intensity)(i, j, tm_rotate, [0.0125], inc, sca) for i in range(len(z)) for j in range(len(x))
+valid = tm_rotate.valid_points(grid, [0.0125])
+field = acoustotreams.field_map(inc, grid) + acoustotreams.field_map(
+    sca, grid, valid=valid
 )
-intensity_rotate = np.zeros((len(z), len(x)))
-for i, j, result in results_rotate:
-    intensity_rotate[i, j] = result
+intensity_rotate = np.abs(field) ** 2
 
 fig, ax = plt.subplots()
 cax = ax.imshow(
@@ -1,6 +1,5 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from joblib import Parallel, delayed
 
 import acoustotreams
 
@@ -26,29 +25,15 @@ sca = tm.sca(inc)
 
 x = np.linspace(-0.0075, 0.0075, 101)
 y = np.linspace(-0.0075, 0.0075, 101)
-def compute_intensity(i, j):
-    r = [x[j], y[i], 0]
-    result = 0  
-    if tm.valid_points(r, [radius]): 
-        result = np.abs(inc.pfield(r) + sca.pfield(r))**2  
-    else:
-        result = np.nan
-    return i, j, result  
-results = Parallel(n_jobs=-1)(
-    delayed(compute_intensity)(i, j) for i in range(len(y)) for j in range(len(x))
+grid = np.stack(np.meshgrid(x, y, 0, indexing="xy"), axis=-1)[..., 0, :]
+valid = tm.valid_points(grid, [radius])
+field = acoustotreams.field_map(inc, grid) + acoustotreams.field_map(
+    sca, grid, valid=valid
 )
-intensity = np.zeros((len(y), len(x)))
-for i, j, result in results:
-    intensity[i, j] = result
+intensity = np.abs(field) ** 2
 
 phi = np.linspace(0, 2 * np.pi, 301)
-radpattern = np.zeros(len(phi))
-def compute_radpattern(i):
-    n = [np.cos(phi[i]), np.sin(phi[i]), 0]
-    return np.abs(sca.pamplitudeff(n))**2
-radpattern = Parallel(n_jobs=-1)(
-    delayed(compute_radpattern)(i) for i in range(len(phi))
-)
+radpattern = tm.xw_differential(sca, phi)
 
 fig, ax = plt.subplots()
 ax.plot(k0s * acoustotreams.AcousticMaterial().c / (2 * np.pi) / 1000, xw_ext)
@@ -197,4 +197,50 @@ class TestArray:
             np.all(np.abs(sm[i, j] - self.expect[i, j]) < 1e-8)
             for i in range(2)
             for j in range(2)
-        )
\ No newline at end of file
+        )
+
+class TestStacked:
+    basis = acoustotreams.ScalarPlaneWaveBasisByComp.default([[1, 2], [0, 0], [3, 1]])
+    sm = AcousticSMatrices.slab(3, basis, 12, [(200, 1029,), (900, 686,), (100, 343,)])
+
+    def test_illuminate(self):
+        illu = np.eye(3)
+        res = self.sm.illuminate(illu, smat=self.sm)
+        for i in range(3):
+            expect = self.sm.illuminate(illu[:, i], smat=self.sm)
+            assert all(
+                np.all(np.abs(np.asarray(a)[:, i] - b) < 1e-14)
+                for a, b in zip(res, expect)
+            )
+
+    def test_tr(self):
+        illu = np.eye(3)
+        res = self.sm.tr(illu)
+        assert res[0].shape == res[1].shape == (3,)
+        for i in range(3):
+            expect = self.sm.tr(illu[:, i])
+            assert np.all(np.abs(np.array(res)[:, i] - expect) < 1e-14)
+
+
+class TestFastAnnotations:
+    basis = acoustotreams.ScalarPlaneWaveBasisByComp.default([[1, 2], [0, 0], [3, 1]])
+    sm = AcousticSMatrices.slab(3, basis, 12, [(200, 1029,), (900, 686,), (100, 343,)])
+
+    def test_add(self):
+        expect = self.sm.add(self.sm)
+        with acoustotreams.fast_annotations():
+            res = self.sm.add(self.sm)
+        assert res == expect and all(
+            res[i, j].ann == expect[i, j].ann for i in range(2) for j in range(2)
+        )
+
+    def test_illuminate(self):
+        illu = acoustotreams.AcousticsArray(
+            [1, 0, 0], basis=self.basis, k0=12.0, modetype="up"
+        )
+        expect = self.sm.illuminate(illu, smat=self.sm)
+        with acoustotreams.fast_annotations():
+            res = self.sm.illuminate(illu, smat=self.sm)
+        assert all(
+            np.all(np.asarray(a) == b) and a.ann == b.ann for a, b in zip(res, expect)
+        )
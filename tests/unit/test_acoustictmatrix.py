@@ -2,6 +2,7 @@ import copy
 
 import numpy as np
 import pytest
+import scipy.integrate as si
 
 import acoustotreams
 from acoustotreams import AcousticTMatrix
@@ -58,6 +59,38 @@ class TestSphere:
             AcousticTMatrix.sphere(2, 3, 4, [(200, 1000, 500), (900, 800, 10)])
 
 
+class TestSphereSweep:
+    def test(self):
+        materials = [(200, 1000, 500), (900, 800, 0)]
+        tms = AcousticTMatrix.sphere_sweep(2, [1, 3], 4, materials)
+        assert len(tms) == 2 and tms.coeffs.shape == (2, 3)
+        for tm, k0 in zip(tms, [1, 3]):
+            expect = AcousticTMatrix.sphere(2, k0, 4, materials)
+            assert (
+                np.all(np.abs(tm - expect) < 1e-14)
+                and tm.k0 == k0
+                and tm.material == expect.material
+                and tm.basis == expect.basis
+            )
+
+    def test_slice(self):
+        tms = AcousticTMatrix.sphere_sweep(1, [1, 2, 3], 4, [(0, 0, 0), (900, 800, 0)])
+        assert len(tms[1:]) == 2 and tms[1:][0].k0 == 2
+
+
+class TestGetitem:
+    def test_basis(self):
+        tm = AcousticTMatrix.sphere(3, 3, 4, [(200, 1000, 0), (900, 800, 0)])
+        basis = acoustotreams.ScalarSphericalWaveBasis([[2, 1], [0, 0], [1, -1]])
+        sub = tm[basis]
+        assert np.all(np.diag(sub) == np.diag(tm)[[7, 0, 1]]) and sub.basis == basis
+
+    def test_missing(self):
+        tm = AcousticTMatrix.sphere(1, 3, 4, [(200, 1000, 0), (900, 800, 0)])
+        with pytest.raises(ValueError):
+            tm[acoustotreams.ScalarSphericalWaveBasis.default(2)]
+
+
 class TestProperties:
     def test_xs_ext_avg(self):
         tm = AcousticTMatrix.sphere(2, 3, [4], [(200 + 10j, 1000 - 100j, 500 - 50j), (900, 800, 0)])
@@ -91,6 +124,135 @@ class TestXs:
         xs = tm.xs(inc, 0.125)
         assert isclose(xs[0], 62.0117757010729,) and isclose(xs[1], 98.41537907486989)
 
+    def test_stacked(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.3], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([tm, tm], [[0, 0, 0], [0.5, 0.2, 0]])
+        basis = acoustotreams.ScalarPlaneWaveBasisByUnitVector(
+            [[0, 0, 1], [0, 0.6, 0.8], [1, 0, 0]]
+        )
+        inc = acoustotreams.AcousticsArray(
+            np.eye(3),
+            basis=(basis, None),
+            k0=(tm.k0, None),
+            material=(tm.material, None),
+        )
+        sca = tm.sca(inc)
+        xs = tm.xs(inc)
+        assert sca.shape == (len(tm.basis), 3) and xs[0].shape == xs[1].shape == (3,)
+        for i in range(3):
+            assert np.all(np.abs(sca[:, i] - tm.sca(inc[:, i])) < 1e-14)
+            expect = tm.xs(inc[:, i])
+            assert isclose(xs[0][i], expect[0]) and isclose(xs[1][i], expect[1])
+
+
+class TestXsOrientationAverage:
+    def test_global(self):
+        tm = AcousticTMatrix.sphere(3, 3, [0.5], [(1000, 1500, 0), (1.3, 343, 0)])
+        for quadrature in ("lebedev", "gauss-legendre"):
+            sca, ext = tm.xs_orientation_average(quadrature)
+            assert isclose(sca, tm.xs_sca_avg) and isclose(ext, tm.xs_ext_avg)
+
+    def test_cluster(self):
+        sphere = AcousticTMatrix.sphere(2, 3, [0.2], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([sphere, sphere], [[0, 0, 0], [0.5, 0, 0.2]])
+        tm = AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=3)
+        glob = tm.expand(acoustotreams.ScalarSphericalWaveBasis.default(12))
+        for quadrature in ("lebedev", "gauss-legendre"):
+            sca, ext = tm.xs_orientation_average(quadrature, 31)
+            assert isclose(sca, glob.xs_sca_avg, 1e-6)
+            assert isclose(ext, glob.xs_ext_avg, 1e-6)
+
+    def test_directions(self):
+        sphere = AcousticTMatrix.sphere(2, 3, [0.2], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([sphere, sphere], [[0, 0, 0], [0.5, 0, 0.2]])
+        tm = AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=3)
+        sca, ext = tm.xs_orientation_average("gauss-legendre", 5)
+        cos, weights = np.polynomial.legendre.leggauss(3)
+        expect = np.zeros(2)
+        for theta, weight in zip(np.arccos(cos), weights):
+            for phi in np.arange(6) * np.pi / 3:
+                inc = acoustotreams.plane_wave_angle_scalar(theta, phi, k0=3)
+                expect += np.array(tm.xs(inc)) * weight / 12
+        assert isclose(sca, expect[0]) and isclose(ext, expect[1])
+
+    def test_block(self):
+        sphere = AcousticTMatrix.sphere(2, 3, [0.2], [(1000, 1500, 0), (1.3, 343, 0)])
+        positions = [[0, 0, 0], [0.5, 0, 0.2], [0, 0.6, 0]]
+        dense = AcousticTMatrix.cluster([sphere] * 3, positions)
+        block = AcousticTMatrix.cluster([sphere] * 3, positions, blocks=True)
+        expect = dense.xs_orientation_average()
+        res = block.xs_orientation_average()
+        assert isclose(res[0], expect[0]) and isclose(res[1], expect[1])
+
+    def test_fallback(self, monkeypatch):
+        sphere = AcousticTMatrix.sphere(1, 10, [0.5], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([sphere, sphere], [[0, 0, -7], [0, 0, 7]])
+        tm = AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=10)
+        expect = tm.xs_orientation_average("gauss-legendre")
+        assert tm.xs_orientation_average() == expect
+        tm = AcousticTMatrix.sphere(1, 3, [0.5], [(1000, 1500, 0), (1.3, 343, 0)])
+        monkeypatch.delattr(si, "lebedev_rule", raising=False)
+        sca, ext = tm.xs_orientation_average()
+        assert isclose(sca, tm.xs_sca_avg) and isclose(ext, tm.xs_ext_avg)
+
+    def test_invalid(self):
+        tm = AcousticTMatrix.sphere(1, 3, [0.5], [(1000, 1500, 0), (1.3, 343, 0)])
+        with pytest.raises(ValueError):
+            tm.xs_orientation_average("trapezoid")
+
+
+class TestRadiationPattern:
+    def cluster(self):
+        sphere = AcousticTMatrix.sphere(2, 3, [0.2], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([sphere, sphere], [[0, 0, 0], [0.5, 0, 0.2]])
+        return AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=3)
+
+    def test(self):
+        tm = self.cluster()
+        sca = tm.sca(acoustotreams.plane_wave_angle_scalar(0.4, 0.2, k0=3))
+        theta, phi = np.array([[0], [1.2], [np.pi]]), np.array([0.3, -2])
+        res = tm.radiation_pattern(sca, theta, phi)
+        assert res.shape == (3, 2)
+        for i in range(3):
+            for j in range(2):
+                r = [
+                    np.sin(theta[i, 0]) * np.cos(phi[j]),
+                    np.sin(theta[i, 0]) * np.sin(phi[j]),
+                    np.cos(theta[i, 0]),
+                ]
+                expect = sca @ acoustotreams.pamplitudeff(r, basis=tm.basis, k0=3)[0]
+                assert isclose(res[i, j], expect)
+        expect = np.abs(res) ** 2
+        assert np.all(np.abs(tm.xs_differential(sca, theta, phi) - expect) < 1e-14)
+
+    def test_xs(self):
+        tm = self.cluster()
+        inc = acoustotreams.plane_wave_angle_scalar(0.4, 0.2, k0=3)
+        expect = tm.xs(inc)[0]
+        for quadrature in ("lebedev", "gauss-legendre"):
+            assert isclose(tm.xs_sca_farfield(tm.sca(inc), quadrature), expect)
+
+    def test_stacked(self):
+        tm = self.cluster()
+        sca = tm.sca(acoustotreams.plane_wave_angle_scalar(0.4, 0.2, k0=3))
+        stacked = np.asarray(sca)[:, None] * [1, 2]
+        assert tm.radiation_pattern(stacked, [0.1, 2], 0.5).shape == (2, 2)
+        res = tm.xs_sca_farfield(stacked)
+        expect = tm.xs_sca_farfield(sca)
+        assert isclose(res[0], expect) and isclose(res[1], 4 * expect)
+
+    def test_large(self):
+        sphere = AcousticTMatrix.sphere(1, 10, [0.5], [(1000, 1500, 0), (1.3, 343, 0)])
+        tm = AcousticTMatrix.cluster([sphere, sphere], [[0, 0, -5], [0, 0, 5]])
+        tm = AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=10)
+        inc = acoustotreams.plane_wave_angle_scalar(0.4, 0.2, k0=10)
+        assert isclose(tm.xs_sca_farfield(tm.sca(inc)), tm.xs(inc)[0], 1e-8)
+
+    def test_invalid(self):
+        tm = self.cluster()
+        with pytest.raises(ValueError):
+            tm.radiation_pattern(np.ones(3), 0.1, 0.2)
+
 
 class TestSca:
     def test(self):
@@ -135,4 +297,200 @@ class TestClusterRotate:
         rs2 = (a @ b @ c @ rs1.T).T
         tm2 = AcousticTMatrix.cluster(tms, rs2)
         tm2 = tm2.interaction.solve().expand(acoustotreams.ScalarSphericalWaveBasis.default(3))
-        assert np.all(np.abs(tm1 - tm2) < 1e-16)
\ No newline at end of file
+        assert np.all(np.abs(tm1 - tm2) < 1e-16)
+
+class TestBlockCluster:
+    mat = [(1000, 1500, 0), (1.3, 343, 0)]
+    rs = [[0, 0, 0], [1, 0, 0], [0, 1, 0.5], [0.3, -1, 0]]
+
+    def tmats(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.2], self.mat)
+        return [
+            tm,
+            AcousticTMatrix.sphere(1, 3, [0.3], self.mat),
+            AcousticTMatrix.sphere(2, 3, [0.2], self.mat),
+            tm,
+        ]
+
+    def test_distinct(self):
+        tm = AcousticTMatrix.cluster(self.tmats(), self.rs, blocks=True)
+        assert len(tm.tmats) == 2 and np.all(tm.tidx == [0, 1, 0, 0])
+        assert np.all(tm.dense() == AcousticTMatrix.cluster(self.tmats(), self.rs))
+
+    def test_matmul(self):
+        dense = AcousticTMatrix.cluster(self.tmats(), self.rs)
+        tm = AcousticTMatrix.cluster(self.tmats(), self.rs, blocks=True)
+        x = np.random.rand(len(tm.basis), 3)
+        assert np.all(np.abs(tm @ x - dense @ x) < 1e-14)
+        assert np.all(np.abs(x.T @ tm - x.T @ dense) < 1e-14)
+
+    def test_sca_xs(self):
+        dense = AcousticTMatrix.cluster(self.tmats(), self.rs)
+        tm = acoustotreams.AcousticBlockTMatrix(self.tmats(), self.rs)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3, material=tm.material)
+        sca = tm.sca(inc)
+        assert np.all(np.abs(sca - dense.sca(inc)) < 1e-14)
+        assert sca.basis == dense.basis and sca.modetype == "singular"
+        assert all(isclose(a, b) for a, b in zip(tm.xs(inc), dense.xs(inc)))
+
+    def test_stacked(self):
+        dense = AcousticTMatrix.cluster(self.tmats(), self.rs)
+        tm = acoustotreams.AcousticBlockTMatrix(self.tmats(), self.rs)
+        inc = acoustotreams.expand(
+            (dense.basis, acoustotreams.ScalarPlaneWaveBasisByUnitVector([[0, 0, 1], [0.6, 0, 0.8]])),
+            "regular",
+            k0=3,
+            material=tm.material,
+        )
+        assert np.all(np.abs(tm.sca(inc) - dense.sca(inc)) < 1e-14)
+        for a, b in zip(tm.xs(inc), dense.xs(inc)):
+            assert a.shape == (2,) and all(isclose(x, y) for x, y in zip(a, b))
+
+    def test_expand(self):
+        dense = AcousticTMatrix.cluster(self.tmats(), self.rs)
+        tm = AcousticTMatrix.cluster(self.tmats(), self.rs, blocks=True)
+        basis = acoustotreams.ScalarSphericalWaveBasis.default(3)
+        res = tm.expand(basis)
+        assert isinstance(res, AcousticTMatrix) and res.basis == basis
+        assert np.all(np.abs(res - dense.expand(basis)) < 1e-14)
+
+    def test_interaction(self):
+        dense = AcousticTMatrix.cluster(self.tmats(), self.rs)
+        tm = AcousticTMatrix.cluster(self.tmats(), self.rs, blocks=True)
+        assert np.all(np.abs(tm.interaction() - dense.interaction()) < 1e-14)
+        assert np.all(
+            np.abs(tm.interaction.solve() - dense.interaction.solve()) < 1e-12
+        )
+
+
+class TestSolveIterative:
+    mat = [(1000, 1500, 0), (1.3, 343, 0)]
+    rs = np.array(
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0.5], [0.3, -1, 0], [1.2, 1.1, -0.4]]
+    )
+
+    @pytest.mark.parametrize("method", ["gmres", "bicgstab"])
+    @pytest.mark.parametrize("blocks", [False, True])
+    def test(self, method, blocks):
+        tms = [AcousticTMatrix.sphere(2, 3, [0.2], self.mat)] * len(self.rs)
+        tm = AcousticTMatrix.cluster(tms, self.rs, blocks=blocks)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3, material=tm.material)
+        expect = AcousticTMatrix.cluster(tms, self.rs).interaction.solve().sca(inc)
+        res, info = tm.interaction.solve_iterative(inc, method=method, tol=1e-10)
+        assert info["converged"] and info["iterations"] > 0
+        assert info["residuals"] < 1e-10
+        assert res.basis == expect.basis and res.modetype == "singular"
+        assert np.all(np.abs(res - expect) < 1e-8 * np.max(np.abs(expect)))
+
+    @pytest.mark.parametrize("cache", [False, True])
+    def test_block_jacobi(self, cache):
+        tms = [AcousticTMatrix.sphere(2, 3, [0.2], self.mat)] * len(self.rs)
+        tm = AcousticTMatrix.cluster(tms, self.rs)
+        # The T-matrix of the solved cluster couples the expansion centers
+        tm = AcousticTMatrix(tm.interaction.solve(), basis=tm.basis, k0=3)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3, material=tm.material)
+        expect = tm.interaction.solve().sca(inc)
+        res, info = tm.interaction.solve_iterative(
+            inc, tol=1e-10, precond="block_jacobi", cache=cache
+        )
+        assert info["converged"]
+        assert np.all(np.abs(res - expect) < 1e-8 * np.max(np.abs(expect)))
+
+    def test_block_jacobi_identity(self):
+        tms = [AcousticTMatrix.sphere(2, 3, [0.2], self.mat)] * len(self.rs)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3)
+        for blocks in (False, True):
+            tm = AcousticTMatrix.cluster(tms, self.rs, blocks=blocks)
+            expect, _ = tm.interaction.solve_iterative(inc)
+            res, _ = tm.interaction.solve_iterative(inc, precond="block_jacobi")
+            assert np.all(res == expect)
+
+    def test_multiple(self):
+        tms = [AcousticTMatrix.sphere(2, 3, [0.2], self.mat)] * len(self.rs)
+        tm = AcousticTMatrix.cluster(tms, self.rs, blocks=True)
+        inc = acoustotreams.plane_wave_scalar(
+            [0, 0.6, 0.8], k0=3, material=tm.material
+        ).expand(tm.basis, "regular")
+        incs = acoustotreams.AcousticsArray(
+            np.stack([np.asarray(inc), 2j * np.asarray(inc)], -1), (inc.ann[0], {})
+        )
+        res, info = tm.interaction.solve_iterative(incs, precond=None, cache=False)
+        assert res.shape == (len(tm.basis), 2) and info["iterations"].shape == (2,)
+        assert np.all(np.abs(res[:, 1] - 2j * res[:, 0]) < 1e-12)
+
+    def test_no_convergence(self):
+        tms = [AcousticTMatrix.sphere(2, 3, [0.2], self.mat)] * len(self.rs)
+        tm = AcousticTMatrix.cluster(tms, self.rs, blocks=True)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3, material=tm.material)
+        with pytest.warns(UserWarning):
+            _, info = tm.interaction.solve_iterative(
+                inc, method="bicgstab", tol=1e-15, maxiter=1
+            )
+        assert not info["converged"]
+
+    def test_invalid(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.2], self.mat)
+        with pytest.raises(ValueError):
+            tm.interaction.solve_iterative([1, 0, 0, 0, 0, 0, 0, 0, 0], method="lu")
+
+
+class TestFactorize:
+    def tmat(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.3], [(1000, 1500, 0), (1.3, 343, 0)])
+        return AcousticTMatrix.cluster([tm, tm], [[0, 0, 0], [0.5, 0.2, 0]])
+
+    def test_solve(self):
+        tm = self.tmat()
+        fac = tm.interaction.factorize()
+        expect = np.linalg.solve(tm.interaction(), tm)
+        res = fac.tmatrix()
+        assert isinstance(res, AcousticTMatrix) and res.ann == expect.ann
+        assert np.all(np.abs(res - expect) < 1e-14)
+        assert np.all(np.abs(tm.interaction.solve() - expect) < 1e-14)
+        inc = acoustotreams.plane_wave_scalar([0, 0.6, 0.8], k0=3, material=tm.material)
+        sca = fac.solve(tm.sca(inc))
+        assert np.all(np.abs(sca - expect.sca(inc)) < 1e-14)
+        assert sca.modetype == "singular"
+
+    def test_det(self):
+        tm = self.tmat()
+        fac = tm.interaction.factorize()
+        expect = np.linalg.det(np.asarray(tm.interaction()))
+        assert isclose(fac.det(), expect)
+        assert isclose(np.real(fac.logdet()), np.log(np.abs(expect)))
+
+    def test_cache(self):
+        tm = self.tmat()
+        fac = tm.interaction.factorize()
+        assert tm.interaction.factorize() is fac
+        tm.k0 = 4
+        other = tm.interaction.factorize()
+        assert other is not fac and other.key[0] == 4
+
+    def test_cache_data(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.3], [(1000, 1500, 0), (1.3, 343, 0)])
+        lattice = acoustotreams.Lattice.square(1.5)
+        fac = tm.latticeinteraction.factorize(lattice, [0.1, 0.2])
+        tm[0, 0] *= 2
+        assert tm.latticeinteraction.factorize(lattice, [0.1, 0.2]) is not fac
+        expect = np.linalg.solve(tm.latticeinteraction(lattice, [0.1, 0.2]), tm)
+        res = tm.latticeinteraction.solve(lattice, [0.1, 0.2])
+        assert np.all(np.abs(res - expect) < 1e-14)
+
+    def test_solve_not_stored(self):
+        tm = self.tmat()
+        tm.interaction.solve()
+        assert getattr(tm, "_interaction_lu", None) is None
+        fac = tm.interaction.factorize()
+        tm.interaction.solve()
+        assert tm.interaction.factorize() is fac
+
+    def test_lattice(self):
+        tm = AcousticTMatrix.sphere(2, 3, [0.3], [(1000, 1500, 0), (1.3, 343, 0)])
+        lattice = acoustotreams.Lattice.square(1.5)
+        fac = tm.latticeinteraction.factorize(lattice, [0.1, 0.2])
+        assert tm.latticeinteraction.factorize(lattice, [0.1, 0.2]) is fac
+        assert tm.latticeinteraction.factorize(lattice, [0.1, 0.3]) is not fac
+        expect = np.linalg.solve(tm.latticeinteraction(lattice, [0.1, 0.2]), tm)
+        res = tm.latticeinteraction.solve(lattice, [0.1, 0.2])
+        assert np.all(np.abs(res - expect) < 1e-14)
@@ -70,6 +70,21 @@ class TestCylinder:
         )
 
 
+class TestCylinderSweep:
+    def test(self):
+        materials = [(200, 1000, 0), (900, 686, 0)]
+        tms = AcousticTMatrixC.cylinder_sweep([-1, 1], 2, [2.5, 3], 4, materials)
+        assert len(tms) == 2 and tms.coeffs.shape == (2, 10)
+        for tm, k0 in zip(tms, [2.5, 3]):
+            expect = AcousticTMatrixC.cylinder([-1, 1], 2, k0, 4, materials)
+            assert (
+                np.all(np.abs(tm - expect) < 1e-14)
+                and tm.k0 == k0
+                and tm.basis == expect.basis
+                and tm.material == expect.material
+            )
+
+
 class TestProperties:
     def test_xw_ext_avg_ct_zero(self):
         tm = AcousticTMatrixC.cylinder([-1, 1], 1, 3, [4], [(200 + 10j, 1000 - 100j, 0), (900, 686, 0)])
@@ -111,6 +126,68 @@ class TestXw:
         xw = tm.xw(inc, 0.1255)
         assert isclose(xw[0], 5.892670869743773,) and isclose(xw[1], 5.902641304396861)
 
+    def test_stacked(self):
+        kz = 1
+        tm = AcousticTMatrixC.cylinder(kz, 1, 3, [0.4], [(200 + 10j, 1000 - 100j, 0), ()])
+        tm = AcousticTMatrixC.cluster([tm, tm], [[0, 0, 0], [1, 0.5, 0]])
+        qx = np.sqrt(tm.k0 * tm.k0 - kz * kz) / tm.k0
+        basis = acoustotreams.ScalarPlaneWaveBasisByUnitVector(
+            [[qx, 0, kz / tm.k0], [0, qx, kz / tm.k0]]
+        )
+        inc = acoustotreams.AcousticsArray(
+            np.eye(2),
+            basis=(basis, None),
+            k0=(tm.k0, None),
+            material=(tm.material, None),
+        )
+        xw = tm.xw(inc)
+        assert xw[0].shape == xw[1].shape == (2,)
+        for i in range(2):
+            expect = tm.xw(inc[:, i])
+            assert isclose(xw[0][i], expect[0]) and isclose(xw[1][i], expect[1])
+
+
+class TestRadiationPattern:
+    def test(self):
+        tm = AcousticTMatrixC.cylinder([-1, 1], 2, 3, [0.4], [(1000, 1500, 0), ()])
+        tm = AcousticTMatrixC.cluster([tm, tm], [[0, 0, 0], [1, 0.5, 0]])
+        sca = np.random.default_rng(0).normal(size=len(tm.basis))
+        phi, z = np.array([0.3, 2, -1]), np.array([[0], [0.4]])
+        res = tm.radiation_pattern(sca, phi, z)
+        assert res.shape == (2, 3)
+        for i in range(2):
+            for j in range(3):
+                r = [np.cos(phi[j]), np.sin(phi[j]), z[i, 0]]
+                expect = sca @ acoustotreams.pamplitudeff(r, basis=tm.basis, k0=3)[0]
+                assert isclose(res[i, j], expect)
+
+    def test_xw(self):
+        kz = 1
+        tm = AcousticTMatrixC.cylinder(kz, 2, 3, [0.4], [(200 + 10j, 1000 - 100j, 0), ()])
+        tm = AcousticTMatrixC.cluster([tm, tm], [[0, 0, 0], [1, 0.5, 0]])
+        tm = AcousticTMatrixC(tm.interaction.solve(), basis=tm.basis, k0=3)
+        qx = np.sqrt(tm.k0 * tm.k0 - kz * kz) / tm.k0
+        basis = acoustotreams.ScalarPlaneWaveBasisByUnitVector(
+            [[qx, 0, kz / tm.k0], [0, qx, kz / tm.k0]]
+        )
+        inc = acoustotreams.AcousticsArray(
+            np.eye(2),
+            basis=(basis, None),
+            k0=(tm.k0, None),
+            material=(tm.material, None),
+        )
+        res = tm.xw_sca_farfield(tm.sca(inc))
+        expect = tm.xw(inc)[0]
+        assert isclose(res[0], expect[0]) and isclose(res[1], expect[1])
+        assert tm.xw_differential(tm.sca(inc), np.zeros((4, 5))).shape == (4, 5, 2)
+
+    def test_evanescent(self):
+        tm = AcousticTMatrixC.cylinder([0, 5], 1, 3, [0.4], [(1000, 1500, 0), ()])
+        sca = np.ones(len(tm.basis))
+        res = tm.xw_differential(sca, [0, 1])
+        expect = tm[tm.basis[:3]].xw_differential(sca[:3], [0, 1])
+        assert np.all(np.abs(res - expect) < 1e-14)
+
 
 class TestSca:
     def test(self):
@@ -120,4 +197,46 @@ class TestSca:
         sca = tm.sca(inc)
         assert (isclose(sca[0], 0.3506619987521309 + 0.14429243052400523j,) 
                 and isclose(sca[1], -0.8225873645046986 - 0.38088979145646645j)
-                and isclose(sca[2], -0.3506619987521309 - 0.14429243052400523j))
\ No newline at end of file
+                and isclose(sca[2], -0.3506619987521309 - 0.14429243052400523j))
+
+class TestBlockCluster:
+    def test(self):
+        kz = 1
+        tm = AcousticTMatrixC.cylinder(kz, 1, 3, [0.4], [(200 + 10j, 1000 - 100j, 0), ()])
+        rs = [[0, 0, 0], [1, 0.5, 0], [-1, 0, 0]]
+        dense = AcousticTMatrixC.cluster([tm] * 3, rs)
+        block = AcousticTMatrixC.cluster([tm] * 3, rs, blocks=True)
+        assert len(block.tmats) == 1
+        assert np.all(block.dense() == dense)
+        inc = acoustotreams.plane_wave_scalar([np.sqrt(tm.k0 * tm.k0 - kz * kz), 0, kz], k0=tm.k0, material=tm.material)
+        assert np.all(np.abs(block.sca(inc) - dense.sca(inc)) < 1e-14)
+        assert all(isclose(a, b) for a, b in zip(block.xw(inc), dense.xw(inc)))
+        assert np.all(
+            np.abs(block.interaction.solve() - dense.interaction.solve()) < 1e-12
+        )
+
+
+class TestFactorize:
+    def tmat(self):
+        tm = AcousticTMatrixC.cylinder(
+            [-0.5, 0.5, 1], 2, 3, [0.4], [(200 + 10j, 1000 - 100j, 0), ()]
+        )
+        return AcousticTMatrixC.cluster([tm, tm], [[0, 0, 0], [1, 0.5, 0]])
+
+    def test_kz_blocks(self):
+        tm = self.tmat()
+        fac = tm.interaction.factorize()
+        expect = np.linalg.solve(tm.interaction(), tm)
+        res = fac.tmatrix()
+        assert isinstance(res, AcousticTMatrixC) and res.ann == expect.ann
+        assert np.all(np.abs(res - expect) < 1e-14)
+        sign, logabsdet = np.linalg.slogdet(np.asarray(tm.interaction()))
+        assert isclose(fac.det(), sign * np.exp(logabsdet))
+
+    def test_coupled(self):
+        tm = self.tmat()
+        tm = AcousticTMatrixC(
+            np.asarray(tm) + 1e-3, k0=tm.k0, basis=tm.basis, material=tm.material
+        )
+        expect = np.linalg.solve(tm.interaction(), tm)
+        assert np.all(np.abs(tm.interaction.solve() - expect) < 1e-14)
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import acoustotreams.coeffs as cf
 
@@ -143,6 +144,30 @@ class TestMie:
 
 
 
+class TestMieBatch:
+    @pytest.mark.parametrize(
+        "x, rho, c, ct",
+        [
+            ([2], [1000, 900], [1200, 800], [500, 0]),
+            ([1, 2], [800, 1000, 900], [1000, 1200, 800], [0, 0, 0]),
+            ([1, 2], [800, 1000, 900], [1000, 1200, 800], [500, 0, 0]),
+            ([1, 2], [800, 1000, 900], [1000, 1200, 800], [500, 600, 0]),
+            ([1, 2], [800, 1000, 900], [1000, 1200, 800], [0, 600, 0]),
+            ([2], [0, 900], [0, 800], [0, 0]),
+            ([2], [np.inf, 900], [0, 800], [0, 0]),
+        ],
+    )
+    def test(self, x, rho, c, ct):
+        k0s = np.array([0.5, 1, 1.5])
+        res = cf.mie_acoustics_batch(
+            [0, 1, 2, 3], k0s[:, None, None] * np.array(x), rho, c, ct
+        )
+        expect = np.array(
+            [cf.mie_acoustics([0, 1, 2, 3], k0 * np.array(x), rho, c, ct) for k0 in k0s]
+        )
+        assert res.shape == (3, 4) and np.all(np.abs(res - expect) < EPSSQ)
+
+
 class TestMieCyl:
     def test_real(self):
         expect = 1.7330362995685293e-20 + 0.0002685792010794467j
@@ -171,6 +196,20 @@ class TestMieCyl:
                 < EPSSQ
         )
 
+    def test_broadcast(self):
+        kz = np.array([-0.5, 0.5])
+        m = np.array([-2, 0, 3])
+        k0 = np.array([1, 2 + 0.1j])
+        res = cf.mie_acoustics_cyl(
+            kz[:, None, None], m[:, None], k0, [1, 2], [1000, 1200, 900], [1200, 1000, 800], [0, 0, 0]
+        )
+        assert res.shape == (2, 3, 2)
+        for i, j, k in np.ndindex(*res.shape):
+            expect = cf.mie_acoustics_cyl(
+                kz[i], m[j], k0[k], [1, 2], [1000, 1200, 900], [1200, 1000, 800], [0, 0, 0]
+            )[0]
+            assert np.abs(res[i, j, k] - expect) < EPSSQ
+
 
 class TestFresnel:
     def test_real(self):
@@ -1,7 +1,11 @@
+import warnings
+
 import numpy as np
 import pytest
+from treams import util
 
 import acoustotreams
+from acoustotreams import _coreacoustics
 
 
 def isclose(a, b, rel_tol=1e-09, abs_tol=0.0):
@@ -98,6 +102,22 @@ class TestSSWB:
         b = acoustotreams.ScalarSphericalWaveBasis([[1, 0], [1, 1]])
         assert a == b[:1]
 
+    def test_getitem_duplicate(self):
+        a = acoustotreams.ScalarSphericalWaveBasis([[1, 1], [1, 0]])
+        b = acoustotreams.ScalarSphericalWaveBasis([[1, 0], [1, 1]])
+        assert a == b[[1, 0, 1]] and a == b[[False, True]] | b[:1]
+
+    def test_getitem_negative_duplicate(self):
+        a = acoustotreams.ScalarSphericalWaveBasis([[1, 1]])
+        b = acoustotreams.ScalarSphericalWaveBasis([[1, 0], [1, 1]])
+        assert a == b[[-1, 1]] and len(b[[-1, 1]]) == 1
+
+    def test_init_order(self):
+        b = acoustotreams.ScalarSphericalWaveBasis(
+            [[2, 1], [1, 0], [2, 1], [0, 0], [1, 0]]
+        )
+        assert np.all(b.l == [2, 1, 0]) and np.all(b.m == [1, 0, 0])
+
     def test_default(self):
         a = acoustotreams.ScalarSphericalWaveBasis.default(2, 2, [[0, 0, 0], [1, 0, 0]])
         b = acoustotreams.ScalarSphericalWaveBasis(
@@ -124,6 +144,26 @@ class TestSSWB:
         with pytest.raises(ValueError):
             acoustotreams.ScalarSphericalWaveBasis.defaultdim(1, -1)
 
+    def test_index(self):
+        b = acoustotreams.ScalarSphericalWaveBasis.default(2)
+        assert b.index((0, 2, -1)) == 5 and (0, 2, -1) in b and (0, 3, 0) not in b
+
+    def test_index_fail(self):
+        b = acoustotreams.ScalarSphericalWaveBasis.default(2)
+        with pytest.raises(ValueError):
+            b.index((0, 3, 0))
+
+    def test_indices(self):
+        a = acoustotreams.ScalarSphericalWaveBasis([[2, 0], [0, 0], [1, 1]])
+        b = acoustotreams.ScalarSphericalWaveBasis.default(2)
+        assert np.all(b.indices(a) == [6, 0, 3]) and b[b.indices(a)] == a
+
+    def test_indices_fail(self):
+        a = acoustotreams.ScalarSphericalWaveBasis.default(3)
+        b = acoustotreams.ScalarSphericalWaveBasis.default(2)
+        with pytest.raises(ValueError):
+            b.indices(a)
+
     def test_property_isglobal_true(self):
         b = acoustotreams.ScalarSphericalWaveBasis([[0, 0]])
         assert b.isglobal
@@ -143,6 +183,19 @@ class TestSSWB:
         b = acoustotreams.ScalarSphericalWaveBasis.default(1)
         assert not b == []
 
+    def test_hash(self):
+        a = acoustotreams.ScalarSphericalWaveBasis.default(1, 2, [[0, 0, 0], [1, 0, 0]])
+        b = acoustotreams.ScalarSphericalWaveBasis.default(1, 2, [[-0.0, 0, 0], [1, 0, 0]])
+        c = acoustotreams.ScalarSphericalWaveBasis.default(1, 2, [[0, 0, 0], [0, 1, 0]])
+        assert (
+            a == b
+            and a.digest == b.digest
+            and hash(a) == hash(b)
+            and a != c
+            and a.digest != c.digest
+            and {a: 1}[b] == 1
+        )
+
 
 class TestSCWB:
     def test_init_empty(self):
@@ -226,6 +279,21 @@ class TestSCWB:
         b = acoustotreams.ScalarCylindricalWaveBasis([[1, 0], [1, 1]])
         assert a == b[:1]
 
+    def test_getitem_duplicate(self):
+        a = acoustotreams.ScalarCylindricalWaveBasis([[1, 1], [1, 0]])
+        b = acoustotreams.ScalarCylindricalWaveBasis([[1, 0], [1, 1]])
+        assert a == b[[1, 0, 1]]
+
+    def test_getitem_negative_duplicate(self):
+        a = acoustotreams.ScalarCylindricalWaveBasis([[1, 1]])
+        b = acoustotreams.ScalarCylindricalWaveBasis([[1, 0], [1, 1]])
+        assert a == b[[-1, 1]] and len(b[[-1, 1]]) == 1
+
+    def test_default_duplicate(self):
+        a = acoustotreams.ScalarCylindricalWaveBasis.default([0.3, 0.3], 1)
+        b = acoustotreams.ScalarCylindricalWaveBasis.default([0.3], 1)
+        assert a == b and a.kpar == b.kpar
+
     def test_default(self):
         a = acoustotreams.ScalarCylindricalWaveBasis.default(
             [0.3, -0.2], 2, 2, [[0, 0, 0], [1, 0, 0]]
@@ -273,6 +341,12 @@ class TestSCWB:
         b = acoustotreams.ScalarCylindricalWaveBasis.default(0, 1)
         assert not b == []
 
+    def test_hash(self):
+        a = acoustotreams.ScalarCylindricalWaveBasis.default([0, 0.5], 1)
+        b = acoustotreams.ScalarCylindricalWaveBasis.default([0, 0.5], 1)
+        c = acoustotreams.ScalarCylindricalWaveBasis.default([0, 0.4], 1)
+        assert a == b and hash(a) == hash(b) and a != c and len({a, b, c}) == 2
+
     def test_diffr_orders(self):
         a = acoustotreams.ScalarCylindricalWaveBasis.diffr_orders(0.1, 1, 2 * np.pi, 1.5)
         b = acoustotreams.ScalarCylindricalWaveBasis(
@@ -424,6 +498,12 @@ class TestSPWBC:
         b = acoustotreams.ScalarPlaneWaveBasisByComp([[1, 0], [0, 1]])
         assert a == b[:1]
 
+    def test_hash(self):
+        a = acoustotreams.ScalarPlaneWaveBasisByComp.default([0, 1], "yz")
+        b = acoustotreams.ScalarPlaneWaveBasisByComp.default([0, 1], "zx")
+        c = acoustotreams.ScalarPlaneWaveBasisByComp.default([0, 1], "yz")
+        assert a != b and a.digest != b.digest and a == c and hash(a) == hash(c)
+
     def test_byunitvector(self):
         a = acoustotreams.ScalarPlaneWaveBasisByUnitVector.default([0, 0, 1])
         b = acoustotreams.ScalarPlaneWaveBasisByComp.default([0, 1], "yz")
@@ -438,6 +518,22 @@ class TestSPWBC:
         assert a <= b and b <= a and b.lattice == lattice and b.kpar == [0, 0, np.nan]
 
 
+class TestAcousticMaterial:
+    def test_eq(self):
+        a = acoustotreams.AcousticMaterial(1000, 1500)
+        assert (
+            a == acoustotreams.AcousticMaterial(1000, 1500, -0.0)
+            and a == (1000, 1500)
+            and a != acoustotreams.AcousticMaterial(1000, 1500, 10)
+            and a != None  # noqa: E711
+        )
+
+    def test_hash(self):
+        a = acoustotreams.AcousticMaterial(1000, 1500 + 1j)
+        b = acoustotreams.AcousticMaterial(1000.0, 1500 + 1j, 0)
+        assert a.digest == b.digest and hash(a) == hash(b) and {a: 1}[b] == 1
+
+
 class TestAcousticsArray:
     def test_init(self):
         b = acoustotreams.ScalarSphericalWaveBasis([[0, 0], [1, 0]])
@@ -529,4 +625,45 @@ class TestAcousticsArray:
         b = acoustotreams.ScalarSphericalWaveBasis([[1, 0]])
         p = acoustotreams.AcousticsArray([1], basis=b, k0=1)
         x = p.translate.eval_inv([0, 0, 0])
-        assert (np.abs(x - np.eye(1)) < 1e-14).all()
\ No newline at end of file
+        assert (np.abs(x - np.eye(1)) < 1e-14).all()
+
+class TestFastAnnotations:
+    b = acoustotreams.ScalarSphericalWaveBasis.default(1)
+    a = acoustotreams.AcousticsArray(
+        np.arange(16).reshape((4, 4)), basis=b, k0=1.0, modetype="regular"
+    )
+
+    def test_matmul(self):
+        v = acoustotreams.AcousticsArray(np.arange(4), basis=self.b)
+        for x, y in ((self.a, self.a), (self.a, v), (v, self.a), (self.a, np.eye(4))):
+            expect = x @ y
+            with acoustotreams.fast_annotations():
+                res = x @ y
+            assert (
+                type(res) is acoustotreams.AcousticsArray
+                and (res == expect).all()
+                and res.ann == expect.ann
+            )
+
+    def test_ufunc(self):
+        expect = 2 * self.a + np.ones(4)
+        with acoustotreams.fast_annotations():
+            res = 2 * self.a + np.ones(4)
+        assert (res == expect).all() and res.ann == expect.ann
+
+    def test_unchecked(self):
+        other = acoustotreams.AcousticsArray(np.eye(4), k0=2.0)
+        with pytest.warns(util.AnnotationWarning):
+            self.a @ other
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with acoustotreams.fast_annotations():
+                res = self.a @ other
+        assert res.k0 == (1.0, 2.0)
+
+    def test_nested(self):
+        with acoustotreams.fast_annotations():
+            with acoustotreams.fast_annotations():
+                pass
+            assert type(self.a @ self.a) is acoustotreams.AcousticsArray
+        assert _coreacoustics._fast.depth == 0
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+import acoustotreams
+
+
+class TestClusterFMM:
+    def test(self):
+        rng = np.random.default_rng(0)
+        basis = acoustotreams.ScalarSphericalWaveBasis.default(1, 80, rng.random((80, 3)))
+        fmm = acoustotreams.ClusterFMM(basis, 3, leafsize=0.5)
+        assert fmm.nlevels == 3
+        x = rng.random((len(basis), 2))
+        expect = np.asarray(
+            acoustotreams.expand((basis, basis), ("regular", "singular"), k0=3)
+        ) @ x
+        res = fmm @ x
+        assert res.shape == x.shape
+        assert np.linalg.norm(res - expect) < 1e-5 * np.linalg.norm(expect)
+
+    def test_order(self):
+        rng = np.random.default_rng(1)
+        positions = rng.random((30, 3))
+        basis = acoustotreams.ScalarSphericalWaveBasis.default(2, 30, positions)
+        material = acoustotreams.AcousticMaterial(1000, 1500)
+        x = rng.random(len(basis))
+        expect = np.asarray(
+            acoustotreams.expand(
+                (basis, basis), ("regular", "singular"), k0=10, material=material
+            )
+        ) @ x
+        err = [
+            np.linalg.norm(
+                acoustotreams.ClusterFMM(basis, 10, material, order=order) @ x - expect
+            )
+            for order in (4, 12)
+        ]
+        assert err[1] < 0.1 * err[0]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            acoustotreams.ClusterFMM(
+                acoustotreams.ScalarCylindricalWaveBasis.default([0], 1), 1
+            )
+
+
+class TestSolveFMM:
+    def test(self):
+        rng = np.random.default_rng(2)
+        positions = rng.random((40, 3)) * 10
+        sphere = acoustotreams.AcousticTMatrix.sphere(
+            1, 1, [0.2], [(1000, 1500, 0), (1.3, 343, 0)]
+        )
+        tm = acoustotreams.AcousticTMatrix.cluster(
+            [sphere] * len(positions), positions, blocks=True
+        )
+        inc = acoustotreams.plane_wave_scalar([0, 0, 1], k0=1, material=tm.material)
+        expect = tm.dense().interaction.solve().sca(inc)
+        res, info = tm.interaction.solve_iterative(inc, tol=1e-10, fmm=True)
+        assert info["converged"]
+        assert np.all(np.abs(res - expect) < 1e-5 * np.max(np.abs(expect)))
@@ -0,0 +1,63 @@
+import numpy as np
+
+import acoustotreams
+from acoustotreams import OperatorCache
+
+
+class TestOperatorCache:
+    basis = acoustotreams.ScalarSphericalWaveBasis.default(
+        2, 2, [[0, 0, 0], [1, 0, 0]]
+    )
+
+    def test_disabled(self):
+        cache = OperatorCache()
+        func = cache(acoustotreams.expand.__wrapped__)
+        func(self.basis, k0=3)
+        assert cache.info() == {"hits": 0, "misses": 0, "entries": 0, "nbytes": 0}
+
+    def test_hit(self):
+        cache = OperatorCache(2 ** 20)
+        func = cache(acoustotreams.expand.__wrapped__)
+        a = func(self.basis, "singular", k0=3)
+        b = func(self.basis, "singular", k0=3)
+        assert cache.hits == 1 and cache.misses == 1 and len(cache) == 1
+        assert np.all(a == b) and a.ann == b.ann
+        assert not np.shares_memory(np.asarray(a), np.asarray(b))
+        other = acoustotreams.ScalarSphericalWaveBasis.default(
+            2, 2, [[0, 0, 0], [1, 0, 0]]
+        )
+        func(other, "singular", k0=3)
+        assert cache.hits == 2
+        func(self.basis, "singular", k0=4)
+        func(self.basis, "singular", k0=3, material=(1000, 1500, 0))
+        assert cache.misses == 3
+
+    def test_evict(self):
+        cache = OperatorCache(2 * 18 * 18 * 16)
+        func = cache(acoustotreams.translate.__wrapped__)
+        for r in ([0, 0, 1], [0, 1, 0], [0, 0, 1], [1, 0, 0], [0, 1, 0]):
+            func(r, basis=self.basis, k0=3)
+        assert cache.info() == {
+            "hits": 1,
+            "misses": 4,
+            "entries": 2,
+            "nbytes": 2 * 18 * 18 * 16,
+        }
+        cache.clear()
+        assert len(cache) == cache.nbytes == cache.hits == cache.misses == 0
+
+    def test_operator(self):
+        cache = acoustotreams.operator_cache
+        cache.maxbytes = 2 ** 20
+        try:
+            tm = acoustotreams.AcousticTMatrix.cluster(
+                2 * [acoustotreams.AcousticTMatrix.sphere(2, 3, [0.3], [1000, ()])],
+                self.basis.positions,
+            )
+            a = tm.interaction()
+            hits = cache.hits
+            b = tm.interaction()
+            assert cache.hits == hits + 1 and np.all(a == b)
+        finally:
+            cache.maxbytes = 0
+            cache.clear()
@@ -152,6 +152,16 @@ class TestTranslate:
         )
         assert np.all(np.abs(x - y) < 1e-14) and x.ann == y.ann
 
+    def test_cw_where_stacked(self):
+        b = acoustotreams.ScalarCylindricalWaveBasis.default([-0.5, 0.2], 1)
+        r = [[0, 0, 0], [0, 1, 1]]
+        kwargs = {"k0": 3, "basis": b, "material": (1000, 1029, 0)}
+        where = np.random.default_rng(0).random((2, len(b), len(b))) < 0.5
+        x = acoustotreams.translate(r, where=where, **kwargs)
+        y = np.asarray(acoustotreams.translate(r, **kwargs))
+        assert x.shape == (2, len(b), len(b))
+        assert np.all(np.asarray(x)[where] == y[where]) and np.all(x[~where] == 0)
+
     def test_spw(self):
         a = acoustotreams.ScalarPlaneWaveBasisByUnitVector([[1, 0, 0]])
         b = acoustotreams.ScalarPlaneWaveBasisByUnitVector([[1, 0, 0], [0.6, 0.8, 0]])
@@ -203,6 +213,16 @@ class TestExpand:
         )
         assert np.all(np.abs(x - y) < 1e-14) and x.ann == y.ann
 
+    def test_ssw_ssw_rtr(self):
+        a = acoustotreams.ScalarSphericalWaveBasis.default(6, 2, [[0, 0, 0], [1, 2, 3]])
+        x = acoustotreams.expand(
+            (a, a), ("regular", "singular"), k0=3, material=(1000, 1029, 0), method="rtr"
+        )
+        y = acoustotreams.expand(
+            (a, a), ("regular", "singular"), k0=3, material=(1000, 1029, 0), method="array"
+        )
+        assert np.all(np.abs(x - y) < 1e-12 * np.max(np.abs(y))) and x.ann == y.ann
+
     def test_scw_scw_sing(self):
         a = acoustotreams.ScalarCylindricalWaveBasis([[0.2, 0]], [0, 1, 1])
         b = acoustotreams.ScalarCylindricalWaveBasis([[0.2, -1], [0.2, 1]])
@@ -226,6 +246,20 @@ class TestExpand:
         )
         assert np.all(np.abs(x - y) < 1e-14) and x.ann == y.ann
 
+    def test_scw_scw_kz(self):
+        b = acoustotreams.ScalarCylindricalWaveBasis.default(
+            [-0.5, 0.2], 2, 2, [[0, 0, 0], [1, 0.5, 0.3]]
+        )
+        x = acoustotreams.expand(b, ("regular", "singular"), k0=3, material=(1000, 1029, 0))
+        for kz in (-0.5, 0.2):
+            idx = np.flatnonzero(b.kz == kz)
+            y = acoustotreams.expand(
+                b[idx], ("regular", "singular"), k0=3, material=(1000, 1029, 0)
+            )
+            assert np.all(np.asarray(x)[idx[:, None], idx] == y)
+            other = np.flatnonzero(b.kz != kz)
+            assert np.all(np.asarray(x)[idx[:, None], other] == 0)
+
     def test_ssw_scw(self):
         a = acoustotreams.ScalarSphericalWaveBasis([[1, 1]])
         b = acoustotreams.ScalarCylindricalWaveBasis([[0.3, 1], [0.1, 1]])
@@ -479,6 +513,50 @@ class TestPermute:
         assert acoustotreams.permute(basis=b, k0=5, material=1).basis[0] == a
 
 
+class TestVField:
+    k0 = 2
+    material = acoustotreams.AcousticMaterial(1000, 686)
+    r = np.array([[0, 0, 0], [0.3, -0.2, 0.4], [-0.1, 0.5, 0.2]])
+
+    def gradient(self, b):
+        h = 1e-5
+        res = []
+        for x in self.r:
+            diff = [
+                acoustotreams.pfield(x + h * e, basis=b, k0=self.k0, material=self.material)
+                - acoustotreams.pfield(
+                    x - h * e, basis=b, k0=self.k0, material=self.material
+                )
+                for e in np.eye(3)
+            ]
+            res.append(np.array(diff)[:, 0, :] / (2 * h))
+        omega = self.k0 * acoustotreams.AcousticMaterial().c
+        return np.array(res) / (1j * omega * self.material.rho)
+
+    def test_ssw_r(self):
+        modes = [[0, 1, -1], [0, 2, 1], [1, 1, 0], [1, 1, 1]]
+        b = acoustotreams.ScalarSphericalWaveBasis(modes, [[0, 0, 0], [0.5, 0, 0]])
+        x = acoustotreams.vfield(self.r, basis=b, k0=self.k0, material=self.material)
+        y = self.gradient(b)
+        assert x.shape == (3, 3, 4) and np.all(np.abs(x - y) < 1e-8 * np.max(np.abs(y)))
+
+    def test_scw_r(self):
+        modes = [[0, 0.3, -1], [0, 0.1, 2], [0, 0.2, 0], [1, 0.3, 1]]
+        b = acoustotreams.ScalarCylindricalWaveBasis(modes, [[0, 0, 0], [0.5, 0, 0]])
+        x = acoustotreams.vfield(self.r, basis=b, k0=self.k0, material=self.material)
+        y = self.gradient(b)
+        assert x.shape == (3, 3, 4) and np.all(np.abs(x - y) < 1e-8 * np.max(np.abs(y)))
+
+    def test_grid(self, monkeypatch):
+        b = acoustotreams.ScalarSphericalWaveBasis.default(2)
+        r = np.random.default_rng(0).random((4, 5, 3))
+        x = acoustotreams.vfield(r, basis=b, k0=self.k0, modetype="singular")
+        monkeypatch.setattr(acoustotreams._operatorsacoustics, "_CHUNKSIZE", 20)
+        y = acoustotreams.vfield(r, basis=b, k0=self.k0, modetype="singular")
+        z = acoustotreams.vfield(r[2, 3], basis=b, k0=self.k0, modetype="singular")
+        assert x.shape == (4, 5, 3, 9) and np.all(x == y) and np.all(x[2, 3] == z)
+
+
 class TestPField:
     def test_ssw_r(self):
         modes = [[0, 3, -2], [1, 1, 1]]
@@ -598,4 +676,148 @@ class TestPField:
             r[..., None, 2],
         )
         y = np.array([y]).T
-        assert np.all(np.abs(y.swapaxes(-1, -2) - x) < 1e-14)
\ No newline at end of file
+        assert np.all(np.abs(y.swapaxes(-1, -2) - x) < 1e-14)
+
+class TestPAmplitudeFF:
+    k0 = 4
+    material = (1000, 686, 0)
+    positions = np.array([[0, 0, 0], [1, 0.5, 0]])
+
+    def test_ssw(self):
+        b = acoustotreams.ScalarSphericalWaveBasis(
+            [[0, 3, -2], [1, 1, 1], [1, 0, 0]], self.positions
+        )
+        r = np.array([1, -2, 2])
+        x = acoustotreams.pamplitudeff(r, basis=b, k0=self.k0, material=self.material)
+        rsph = acoustotreams.special.car2sph(r)
+        y = acoustotreams.special.ssw_psi(
+            np.array([3, 1, 0]),
+            np.array([-2, 1, 0]),
+            *self.positions[[0, 1, 1]].T,
+            rsph[1],
+            rsph[2],
+            self.k0 * 0.5,
+        )
+        assert x.shape == (1, 3) and np.all(np.abs(x[0] - y) < 1e-14)
+
+    def test_ssw_directions(self):
+        b = acoustotreams.ScalarSphericalWaveBasis.default(3, 2, self.positions)
+        r = np.random.default_rng(0).normal(size=(4, 5, 3))
+        r[0, 0] = [0, 0, -2]
+        x = acoustotreams.pamplitudeff(r, basis=b, k0=self.k0, material=self.material)
+        y = acoustotreams.pamplitudeff(
+            r[3, 2], basis=b, k0=self.k0, material=self.material
+        )
+        z = acoustotreams.pamplitudeff(
+            r[0, 0], basis=b, k0=self.k0, material=self.material
+        )
+        assert np.all(np.abs(x[:, 2, 0, 3] - y[0]) < 1e-14)
+        assert np.all(np.abs(x[:, 0, 0, 0] - z[0]) < 1e-14)
+
+
+class TestFieldMap:
+    basis = acoustotreams.ScalarSphericalWaveBasis.default(2, 2, [[0, 0, 0], [1, 0, 0]])
+    coeffs = acoustotreams.AcousticsArray(
+        np.linspace(1, 2, 18) + 0.5j,
+        basis=basis,
+        k0=3.0,
+        material=acoustotreams.AcousticMaterial(),
+        modetype="singular",
+    )
+    grid = np.random.default_rng(0).random((4, 5, 3)) * 3 - 1
+
+    def test_pfield(self):
+        x = acoustotreams.field_map(self.coeffs, self.grid)
+        y = acoustotreams.pfield(self.grid[1, 2], basis=self.basis, k0=3.0, modetype="singular")
+        assert x.shape == (4, 5) and isclose(x[1, 2], (y @ self.coeffs)[0])
+
+    def test_vfield(self):
+        x = acoustotreams.field_map(self.coeffs, self.grid, "v", chunk_bytes=1000)
+        y = self.coeffs.vfield(self.grid[3, 0])
+        assert x.shape == (4, 5, 3) and np.all(np.abs(x[3, 0] - y) < 1e-14)
+
+    def test_valid(self):
+        valid = np.sum(self.grid * self.grid, axis=-1) > 1
+        x = acoustotreams.field_map(self.coeffs, self.grid, valid=valid)
+        y = acoustotreams.field_map(self.coeffs, self.grid)
+        assert np.all(np.isnan(x) == ~valid) and np.all(x[valid] == y[valid])
+
+    def test_tiles(self):
+        tiles = list(
+            acoustotreams.field_tiles(self.coeffs, self.grid, chunk_bytes=16 * 18 * 6)
+        )
+        x = acoustotreams.field_map(self.coeffs, self.grid)
+        assert len(tiles) == 4 and all(np.all(x[i] == f) for i, f in tiles)
+
+    def test_out_stacked(self):
+        coeffs = acoustotreams.AcousticsArray(
+            np.asarray(self.coeffs)[:, None] * [1, 2],
+            basis=self.basis,
+            k0=3.0,
+            modetype="singular",
+        )
+        out = np.zeros((4, 5, 2), complex)
+        x = acoustotreams.field_map(coeffs, self.grid, out=out, chunk_bytes=1000)
+        y = acoustotreams.field_map(self.coeffs, self.grid)
+        assert x is out and np.all(np.abs(x[..., 1] - 2 * y) < 1e-14)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            acoustotreams.field_map(self.coeffs, self.grid, "e")
+        with pytest.raises(ValueError):
+            acoustotreams.field_map(self.coeffs, self.grid, out=np.zeros(20, complex))
+
+
+class TestFieldProbe:
+    basis = acoustotreams.ScalarSphericalWaveBasis.default(2, 2, [[0, 0, 0], [1, 0, 0]])
+    coeffs = acoustotreams.AcousticsArray(
+        np.linspace(1, 2, 18) + 0.5j,
+        basis=basis,
+        k0=3.0,
+        material=acoustotreams.AcousticMaterial(),
+        modetype="singular",
+    )
+    grid = np.random.default_rng(0).random((4, 5, 3)) * 3 - 1
+    kwargs = {"basis": basis, "k0": 3.0, "modetype": "singular"}
+
+    def test_pfield(self):
+        probe = acoustotreams.PField(self.grid).probe(chunk_bytes=1000, **self.kwargs)
+        x = probe @ self.coeffs
+        y = acoustotreams.field_map(self.coeffs, self.grid)
+        assert x.shape == (4, 5) and np.all(np.abs(x - y) < 1e-14)
+        info = probe.info()
+        assert info["points"] == 20 and info["modes"] == 18 and info["rank"] is None
+        assert info["nbytes"] == 20 * 18 * 16 and info["build_time"] > 0
+
+    def test_vfield_stacked(self):
+        probe = acoustotreams.VField(self.grid).probe(**self.kwargs)
+        x = probe @ (np.asarray(self.coeffs)[:, None] * [1, 2])
+        y = acoustotreams.field_map(self.coeffs, self.grid, "v")
+        assert x.shape == (4, 5, 3, 2) and np.all(np.abs(x[..., 1] - 2 * y) < 1e-14)
+
+    def test_svd(self):
+        probe = acoustotreams.FieldProbe(self.grid, rtol=1e-14, **self.kwargs)
+        x = acoustotreams.field_map(self.coeffs, self.grid)
+        assert np.all(np.abs(probe @ self.coeffs - x) < 1e-12)
+        probe = acoustotreams.FieldProbe(self.grid, rank=5, **self.kwargs)
+        assert probe.rank == 5 and 0 < probe.error < 1
+        assert probe.nbytes == (20 + 18) * 5 * 16
+
+    def test_single(self):
+        probe = acoustotreams.FieldProbe(self.grid, dtype=np.complex64, **self.kwargs)
+        x = probe @ self.coeffs
+        y = acoustotreams.field_map(self.coeffs, self.grid)
+        assert x.dtype == np.complex64 and probe.nbytes == 20 * 18 * 8
+        assert np.all(np.abs(x - y) < 1e-5 * np.max(np.abs(y)))
+
+    def test_invalid(self):
+        probe = acoustotreams.FieldProbe(self.grid, **self.kwargs)
+        other = acoustotreams.AcousticsArray(
+            np.ones(18), basis=self.basis, k0=3.0, modetype="regular"
+        )
+        with pytest.raises(ValueError):
+            probe @ other
+        with pytest.raises(ValueError):
+            probe @ np.ones(3)
+        with pytest.raises(ValueError):
+            acoustotreams.FieldProbe(self.grid, "e", **self.kwargs)
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import scipy.special as sc
 
 from acoustotreams import scw
@@ -55,6 +56,37 @@ class TestTranslate:
     def test_r_opposite(self):
         assert scw.translate(3, 2, 0, 2, 4 + 1j, 5, 6, singular=False) == 0j
 
+    def test_methods(self):
+        kz = np.array([0.5, 0.5, 1, 1, 1])
+        m = np.array([-1, 1, -2, 0, 2])
+        krr = np.array([0, 1.5 + 0.1j, 2, 2])[:, None, None]
+        phi = np.array([0.3, 1, -2, 0.1])[:, None, None]
+        z = np.array([0, 0.4, -0.3, 0.7])[:, None, None]
+        for singular in (True, False):
+            a = scw.translate(kz[:, None], m[:, None], kz, m, krr, phi, z, singular)
+            b = scw.translate(
+                kz[:, None],
+                m[:, None],
+                kz,
+                m,
+                krr,
+                phi,
+                z,
+                singular,
+                method="vectorize",
+            )
+            assert a.shape == (4, 5, 5)
+            assert np.all(np.abs(a - b) <= 1e-14)
+
+    def test_where(self):
+        where = np.array([True, False])
+        res = scw.translate(3, [2, 1], 3, -2, 4, 5, 6, where=where)
+        assert isclose(res[0], scw.translate(3, 2, 3, -2, 4, 5, 6)) and res[1] == 0
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            scw.translate(3, 2, 3, -2, 4, 5, 6, method="fmm")
+
 
 class TestTranslatePeriodic:
     def test(self):
@@ -1,5 +1,7 @@
 import numpy as np
+import pytest
 
+import acoustotreams.special as ats
 from acoustotreams import ssw
 
 def isclose(a, b, rel_tol=1e-09, abs_tol=0.0):
@@ -43,6 +45,51 @@ class TestRotate:
     def test_zero(self):
         assert ssw.rotate(8, 7, 6, 5, 4, 3, 2) == 0j
 
+    def test_methods(self):
+        l = np.repeat(np.arange(5), 2 * np.arange(5) + 1)  # noqa: E741
+        m = np.concatenate([np.arange(-i, i + 1) for i in range(5)])
+        phi = np.array([0.3, 1.2, 0.3])[:, None, None]
+        theta = np.array([1.1, 0, 1.1])[:, None, None]
+        a = ssw.rotate(l[:, None], m[:, None], l, m, phi, theta, 0.2)
+        b = ssw.rotate(
+            l[:, None], m[:, None], l, m, phi, theta, 0.2, method="vectorize"
+        )
+        assert a.shape == (3, 25, 25)
+        assert np.all(np.abs(a - b) <= 1e-12)
+
+    def test_where(self):
+        where = np.array([True, False])
+        res = ssw.rotate([1, 2], [0, 1], [1, 2], 1, 3, 0.5, 0.3, where=where)
+        assert isclose(res[0], ssw.rotate(1, 0, 1, 1, 3, 0.5, 0.3)) and res[1] == 0
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            ssw.rotate(1, 0, 1, 0, 3, 0.5, 0.3, method="recurrence")
+
+
+class TestRotationMatrix:
+    def test(self):
+        l = np.repeat(np.arange(7), 2 * np.arange(7) + 1)  # noqa: E741
+        m = np.concatenate([np.arange(-i, i + 1) for i in range(7)])
+        phi, theta, psi = [0.3, -1], [1.1, 2.5], 0.4
+        res = ssw.rotation_matrix(6, phi, theta, psi)
+        assert res.shape == (2, 49, 49)
+        for i in range(2):
+            expect = ssw.rotate(
+                l[:, None], m[:, None], l, m, phi[i], theta[i], psi, method="vectorize"
+            )
+            assert np.all(np.abs(res[i] - expect) <= 1e-12)
+
+    def test_blocks(self):
+        res = ssw.rotation_matrix(3, 0.3, 1.1, 0.4, blocks=True)
+        dense = ssw.rotation_matrix(3, 0.3, 1.1, 0.4)
+        assert [block.shape for block in res] == [(1, 1), (3, 3), (5, 5), (7, 7)]
+        assert np.all(res[2] == dense[4:9, 4:9])
+
+    def test_unitary(self):
+        res = ssw.rotation_matrix(40, 0.3, 1.1, 0.4)
+        assert np.all(np.abs(res @ res.conjugate().T - np.eye(41 * 41)) < 1e-12)
+
 
 class TestTranslate:
     def test_s_real(self):
@@ -60,6 +107,62 @@ class TestTranslate:
     def test_s_kr_zero(self):
         assert isclose(ssw.translate(5, 4, 3, 2, 1e-30j, 7, 6), 0j)
 
+    def test_methods(self):
+        l = np.array([0, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3])  # noqa: E741
+        m = np.array([0, -1, 0, 1, -2, -1, 0, 1, 2, -3, 3])
+        kr = np.array([[2 + 0.5j], [3], [2 + 0.5j]])[..., None]
+        theta = np.array([[0.4], [0.4], [2]])[..., None]
+        for singular in (True, False):
+            a = ssw.translate(
+                l[:, None], m[:, None], l, m, kr, theta, 1.2, singular=singular
+            )
+            b = ssw.translate(
+                l[:, None],
+                m[:, None],
+                l,
+                m,
+                kr,
+                theta,
+                1.2,
+                singular=singular,
+                method="vectorize",
+            )
+            assert a.shape == (3, 11, 11)
+            assert np.all(np.abs(a - b) <= 1e-12 * np.max(np.abs(b)))
+
+    def test_where(self):
+        where = np.array([True, False])
+        assert np.all(
+            ssw.translate([1, 2], [0, 1], 1, 1, 3, 0.5, 0.3, where=where)
+            == [ssw.translate(1, 0, 1, 1, 3, 0.5, 0.3), 0]
+        )
+
+    def test_rtr(self):
+        l = np.repeat(np.arange(8), 2 * np.arange(8) + 1)  # noqa: E741
+        m = np.concatenate([np.arange(-i, i + 1) for i in range(8)])
+        kr = np.array([2 + 0.5j, 3, 3, 1e-20])[:, None, None]
+        theta = np.array([0.4, 0, np.pi, 2])[:, None, None]
+        phi = np.array([1.2, 0.3, 0, -2])[:, None, None]
+        for singular in (True, False):
+            a = ssw.translate(
+                l[:, None], m[:, None], l, m, kr, theta, phi, singular, method="rtr"
+            )
+            b = ssw.translate(
+                l[:, None], m[:, None], l, m, kr, theta, phi, singular, method="array"
+            )
+            assert np.all(np.abs(a - b) <= 1e-12 * np.max(np.abs(b)))
+
+    def test_rtr_where(self):
+        where = np.array([True, False])
+        res = ssw.translate(
+            [1, 2], [0, 1], 1, 1, 3, 0.5, 0.3, where=where, method="rtr"
+        )
+        assert isclose(res[0], ssw.translate(1, 0, 1, 1, 3, 0.5, 0.3)) and res[1] == 0
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            ssw.translate(1, 0, 1, 0, 3, 0.5, 0.3, method="fmm")
+
 
 class TestTranslatePeriodic:
     def test_0(self):
@@ -102,3 +205,124 @@ class TestTranslatePeriodic:
             )[0, 0]
             == 0. + 0j
         )
+
+    def test_positions(self):
+        out = ([0, 0, 1, 1, 1], [0, 2, 1, 1, 2], [0, -1, 0, 1, 2])
+        in_ = ([1, 0, 1, 0], [1, 2, 0, 3], [-1, 1, 0, -2])
+        rs = [[0, 0, 0], [0.2, 0.1, 0.3]]
+        res = ssw.translate_periodic(1.5, [0.1, 0.2], [[2, 0], [0, 2]], rs, out, in_)
+        assert res.shape == (5, 4)
+        for i in range(5):
+            for j in range(4):
+                expect = ssw.translate_periodic(
+                    1.5,
+                    [0.1, 0.2],
+                    [[2, 0], [0, 2]],
+                    rs[out[0][i]],
+                    ([out[1][i]], [out[2][i]]),
+                    ([in_[1][j]], [in_[2][j]]),
+                    rs[in_[0][j]],
+                )[0, 0]
+                assert isclose(res[i, j], expect, abs_tol=1e-12)
+
+
+class TestCoefficientStore:
+    def test_grow(self):
+        store = ats.CoefficientStore()
+        small = store.get("tl_ssw", 2)
+        assert small.shape == (9, 9, 3)
+        large = store.get("tl_ssw", 4)
+        assert store.lmax("tl_ssw") == 4
+        assert np.all(store.get("tl_ssw", 2) == small)
+        assert np.all(large[:9, :9, :3] == small)
+
+    def test_values(self):
+        table = ats.CoefficientStore().get("lattice_ssw", 3)
+        lambda_, mu, l, m, p = 3, -1, 2, 1, 3  # noqa: E741
+        expect = (
+            -np.sqrt(4 * np.pi * 35 * 7)
+            * np.power(1j, lambda_ - l + p)
+            * ats.wigner3j(l, lambda_, p, m, -mu, mu - m)
+            * ats.wigner3j(l, lambda_, p, 0, 0, 0)
+        )
+        assert isclose(table[lambda_ * (lambda_ + 1) + mu, l * (l + 1) + m, 1], expect)
+
+    def test_scalar_independent(self):
+        ats.coefficients.clear()
+        res = ats.tl_ssw(8, 1, 7, -2, 3, 0.4, 0.2)
+        assert ats.coefficients.lmax("tl_ssw") is None
+        expect = ssw.translate(8, 1, 7, -2, 3, 0.4, 0.2, singular=True)
+        assert isclose(res, expect)
+
+    def test_evict(self):
+        store = ats.CoefficientStore(maxbytes=1)
+        assert store.get("tl_ssw", 1).shape == (4, 4, 2)
+        assert store.lmax("tl_ssw") is None
+        assert store.nbytes == 0
+
+    def test_persist(self, tmp_path):
+        path = str(tmp_path / "coefficients.npz")
+        store = ats.CoefficientStore(path=path)
+        table = store.get("lattice_ssw", 2)
+        other = ats.CoefficientStore()
+        other.load(path)
+        assert other.lmax("lattice_ssw") == 2
+        assert np.all(other.get("lattice_ssw", 2) == table)
+        with np.load(path) as data:
+            assert data["lattice_ssw"].size == np.count_nonzero(table)
+
+    def test_persist_suffix(self, tmp_path):
+        path = str(tmp_path / "coefficients")
+        table = ats.CoefficientStore(path=path).get("tl_ssw", 3)
+        assert (tmp_path / "coefficients.npz").is_file()
+        store = ats.CoefficientStore(path=path)
+        assert np.all(store.get("tl_ssw", 2) == table[:9, :9, :3])
+        assert store.lmax("tl_ssw") == 3
+
+
+class TestSphHarmTable:
+    lmax = 5
+    l = np.repeat(np.arange(6), 2 * np.arange(6) + 1)  # noqa: E741
+    m = np.concatenate([np.arange(-i, i + 1) for i in range(6)])
+    theta = np.array([[0.3, 1.2, 2.5], [0, np.pi, 1.6]])
+    phi = np.array([[0.1, -2, 3], [0.4, 1, -0.5]])
+
+    def test(self):
+        res = ats.sph_harm_table(self.lmax, self.theta, self.phi)
+        expect = ats.sph_harm(
+            self.m, self.l, self.phi[..., None], self.theta[..., None]
+        )
+        assert res.shape == (2, 3, 36) and np.all(np.abs(res - expect) < 1e-14)
+
+    def test_derivatives(self):
+        h = 1e-6
+        res, dtheta, dphi = ats.sph_harm_table(
+            self.lmax, self.theta[0], self.phi[0], derivatives=True
+        )
+        expect = (
+            ats.sph_harm_table(self.lmax, self.theta[0] + h, self.phi[0])
+            - ats.sph_harm_table(self.lmax, self.theta[0] - h, self.phi[0])
+        ) / (2 * h)
+        assert np.all(np.abs(dtheta - expect) < 1e-8)
+        expect = 1j * self.m * res / np.sin(self.theta[0, :, None])
+        assert np.all(np.abs(dphi - expect) < 1e-13)
+
+    def test_axis(self):
+        _, dtheta, dphi = ats.sph_harm_table(
+            self.lmax, [0, np.pi], [0.4, 1], derivatives=True
+        )
+        res, *expect = ats.sph_harm_table(
+            self.lmax, [1e-8, np.pi - 1e-8], [0.4, 1], derivatives=True
+        )
+        assert np.all(np.abs(dtheta - expect[0]) < 1e-6)
+        assert np.all(np.abs(dphi - expect[1]) < 1e-6)
+
+    def test_bessel(self):
+        x = np.array([[0, 0.5], [3, 10 + 1j]])
+        l = np.arange(8)  # noqa: E741
+        res = ats.spherical_bessel_table(7, x)
+        assert res.shape == (2, 2, 8)
+        assert np.all(res == ats.spherical_jn(l, x[..., None]))
+        res = ats.spherical_bessel_table(7, x[0, 1], singular=True)
+        expect = ats.spherical_jn(l, 0.5) + 1j * ats.spherical_yn(l, 0.5)
+        assert np.all(np.abs(res - expect) < 1e-14 * np.abs(expect))